@@ -678,10 +678,17 @@ class ScrcpyClient:
                     # This is normal behavior when no input events are occurring
                     continue
 
-                logger.debug(f"← Got control message from queue: {msg.type.name}")
-                # Serialize and send message
-                data = msg.serialize()
-                logger.debug(f"Control message serialized: {len(data)} bytes")
+                # Take everything else already queued so a burst of input
+                # events goes out in one sendall()
+                batch = [msg]
+                batch.extend(self._control_queue.drain())
+                logger.debug(
+                    f"← Got {len(batch)} control message(s) from queue: {msg.type.name}..."
+                )
+
+                # Serialize and send
+                data = ControlMessage.serialize_many(batch)
+                logger.debug(f"Control messages serialized: {len(data)} bytes")
 
                 # Use control socket if available, otherwise fallback to video socket
                 target_socket = (
@@ -2966,7 +2973,7 @@ class ScrcpyClient:
         Note: Requires server support for SCREENSHOT message (TYPE_SCREENSHOT = 18).
         """
         msg = ControlMessage(ControlMessageType.SCREENSHOT)
-        msg._data["quality"] = max(1, min(100, quality))
+        msg.set_screenshot(max(1, min(100, quality)))
         self._control_queue.put(msg)
         logger.debug(f"Requested screenshot via control message (quality={quality})")
 
@@ -21,6 +21,7 @@ from scrcpy_py_ddlx.core.decoder import VideoDecoder, AudioDecoder
 from scrcpy_py_ddlx.core.demuxer import (
     VideoDemuxer as OldVideoDemuxer,
     StreamingVideoDemuxer,
+    VideoPacketQueue,
     create_streaming_video_demuxer,
     create_streaming_audio_demuxer,
     create_video_demuxer_for_mode,
@@ -76,8 +77,6 @@ class ComponentFactory:
 
     def create_video_demuxer(self):
         """Initialize video demuxer (Step 2)."""
-        from queue import Queue
-
         try:
             if self._connection_mode == 'udp':
                 # UDP mode: use specialized UdpVideoDemuxer
@@ -115,7 +114,7 @@ class ComponentFactory:
             else:
                 # Use buffer-based demuxer (OLD - for fallback)
                 logger.info("Using buffer-based VideoDemuxer (2MB buffer)")
-                queue = Queue(maxsize=1)  # Reduced from 3 to minimize queue latency
+                queue = VideoPacketQueue(maxsize=1)  # Reduced from 3 to minimize queue latency
                 demuxer = OldVideoDemuxer(
                     self._video_socket,
                     queue,
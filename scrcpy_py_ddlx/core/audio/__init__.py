@@ -23,7 +23,15 @@ from scrcpy_py_ddlx.core.audio.codecs import (
 )
 
 # Import audio player implementations
-# Priority: sounddevice (better quality) > QtPushAudioPlayer (no extra deps)
+# Priority: rtmixer (C callback) > sounddevice (better quality) > QtPushAudioPlayer (no extra deps)
+
+# rtmixer (optional, audio callback runs in C without the GIL)
+RTMIXER_AVAILABLE = False
+RtMixerPlayer = None
+try:
+    from scrcpy_py_ddlx.core.audio.rtmixer_player import RtMixerPlayer, RTMIXER_AVAILABLE
+except ImportError:
+    pass
 
 # SoundDevice (best performance, callback-based)
 SOUNDDEVICE_AVAILABLE = False
@@ -44,9 +52,12 @@ except ImportError:
     pass
 
 # Default player selection:
-# 1. SoundDevicePlayer (best quality, callback-based)
-# 2. QtPushAudioPlayer (pure Qt, no extra deps)
-if SOUNDDEVICE_AVAILABLE:
+# 1. RtMixerPlayer (if rtmixer is installed, no Python on the audio thread)
+# 2. SoundDevicePlayer (best quality, callback-based)
+# 3. QtPushAudioPlayer (pure Qt, no extra deps)
+if RTMIXER_AVAILABLE:
+    AudioPlayer = RtMixerPlayer
+elif SOUNDDEVICE_AVAILABLE:
     AudioPlayer = SoundDevicePlayer
 elif QT_PUSH_AVAILABLE:
     AudioPlayer = QtPushAudioPlayer
@@ -73,6 +84,7 @@ __all__ = [
     'TeeAudioRecorder',
 
     # Player implementations
+    'RtMixerPlayer',          # C callback (default if rtmixer installed)
     'SoundDevicePlayer',      # Best quality (default)
     'QtPushAudioPlayer',      # Pure Qt fallback
     'AudioPlayer',            # Default (SoundDevicePlayer)
@@ -87,6 +99,7 @@ __all__ = [
     'create_audio_decoder',
 
     # Availability flags
+    'RTMIXER_AVAILABLE',
     'SOUNDDEVICE_AVAILABLE',
     'QT_PUSH_AVAILABLE',
     'QT_AUDIO_AVAILABLE',  # For backward compatibility (alias to QT_PUSH_AVAILABLE)
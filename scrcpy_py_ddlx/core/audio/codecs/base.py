@@ -4,6 +4,8 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Optional
 
+import numpy as np
+
 try:
     import av
     AV_AVAILABLE = True
@@ -13,6 +15,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# PyAV packed sample format name -> NumPy dtype, for reading frame planes
+_SAMPLE_DTYPES = {
+    'u8': np.uint8,
+    's16': np.int16,
+    's32': np.int32,
+    'flt': np.float32,
+    'dbl': np.float64,
+}
+
 __all__ = [
     'AudioCodecBase',
     'OpusDecoder',
@@ -93,6 +104,8 @@ class PyAVDecoder(AudioCodecBase):
         self._actual_sample_rate: Optional[int] = None  # Actual rate from stream
         self._actual_channels: Optional[int] = None      # Actual channels from stream
         self._stream_analyzed: bool = False             # Whether we've analyzed the stream
+        # Interleaved float32 output of one decode() call, reused across calls
+        self._scratch: np.ndarray = np.empty(0, dtype=np.float32)
         self._initialize_decoder()
 
     def _initialize_decoder(self) -> None:
@@ -140,8 +153,8 @@ class PyAVDecoder(AudioCodecBase):
             # Create PyAV packet
             av_packet = av.Packet(data)
 
-            # Decode packet
-            output_frames = []
+            # Decode packet into the scratch buffer
+            pos = 0
             frame_count = 0
             for frame in self._codec_context.decode(av_packet):
                 frame_count += 1
@@ -156,30 +169,13 @@ class PyAVDecoder(AudioCodecBase):
                         f"format={frame.format.name if hasattr(frame, 'format') else 'N/A'}"
                     )
 
-                # Convert frame to float32 (native OPUS format)
-                if hasattr(frame, 'to_ndarray'):
-                    import numpy as np
-
-                    # Get native float32 data (no conversion)
-                    audio_data = frame.to_ndarray()  # Already float32 from OPUS
-
-                    # Interleave channels if planar
-                    if audio_data.ndim == 2:
-                        # Planar audio - interleave channels
-                        audio_data = audio_data.T.flatten()
-                    else:
-                        audio_data = audio_data.flatten()
-
-                    # Convert to bytes (float32, little-endian)
-                    samples = audio_data.tobytes()
-                    output_frames.append(samples)
-
-            # Combine all frames
-            if output_frames:
-                result = b''.join(output_frames)
-                if frame_count > 0:
-                    sample_count = len(result) // 4  # float32 = 4 bytes per sample
-                    logger.info(f"[AUDIO] Decoded {sample_count} samples ({len(result)} bytes)")
+                # Convert frame to interleaved float32 (native OPUS format)
+                pos = self._append_frame(frame, pos)
+
+            # One bytes object for all frames
+            if pos > 0:
+                result = self._scratch[:pos].tobytes()
+                logger.info(f"[AUDIO] Decoded {pos} samples ({len(result)} bytes)")
                 return result
 
             # No frames decoded (empty packet or config packet)
@@ -190,6 +186,72 @@ class PyAVDecoder(AudioCodecBase):
             logger.debug(f"Audio decode error (skipping packet): {e}")
             return b''
 
+    def _reserve(self, pos: int, size: int) -> np.ndarray:
+        """Return scratch[pos:pos + size], growing the buffer (keeping scratch[:pos])."""
+        if self._scratch.shape[0] < pos + size:
+            grown = np.empty(max(pos + size, 2 * self._scratch.shape[0]), dtype=np.float32)
+            grown[:pos] = self._scratch[:pos]
+            self._scratch = grown
+        return self._scratch[pos:pos + size]
+
+    @staticmethod
+    def _copy_samples(dst: np.ndarray, src: np.ndarray) -> None:
+        """Copy src into float32 dst in one pass; integer formats are scaled to [-1.0, 1.0)."""
+        if src.dtype.kind == 'i':
+            np.multiply(src, 1.0 / (1 << (src.dtype.itemsize * 8 - 1)), out=dst, casting='unsafe')
+        elif src.dtype.kind == 'u':
+            # u8: unsigned with a 128 offset
+            np.multiply(src, 1.0 / 128, out=dst, casting='unsafe')
+            dst -= 1.0
+        else:
+            np.copyto(dst, src, casting='unsafe')
+
+    def _append_frame(self, frame, pos: int) -> int:
+        """
+        Write a decoded frame into the scratch buffer at pos as interleaved float32.
+
+        PyAV frames are read straight from their plane buffers (no
+        to_ndarray() allocation); each plane is copied into its strided
+        channel column of the output.
+
+        Returns:
+            New write position (in samples)
+        """
+        dtype = None
+        if hasattr(frame, 'planes') and hasattr(frame, 'format'):
+            dtype = _SAMPLE_DTYPES.get(frame.format.packed.name)
+        if dtype is None:
+            if not hasattr(frame, 'to_ndarray'):
+                return pos
+            return self._append_interleaved(frame.to_ndarray(), pos)
+
+        channels = len(frame.layout.channels)
+        n = frame.samples
+        dst = self._reserve(pos, n * channels)
+        if frame.format.is_planar:
+            dst = dst.reshape(n, channels)
+            for c, plane in enumerate(frame.planes):
+                self._copy_samples(dst[:, c], np.frombuffer(plane, dtype=dtype, count=n))
+        else:
+            self._copy_samples(dst, np.frombuffer(frame.planes[0], dtype=dtype, count=n * channels))
+        return pos + n * channels
+
+    def _append_interleaved(self, audio_data: np.ndarray, pos: int) -> int:
+        """
+        Write a sample array into the scratch buffer at pos as interleaved float32.
+
+        Transpose (planar -> interleaved), dtype conversion and copy are done
+        in a single strided pass.
+
+        Returns:
+            New write position (in samples)
+        """
+        size = audio_data.size
+        # Planar (channels, samples) -> (samples, channels) view, no copy
+        src = audio_data.T if audio_data.ndim == 2 else audio_data
+        self._copy_samples(self._reserve(pos, size).reshape(src.shape), src)
+        return pos + size
+
     def reset(self) -> None:
         """Reset decoder state."""
         # PyAV CodecContext uses __dealloc__ for cleanup, no close() method
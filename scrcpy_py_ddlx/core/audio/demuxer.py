@@ -10,7 +10,11 @@ import socket
 from typing import Optional
 from queue import Queue
 
-from scrcpy_py_ddlx.core.demuxer.base import BaseDemuxer, DEFAULT_DEMUXER_BUFFER_SIZE
+from scrcpy_py_ddlx.core.demuxer.base import (
+    BaseDemuxer,
+    DEFAULT_DEMUXER_BUFFER_SIZE,
+    DEFAULT_SOCKET_RECV_BUFFER_SIZE,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +50,9 @@ class AudioDemuxer(BaseDemuxer):
         sock: socket.socket,
         packet_queue: Queue,
         audio_codec: int = OPUS,
-        buffer_size: int = DEFAULT_DEMUXER_BUFFER_SIZE
+        buffer_size: int = DEFAULT_DEMUXER_BUFFER_SIZE,
+        tcp_nodelay: bool = True,
+        recv_buffer_size: Optional[int] = DEFAULT_SOCKET_RECV_BUFFER_SIZE
     ):
         """
         Initialize the audio demuxer.
@@ -56,8 +62,10 @@ class AudioDemuxer(BaseDemuxer):
             packet_queue: Queue for parsed audio packets
             audio_codec: Audio codec type (RAW, OPUS, AAC, or FDK_AAC)
             buffer_size: Receive buffer size (default: 256KB)
+            tcp_nodelay: Set TCP_NODELAY on the socket (default: True)
+            recv_buffer_size: Kernel SO_RCVBUF size, None keeps the OS default
         """
-        super().__init__(sock, packet_queue, buffer_size)
+        super().__init__(sock, packet_queue, buffer_size, tcp_nodelay, recv_buffer_size)
         self._audio_codec = audio_codec
 
     def _parse_buffer(self, buffer: bytearray, size: int) -> int:
@@ -175,7 +183,9 @@ class StreamingAudioDemuxer(StreamingDemuxerBase):
         sock: socket.socket,
         packet_queue: Queue,
         audio_codec: int = 1,  # OPUS
-        stats_callback: Optional[Callable] = None
+        stats_callback: Optional[Callable] = None,
+        tcp_nodelay: bool = True,
+        recv_buffer_size: Optional[int] = DEFAULT_SOCKET_RECV_BUFFER_SIZE
     ):
         """
         Initialize audio demuxer.
@@ -185,8 +195,10 @@ class StreamingAudioDemuxer(StreamingDemuxerBase):
             packet_queue: Queue for audio packet dictionaries
             audio_codec: Audio codec type (RAW/OPUS/AAC/FDK-AAC)
             stats_callback: Optional statistics callback
+            tcp_nodelay: Set TCP_NODELAY on the socket (default: True)
+            recv_buffer_size: Kernel SO_RCVBUF size, None keeps the OS default
         """
-        super().__init__(sock, packet_queue, stats_callback)
+        super().__init__(sock, packet_queue, stats_callback, tcp_nodelay, recv_buffer_size)
         self._audio_codec = audio_codec
         self._codec_id_read = False  # Track if we've read the initial codec ID
 
@@ -212,7 +224,7 @@ class StreamingAudioDemuxer(StreamingDemuxerBase):
 
             # Step 2: Read exactly 12 bytes for scrcpy packet header
             logger.debug("[AUDIO] Waiting for packet header...")
-            header_data = self._recv_exact(self.SC_PACKET_HEADER_SIZE)
+            header_data = self._recv_header(self.SC_PACKET_HEADER_SIZE)
             logger.debug(f"[AUDIO] Received header: {len(header_data)} bytes")
 
             # Parse header fields (same format as video packet)
@@ -9,10 +9,13 @@ This avoids the pull mode (QIODevice subclass) which is broken in PySide6.
 
 import logging
 import threading
+from collections import deque
 from typing import Optional, Any
 
 import numpy as np
 
+from scrcpy_py_ddlx.core.audio.sample_convert import Int16Converter
+
 # Qt imports
 try:
     from PySide6.QtCore import QIODevice, QByteArray, QTimer, QCoreApplication
@@ -36,6 +39,7 @@ logger = logging.getLogger(__name__)
 
 # Audio configuration
 DEFAULT_OUTPUT_BUFFER_MS = 25
+FEED_CHUNK_BYTES = 9600  # Max bytes written to the sink per timer tick
 
 
 class QtPushAudioPlayer(FrameSink):
@@ -57,11 +61,20 @@ class QtPushAudioPlayer(FrameSink):
         self._config = None
         self._audio_sink = None
         self._io_device = None  # Internal QIODevice from QAudioSink.start()
-        self._sample_buffer = bytearray()
+        # Pending samples as a queue of int16 chunks (one per pushed frame).
+        # _chunk_off bytes of _chunks[0] were already written; fully
+        # consumed chunks are popped, so nothing is ever shifted.
+        self._chunks: deque = deque()
+        self._chunk_off = 0
+        self._buffered_bytes = 0
         self._buffer_lock = threading.Lock()
         self._timer = None
         self._running = False
         self._bytes_written = 0
+        self._converter = Int16Converter()
+        # Reused write buffer - avoids allocating a QByteArray every tick
+        self._write_buf = QByteArray()
+        self._write_buf.reserve(FEED_CHUNK_BYTES)
 
     def _feed_audio(self) -> None:
         """Feed audio data to QAudioSink (called by QTimer)."""
@@ -70,22 +83,42 @@ class QtPushAudioPlayer(FrameSink):
 
         try:
             with self._buffer_lock:
-                if not self._sample_buffer:
+                if self._buffered_bytes <= 0:
                     return
 
                 # Simple consistent chunk size for smooth playback
-                chunk_size = min(len(self._sample_buffer), 9600)
-                chunk = bytes(self._sample_buffer[:chunk_size])
-                del self._sample_buffer[:chunk_size]
+                chunk_size = min(self._buffered_bytes, FEED_CHUNK_BYTES)
+
+                # Collect views of the head chunks; only what is written is
+                # touched, however much is buffered
+                chunks = self._chunks
+                off = self._chunk_off
+                parts = []
+                needed = chunk_size
+                while needed > 0:
+                    head = chunks[0]
+                    take = min(len(head) - off, needed)
+                    parts.append(memoryview(head)[off:off + take])
+                    needed -= take
+                    off += take
+                    if off == len(head):
+                        chunks.popleft()
+                        off = 0
+                self._chunk_off = off
+                self._buffered_bytes -= chunk_size
+
+                # Overwrite the cached QByteArray in place (keeps its capacity)
+                self._write_buf.replace(0, self._write_buf.size(), b''.join(parts))
 
             # Write to internal QIODevice (outside lock)
-            written = self._io_device.write(QByteArray(chunk))
+            written = self._io_device.write(self._write_buf)
             self._bytes_written += written
 
             # Log occasionally
-            if self._bytes_written % 200000 < 9600:
+            if self._bytes_written % 200000 < FEED_CHUNK_BYTES:
                 with self._buffer_lock:
-                    logger.info(f"[QT_PUSH] Wrote {written} bytes (buffer: {len(self._sample_buffer)} bytes)")
+                    buffered = self._buffered_bytes
+                    logger.info(f"[QT_PUSH] Wrote {written} bytes (buffer: {buffered} bytes)")
 
         except Exception as e:
             logger.error(f"Error feeding audio: {e}")
@@ -106,6 +139,8 @@ class QtPushAudioPlayer(FrameSink):
                 channels = 2
 
             self._config = {"sample_rate": sample_rate, "channels": channels}
+            if self._converter.channels != channels:
+                self._converter = Int16Converter(channels)
 
             # If sink already exists with same config, skip recreation
             if self._audio_sink is not None:
@@ -179,28 +214,20 @@ class QtPushAudioPlayer(FrameSink):
             return False
 
         try:
-            # Convert to bytes
+            # Convert float32 (planar or interleaved) to interleaved int16,
+            # matching the SignedInt format configured on the sink
             if hasattr(frame, 'to_ndarray'):
-                audio = frame.to_ndarray().astype(np.float32)
-                if audio.ndim == 2:
-                    audio = audio.T.flatten()
-                else:
-                    audio = audio.flatten()
-                samples = audio.tobytes()
-            elif isinstance(frame, np.ndarray):
-                if frame.ndim == 2:
-                    frame = frame.T.flatten()
-                else:
-                    frame = frame.flatten()
-                samples = frame.astype(np.float32).tobytes()
-            elif isinstance(frame, bytes):
-                samples = frame
+                samples = self._converter.convert(frame.to_ndarray())
+            elif isinstance(frame, (np.ndarray, bytes)):
+                samples = self._converter.convert(frame)
             else:
                 return False
 
-            # Add to buffer
+            # Add to buffer (copy: the converter reuses its output array)
+            chunk = samples.tobytes()
             with self._buffer_lock:
-                self._sample_buffer.extend(samples)
+                self._chunks.append(chunk)
+                self._buffered_bytes += len(chunk)
 
             return True
         except Exception as e:
@@ -17,6 +17,7 @@ All conversions use PyAV (built-in FFmpeg), no external FFmpeg required.
 """
 
 import logging
+import mmap
 import struct
 import threading
 import time
@@ -24,9 +25,22 @@ from pathlib import Path
 from typing import Optional, Any
 
 import av
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# RIFF/WAVE header for IEEE float PCM (44 bytes, data chunk follows directly)
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+# Samples per frame fed to the encoder when converting the temp WAV
+CONVERT_BLOCK_SAMPLES = 1024
+
+# FFmpeg default channel layout for each channel count (WAVE channel order)
+_CHANNEL_LAYOUTS = {
+    1: 'mono', 2: 'stereo', 3: '2.1', 4: 'quad',
+    5: '5.0', 6: '5.1', 7: '6.1', 8: '7.1',
+}
+
 
 class AudioRecorder:
     """
@@ -93,6 +107,12 @@ class AudioRecorder:
         # File handle (direct file I/O for WAV)
         self._file_handle = None
 
+        # Memory-mapped output (only used when max_duration is set)
+        self._mmap = None
+        self._mv = None
+        self._mmap_pos = 0
+        self._mmap_capacity = 0
+
     def open(self, codec_context: Any = None, sample_rate: int = None, channels: int = None) -> bool:
         """
         Open the recorder and prepare for recording.
@@ -135,8 +155,13 @@ class AudioRecorder:
             Path(self._wav_filename).parent.mkdir(parents=True, exist_ok=True)
 
             # Direct file writing for WAV
-            self._file_handle = open(self._wav_filename, 'wb')
-            self._write_wav_header()
+            if self._max_duration:
+                # Bounded size: preallocate and write through an mmap
+                self._file_handle = open(self._wav_filename, 'w+b')
+                self._open_mmap()
+            else:
+                self._file_handle = open(self._wav_filename, 'wb')
+                self._write_wav_header()
 
             self._is_open = True
             self._is_recording = True
@@ -149,46 +174,85 @@ class AudioRecorder:
             logger.error(f"Failed to open audio recorder: {e}")
             return False
 
+    def _pack_wav_header(self, data_size: int = 0) -> tuple:
+        """Build WAV header fields for IEEE float format."""
+        # Byte rate = sample_rate * channels * bits_per_sample / 8
+        byte_rate = self._sample_rate * self._channels * self._sample_width
+        # Block align = channels * bits_per_sample / 8
+        block_align = self._channels * self._sample_width
+        return (
+            b'RIFF', data_size + 36, b'WAVE',   # 36 = header size after RIFF size
+            b'fmt ', 16, 3,                     # Chunk size, 3 = IEEE float
+            self._channels, self._sample_rate,
+            byte_rate, block_align,
+            self._sample_width * 8,             # float32 = 32 bits
+            b'data', data_size,
+        )
+
     def _write_wav_header(self):
         """Write WAV file header for IEEE float format."""
         if self._file_handle is None:
             return
 
-        # RIFF header
-        self._file_handle.write(b'RIFF')
-        self._file_handle.write(struct.pack('<I', 0))  # File size - 8 (placeholder)
-        self._file_handle.write(b'WAVE')
+        # Sizes are placeholders, patched in close()
+        self._file_handle.write(_WAV_HEADER.pack(*self._pack_wav_header(0)))
 
-        # fmt chunk (format chunk)
-        self._file_handle.write(b'fmt ')
-        self._file_handle.write(struct.pack('<I', 16))  # Chunk size
-        self._file_handle.write(struct.pack('<H', 3))   # Audio format: 3 = IEEE float
-        self._file_handle.write(struct.pack('<H', self._channels))
-        self._file_handle.write(struct.pack('<I', self._sample_rate))
+    def _open_mmap(self) -> None:
+        """
+        Preallocate the WAV file for max_duration and map it into memory.
 
-        # Byte rate = sample_rate * channels * bits_per_sample / 8
-        byte_rate = self._sample_rate * self._channels * self._sample_width
-        self._file_handle.write(struct.pack('<I', byte_rate))
+        With a known maximum duration the final size is bounded, so push()
+        can memcpy into the mapping instead of growing a bytearray.
+        """
+        data_capacity = int(self._sample_rate * self._channels * self._sample_width * self._max_duration)
+        self._mmap_capacity = _WAV_HEADER.size + data_capacity
 
-        # Block align = channels * bits_per_sample / 8
-        block_align = self._channels * self._sample_width
-        self._file_handle.write(struct.pack('<H', block_align))
+        self._file_handle.truncate(self._mmap_capacity)
+        self._mmap = mmap.mmap(self._file_handle.fileno(), self._mmap_capacity)
+        self._mv = memoryview(self._mmap)
+        _WAV_HEADER.pack_into(self._mv, 0, *self._pack_wav_header(0))
+        self._mmap_pos = _WAV_HEADER.size
 
-        # Bits per sample
-        self._file_handle.write(struct.pack('<H', 32))  # float32 = 32 bits
+    def _close_mmap(self) -> None:
+        """Patch header sizes, unmap and trim the file to the written size."""
+        data_size = self._mmap_pos - _WAV_HEADER.size
+        _WAV_HEADER.pack_into(self._mv, 0, *self._pack_wav_header(data_size))
 
-        # data chunk
-        self._file_handle.write(b'data')
-        self._file_handle.write(struct.pack('<I', 0))  # Data size (placeholder)
+        self._mv.release()
+        self._mv = None
+        self._mmap.close()
+        self._mmap = None
 
-    def push(self, frame: bytes) -> bool:
+        # Truncate after unmapping (required on Windows)
+        self._file_handle.truncate(self._mmap_pos)
+
+    def _as_interleaved(self, frame: Any) -> Any:
+        """
+        Return frame as an interleaved float32 bytes-like object.
+
+        AudioDecoder already delivers interleaved bytes, which pass through
+        untouched. Planar (fltp) AudioFrames/ndarrays are interleaved once
+        here, since WAV and the packed 'flt' conversion path both expect
+        interleaved data.
+        """
+        if hasattr(frame, 'to_ndarray'):
+            frame = frame.to_ndarray()
+        if not isinstance(frame, np.ndarray):
+            return frame
+
+        if frame.ndim == 2 and frame.shape[0] == self._channels and self._channels > 1:
+            frame = frame.T
+        return memoryview(np.ascontiguousarray(frame, dtype=np.float32)).cast('B')
+
+    def push(self, frame: Any) -> bool:
         """
         Receive decoded audio data and add to recording buffer.
 
         This method is called by AudioDecoder for each decoded audio packet.
 
         Args:
-            frame: Decoded audio data (float32 PCM bytes)
+            frame: Decoded audio data (float32 PCM bytes, or planar
+                   AudioFrame/ndarray)
 
         Returns:
             True if data was accepted
@@ -196,6 +260,8 @@ class AudioRecorder:
         if not self._is_recording:
             return False
 
+        frame = self._as_interleaved(frame)
+
         # Check max duration
         if self._max_duration:
             elapsed = time.time() - self._start_time
@@ -205,98 +271,124 @@ class AudioRecorder:
                 self.close()  # Auto-close when max duration reached
                 return False
 
-        # Add frame to buffer
+        # Add frame to buffer (or straight into the mapped file)
         with self._buffer_lock:
-            self._buffer.extend(frame)
-            self._bytes_written += len(frame)
-            self._frames_written += len(frame) // (self._channels * self._sample_width)
-
-        return True
+            if self._mv is not None:
+                end = self._mmap_pos + len(frame)
+                if end > self._mmap_capacity:
+                    # Preallocated file is full (wall clock ran slightly past max_duration)
+                    return False
+                self._mv[self._mmap_pos:end] = frame
+                self._mmap_pos = end
+            else:
+                self._buffer.extend(frame)
 
-    def _convert_to_opus(self) -> bool:
-        """Convert WAV to Opus format using PyAV."""
-        try:
-            logger.info(f"Converting {self._wav_filename} to Opus: {self._filename}")
+        # Counters are only written by this (producer) thread; readers
+        # such as get_file_size() access them without locking
+        self._bytes_written += len(frame)
+        self._frames_written += len(frame) // (self._channels * self._sample_width)
 
-            # Open input WAV file
-            input_ = av.open(self._wav_filename, 'r')
+        return True
 
-            # Create output Opus file
-            output = av.open(self._filename, 'w')
+    def _encode_pcm(self, output_stream, output, layout: str, resampler=None) -> None:
+        """
+        Encode the recorded PCM straight from the temp WAV file.
 
-            # Add Opus stream - specify codec parameters directly
-            output_stream = output.add_stream('libopus', rate=48000)
+        The data chunk is our own float32 output, so it is memory-mapped and
+        wrapped into packed 'flt' AudioFrames directly - no WAV demuxer or
+        PCM decoder is spun up just to read it back. When the encoder cannot
+        take the recorded sample rate, frames go through ``resampler`` first.
+        """
+        frame_bytes = self._channels * self._sample_width
+        data_size = Path(self._wav_filename).stat().st_size - _WAV_HEADER.size
+        n_samples = data_size // frame_bytes
+        if n_samples <= 0:
+            return
 
-            # Convert frames
-            for frame in input_.decode(audio=0):
-                for packet in output_stream.encode(frame):
+        pcm = np.memmap(self._wav_filename, dtype=np.float32, mode='r',
+                        offset=_WAV_HEADER.size, shape=(n_samples * self._channels,))
+
+        for start in range(0, n_samples, CONVERT_BLOCK_SAMPLES):
+            end = min(start + CONVERT_BLOCK_SAMPLES, n_samples)
+            # Packed layout: one plane of interleaved samples, shape (1, n * channels)
+            block = pcm[start * self._channels:end * self._channels].reshape(1, -1)
+            frame = av.AudioFrame.from_ndarray(block, format='flt', layout=layout)
+            frame.sample_rate = self._sample_rate
+            frame.pts = start
+            frames = resampler.resample(frame) if resampler is not None else (frame,)
+            for out_frame in frames:
+                for packet in output_stream.encode(out_frame):
                     output.mux(packet)
 
-            # Flush encoder
-            for packet in output_stream.encode():
-                output.mux(packet)
-
-            input_.close()
-            output.close()
-
-            wav_size = Path(self._wav_filename).stat().st_size / 1024
-            opus_size = Path(self._filename).stat().st_size / 1024
-            ratio = (opus_size / wav_size) * 100
-            logger.info(f"Opus conversion successful:")
-            logger.info(f"  WAV:  {wav_size:.1f} KB")
-            logger.info(f"  Opus: {opus_size:.1f} KB ({ratio:.1f}% of original)")
-
-            # Remove temp WAV file
-            Path(self._wav_filename).unlink()
-            return True
+        del pcm
 
-        except Exception as e:
-            logger.error(f"PyAV Opus conversion failed: {e}")
-            logger.info(f"WAV file saved at: {self._wav_filename}")
-            return False
+        # Flush resampler, then encoder
+        if resampler is not None:
+            for out_frame in resampler.resample(None):
+                for packet in output_stream.encode(out_frame):
+                    output.mux(packet)
+        for packet in output_stream.encode():
+            output.mux(packet)
 
-    def _convert_to_mp3(self) -> bool:
-        """Convert WAV to MP3 format using PyAV."""
+    def _convert(self, codec_name: str, label: str) -> bool:
+        """Convert the temp WAV to the target format using PyAV."""
         try:
-            logger.info(f"Converting {self._wav_filename} to MP3: {self._filename}")
-
-            # Open input WAV file
-            input_ = av.open(self._wav_filename, 'r')
-
-            # Create output MP3 file
+            logger.info(f"Converting {self._wav_filename} to {label}: {self._filename}")
+
+            layout = _CHANNEL_LAYOUTS.get(self._channels)
+            if layout is None:
+                raise ValueError(f"unsupported channel count: {self._channels}")
+
+            # Keep the recorded rate unless the encoder cannot take it
+            # (e.g. Opus has no 44.1 kHz mode); then use the nearest higher one
+            rate = self._sample_rate
+            supported = av.Codec(codec_name, 'w').audio_rates
+            if supported and rate not in supported:
+                higher = [r for r in supported if r > rate]
+                rate = min(higher) if higher else max(supported)
+                logger.info(f"{label} does not support {self._sample_rate} Hz, resampling to {rate} Hz")
+
+            # Create output file
             output = av.open(self._filename, 'w')
 
-            # Add MP3 stream
-            output_stream = output.add_stream('mp3', rate=48000)
-
-            # Convert frames
-            for frame in input_.decode(audio=0):
-                for packet in output_stream.encode(frame):
-                    output.mux(packet)
+            # Add output stream - specify codec parameters directly
+            output_stream = output.add_stream(codec_name, rate=rate, layout=layout)
 
-            # Flush encoder
-            for packet in output_stream.encode():
-                output.mux(packet)
+            resampler = None
+            if rate != self._sample_rate:
+                resampler = av.AudioResampler(
+                    format=output_stream.format.name, layout=layout, rate=rate
+                )
 
-            input_.close()
-            output.close()
+            try:
+                self._encode_pcm(output_stream, output, layout, resampler)
+            finally:
+                output.close()
 
             wav_size = Path(self._wav_filename).stat().st_size / 1024
-            mp3_size = Path(self._filename).stat().st_size / 1024
-            ratio = (mp3_size / wav_size) * 100
-            logger.info(f"MP3 conversion successful:")
+            out_size = Path(self._filename).stat().st_size / 1024
+            ratio = (out_size / wav_size) * 100
+            logger.info(f"{label} conversion successful:")
             logger.info(f"  WAV: {wav_size:.1f} KB")
-            logger.info(f"  MP3: {mp3_size:.1f} KB ({ratio:.1f}% of original)")
+            logger.info(f"  {label}: {out_size:.1f} KB ({ratio:.1f}% of original)")
 
             # Remove temp WAV file
             Path(self._wav_filename).unlink()
             return True
 
         except Exception as e:
-            logger.error(f"PyAV MP3 conversion failed: {e}")
+            logger.error(f"PyAV {label} conversion failed: {e}")
             logger.info(f"WAV file saved at: {self._wav_filename}")
             return False
 
+    def _convert_to_opus(self) -> bool:
+        """Convert WAV to Opus format using PyAV."""
+        return self._convert('libopus', 'Opus')
+
+    def _convert_to_mp3(self) -> bool:
+        """Convert WAV to MP3 format using PyAV."""
+        return self._convert('mp3', 'MP3')
+
     def close(self) -> None:
         """
         Close the recorder and finalize the recording.
@@ -313,7 +405,9 @@ class AudioRecorder:
 
         # Write WAV file
         with self._buffer_lock:
-            if self._buffer and self._file_handle:
+            if self._mv is not None:
+                self._close_mmap()
+            elif self._buffer and self._file_handle:
                 # Write audio data
                 self._file_handle.write(self._buffer)
 
@@ -357,15 +451,20 @@ class AudioRecorder:
         return self._is_recording
 
     def get_duration(self) -> float:
-        """Get current recording duration in seconds."""
-        if self._start_time is None:
+        """Get current recording duration in seconds (lock-free)."""
+        start_time = self._start_time
+        if start_time is None:
             return 0.0
-        return time.time() - self._start_time
+        return time.time() - start_time
 
     def get_file_size(self) -> int:
-        """Get current file size in bytes."""
-        with self._buffer_lock:
-            return self._bytes_written
+        """
+        Get current file size in bytes.
+
+        Lock-free: _bytes_written is a plain int only updated by the push
+        thread, and reading an int attribute is atomic under the GIL.
+        """
+        return self._bytes_written
 
 
 class TeeAudioRecorder:
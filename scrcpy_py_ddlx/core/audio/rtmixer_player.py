@@ -0,0 +1,217 @@
+"""
+rtmixer-based audio player for scrcpy audio streams.
+
+Same interface as SoundDevicePlayer, but the PortAudio callback is the C
+callback from python-rtmixer reading a PaUtilRingBuffer. No Python code
+runs on the real-time audio thread, so GIL contention, garbage collection
+pauses and logging in the decoder thread cannot cause underruns.
+
+Python only writes into the ring buffer from push().
+
+Resources:
+- https://python-rtmixer.readthedocs.io/
+"""
+
+import logging
+from typing import Optional, Any
+
+import numpy as np
+
+# Import rtmixer (optional, depends on sounddevice)
+try:
+    import rtmixer
+    RTMIXER_AVAILABLE = True
+except ImportError:
+    RTMIXER_AVAILABLE = False
+    rtmixer = None
+
+from scrcpy_py_ddlx.core.audio.sounddevice_player import (
+    SoundDevicePlayer,
+    DEFAULT_TARGET_BUFFERING_MS,
+    DEFAULT_OUTPUT_BUFFER_MS,
+    DEFAULT_MAX_BUFFER_MS,
+    DEFAULT_PREBUFFER_MS,
+    DEFAULT_BLOCKSIZE,
+    _next_pow2,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RtMixerPlayer(SoundDevicePlayer):
+    """
+    Audio player using rtmixer's C callback and lock-free ring buffer.
+
+    Frame conversion is shared with SoundDevicePlayer; only the transport
+    differs. The ring buffer is single-producer (push) / single-consumer
+    (C callback), so no lock is needed.
+
+    Example:
+        >>> player = RtMixerPlayer()
+        >>> player.open({"sample_rate": 48000, "channels": 2})
+        >>> player.start()
+        >>> player.push(frame)  # Push decoded frames
+        >>> player.stop()
+        >>> player.close()
+    """
+
+    __slots__ = ('_ringbuffer', '_action', '_ring_capacity', '_dropped_frames')
+
+    def __init__(
+        self,
+        target_buffering_ms: int = DEFAULT_TARGET_BUFFERING_MS,
+        output_buffer_ms: int = DEFAULT_OUTPUT_BUFFER_MS,
+        max_buffer_ms: int = DEFAULT_MAX_BUFFER_MS,
+        prebuffer_ms: int = DEFAULT_PREBUFFER_MS,
+        blocksize: int = DEFAULT_BLOCKSIZE
+    ):
+        if not RTMIXER_AVAILABLE:
+            raise RuntimeError(
+                "rtmixer not available. Install with: pip install rtmixer"
+            )
+        super().__init__(
+            target_buffering_ms=target_buffering_ms,
+            output_buffer_ms=output_buffer_ms,
+            max_buffer_ms=max_buffer_ms,
+            prebuffer_ms=prebuffer_ms,
+            blocksize=blocksize,
+        )
+
+        self._ringbuffer: Optional[Any] = None  # rtmixer.RingBuffer
+        self._action: Optional[Any] = None      # play_ringbuffer() action
+        self._ring_capacity = 0
+        self._dropped_frames = 0
+
+    def _alloc_ring(self) -> None:
+        """Allocate the PaUtilRingBuffer (one element = one int16 frame)."""
+        self._max_buffer_frames = int(self._sample_rate * self._max_buffer_ms / 1000)
+        self._prebuffer_frames = int(self._sample_rate * self._prebuffer_ms / 1000)
+        self._ring_capacity = _next_pow2(self._max_buffer_frames)
+        self._ringbuffer = rtmixer.RingBuffer(2 * self._channels, self._ring_capacity)
+
+    def _buffered_frames(self) -> int:
+        if self._ringbuffer is None:
+            return 0
+        return self._ringbuffer.read_available
+
+    def _create_stream(self) -> Any:
+        """
+        Create the (not yet started) mixer for the current configuration.
+
+        Returns:
+            rtmixer Mixer
+        """
+        # Mixer is a sounddevice stream whose callback is implemented in C
+        stream = rtmixer.Mixer(
+            samplerate=self._sample_rate,
+            channels=self._channels,
+            dtype='int16',
+            blocksize=self._blocksize,
+            latency=self._output_buffer_ms / 1000.0,
+        )
+
+        logger.info(
+            f"RtMixerPlayer opened: {self._sample_rate}Hz, {self._channels} channels, "
+            f"blocksize={self._blocksize or 'auto'}, ring={self._ring_capacity} frames"
+        )
+        return stream
+
+    def _close_stream(self) -> None:
+        """Cancel playback and close the mixer, if any."""
+        self._stream_started = False
+        if self._stream is None:
+            return
+        try:
+            if self._action is not None:
+                self._stream.cancel(self._action)
+                self._underruns = self._action.stats.output_underflows
+                self._action = None
+            if self._stream.active:
+                self._stream.stop()
+            self._stream.close()
+        except Exception as e:
+            logger.debug(f"Error closing mixer: {e}")
+        self._action = None
+        self._stream = None
+
+    def close(self) -> None:
+        """Close the audio player and cleanup resources."""
+        self.stop()
+        self._close_stream()
+        self._ringbuffer = None
+
+        logger.info(
+            f"RtMixerPlayer closed "
+            f"(pushed: {self._frames_pushed}, dropped frames: {self._dropped_frames}, "
+            f"underruns: {self._underruns})"
+        )
+
+    def push(self, frame: Any) -> bool:
+        """
+        Push a decoded audio frame to the player.
+
+        Args:
+            frame: AVFrame or audio data (numpy array or bytes)
+
+        Returns:
+            True if successful
+        """
+        if self._config is None or not self._running or self._ringbuffer is None:
+            return False
+
+        try:
+            src = self._to_frames(frame)
+            if src is None:
+                logger.warning(f"Unknown frame type: {type(frame)}")
+                return False
+
+            # Only the consumer may advance the read index, so when the ring
+            # is full the newest frames are dropped instead of the oldest
+            written = self._ringbuffer.write(np.ascontiguousarray(src))
+            self._dropped_frames += src.shape[0] - written
+
+            self._frames_pushed += 1
+            self._total_bytes_pushed += src.nbytes
+
+            # Auto-start playback when pre-buffer is ready
+            if not self._stream_started:
+                if self._ringbuffer.read_available >= self._prebuffer_frames:
+                    self._stream.start()
+                    self._action = self._stream.play_ringbuffer(self._ringbuffer)
+                    self._stream_started = True
+                    buffer_ms = (self._ringbuffer.read_available * 1000) // self._sample_rate
+                    logger.info(f"RtMixerPlayer stream started (buffer: {buffer_ms}ms, frames: {self._frames_pushed})")
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error processing audio frame: {e}")
+            return False
+
+    def stop(self) -> None:
+        """Stop audio playback."""
+        self._running = False
+        self._stream_started = False
+
+        if self._stream is not None:
+            try:
+                if self._action is not None:
+                    self._stream.cancel(self._action)
+                    self._underruns = self._action.stats.output_underflows
+                    self._action = None
+                if self._stream.active:
+                    self._stream.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping mixer: {e}")
+
+        # Drop anything still queued
+        if self._ringbuffer is not None:
+            self._ringbuffer.flush()
+
+        logger.info("RtMixerPlayer stopped")
+
+
+__all__ = [
+    "RtMixerPlayer",
+    "RTMIXER_AVAILABLE",
+]
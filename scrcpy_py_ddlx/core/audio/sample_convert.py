@@ -0,0 +1,141 @@
+"""
+Sample format conversion helpers for audio players.
+
+The decoder delivers float32 PCM (interleaved bytes or planar ndarrays),
+while the players (QAudioSink, sounddevice/rtmixer streams) output signed
+16-bit. This module provides the float32 -> int16 conversion used on the
+push path.
+
+If Numba is installed, a JIT-compiled kernel performs transpose, scale,
+round and clip in a single pass. Otherwise a NumPy fallback is used
+(same results, a few temporaries per call). On little-endian hosts the
+fallback rounds with the float "magic number" trick instead of
+rint + float->int cast.
+"""
+
+import logging
+import sys
+
+import numpy as np
+
+# Numba is optional - only used to speed up the conversion kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+INT16_SCALE = 32768.0
+INT16_MIN = -32768.0
+INT16_MAX = 32767.0
+
+# 1.5 * 2**23: adding it to a float32 in [-2**22, 2**22] rounds to nearest
+# (ties to even) and leaves the integer in the low mantissa bits, so the
+# low 16 bits of the float32 word are the int16 result. No compare, no cast.
+_ROUND_MAGIC = np.float32(12582912.0)
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _planar_to_int16_kernel(src, dst):
+        channels, n_samples = src.shape
+        for i in range(n_samples):
+            base = i * channels
+            for c in range(channels):
+                v = np.rint(src[c, i] * INT16_SCALE)
+                if v > INT16_MAX:
+                    v = INT16_MAX
+                elif v < INT16_MIN:
+                    v = INT16_MIN
+                dst[base + c] = np.int16(v)
+else:
+    _planar_to_int16_kernel = None
+
+
+def _planar_to_int16_numpy(src: np.ndarray, dst: np.ndarray) -> None:
+    """NumPy fallback: interleave, scale, clip and round into dst."""
+    out = dst.reshape(src.shape[1], src.shape[0])
+    scaled = np.multiply(src.T, INT16_SCALE, dtype=np.float32, order='C')
+    np.clip(scaled, INT16_MIN, INT16_MAX, out=scaled)
+
+    if _LITTLE_ENDIAN:
+        # Branchless round: low int16 half of each float32 word after the magic add
+        scaled += _ROUND_MAGIC
+        out[:] = scaled.view(np.int16)[:, ::2]
+    else:
+        np.rint(scaled, out=scaled)
+        out[:] = scaled
+
+
+class Int16Converter:
+    """
+    Convert float32 PCM to interleaved int16 with a reusable output buffer.
+
+    The output buffer grows on demand and is reused across calls, so the
+    returned array is only valid until the next call to convert().
+
+    Example:
+        >>> conv = Int16Converter(channels=2)
+        >>> pcm16 = conv.convert(np.zeros((2, 960), dtype=np.float32))
+        >>> pcm16.dtype, pcm16.shape
+        (dtype('int16'), (1920,))
+    """
+
+    def __init__(self, channels: int = 2):
+        self._channels = channels
+        self._dst = np.empty(0, dtype=np.int16)
+
+    @property
+    def channels(self) -> int:
+        return self._channels
+
+    def _as_planar(self, samples) -> np.ndarray:
+        """Return a (channels, n_samples) float32 view of the input."""
+        if isinstance(samples, (bytes, bytearray, memoryview)):
+            samples = np.frombuffer(samples, dtype=np.float32)
+        elif samples.dtype != np.float32:
+            samples = samples.astype(np.float32)
+
+        if samples.ndim == 2 and samples.shape[0] == self._channels:
+            # Planar (fltp) layout, as returned by AudioFrame.to_ndarray()
+            return samples
+
+        # Interleaved layout: transpose is a strided view, no copy
+        return samples.reshape(-1, self._channels).T
+
+    def convert(self, samples) -> np.ndarray:
+        """
+        Convert float32 samples to interleaved int16.
+
+        Args:
+            samples: Planar (channels, n) ndarray, or interleaved float32
+                     ndarray/bytes. int16 input is passed through.
+
+        Returns:
+            1-D int16 array of n * channels samples (view of internal buffer)
+        """
+        if isinstance(samples, np.ndarray) and samples.dtype == np.int16:
+            # Already signed 16-bit: only interleave
+            if samples.ndim == 2 and samples.shape[0] == self._channels and self._channels > 1:
+                return samples.T.ravel()
+            return samples.reshape(-1)
+
+        src = self._as_planar(samples)
+        total = src.shape[0] * src.shape[1]
+
+        if self._dst.shape[0] < total:
+            self._dst = np.empty(total, dtype=np.int16)
+        dst = self._dst[:total]
+
+        if _planar_to_int16_kernel is not None:
+            _planar_to_int16_kernel(src, dst)
+        else:
+            _planar_to_int16_numpy(src, dst)
+        return dst
+
+
+__all__ = ["Int16Converter", "NUMBA_AVAILABLE"]
@@ -12,9 +12,12 @@ Resources:
 """
 
 import logging
+import logging.handlers
+import queue
 import threading
 import time
-from typing import Optional, Any, TYPE_CHECKING
+import traceback
+from typing import Optional, Any, Tuple, TYPE_CHECKING
 
 import numpy as np
 
@@ -26,6 +29,16 @@ except ImportError:
     SOUNDDEVICE_AVAILABLE = False
     sd = None
 
+# Import numba (optional, compiles the ring copy kernels without the GIL)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+from scrcpy_py_ddlx.core.audio.sample_convert import Int16Converter
+
 # Import FrameSink for type checking and runtime
 try:
     from scrcpy_py_ddlx.core.av_player import FrameSink
@@ -35,6 +48,40 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+
+class _RealtimeQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records unformatted (formatting happens in the listener)."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _ForwardHandler(logging.Handler):
+    """Listener-side handler: re-dispatch records through the regular module logger."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logger.handle(record)
+
+
+# Logger for the audio callback / push path. Records are only put on a
+# queue there; a QueueListener thread (started in open()) formats them and
+# does the handler I/O through the regular logger.
+_rt_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_rt_logger = logging.getLogger(f"{__name__}.rt")
+_rt_logger.addHandler(_RealtimeQueueHandler(_rt_log_queue))
+_rt_logger.propagate = False
+_rt_log_listener: Optional[logging.handlers.QueueListener] = None
+_rt_log_listener_lock = threading.Lock()
+
+
+def _start_rt_log_listener() -> None:
+    """Start the shared listener thread for _rt_logger (idempotent)."""
+    global _rt_log_listener
+    with _rt_log_listener_lock:
+        if _rt_log_listener is None:
+            _rt_log_listener = logging.handlers.QueueListener(_rt_log_queue, _ForwardHandler())
+            _rt_log_listener.start()
+
 # Type hint for callback flags (only used for type checking)
 if TYPE_CHECKING and sd is not None:
     CallbackFlagsType = sd.CallbackFlags
@@ -44,12 +91,13 @@ else:
 # Audio buffer configuration
 #
 # OPUS format: 48kHz, 2ch, 20ms frames = 50 fps
-# Each frame: 1920 samples = 7680 bytes (float32)
+# Each frame: 1920 samples = 3840 bytes (int16 output)
 #
 # Buffer sizing rationale:
 # - PREBUFFER: Enough to survive initial network jitter (200ms = 10 frames)
 # - MAX_BUFFER: Cap to prevent excess latency (500ms = 25 frames)
-# - OUTPUT_BUFFER: Match OPUS frame size for optimal callback timing
+# - OUTPUT_BUFFER: Suggested device latency; PortAudio picks the host's
+#   native block size (blocksize=0) instead of adapting to a fixed one
 #
 DEFAULT_TARGET_BUFFERING_MS = 50   # Target buffering delay (ms)
 DEFAULT_OUTPUT_BUFFER_MS = 20      # Match OPUS frame size (20ms)
@@ -58,6 +106,137 @@ DEFAULT_PREBUFFER_MS = 100         # 100ms pre-buffer (balance between latency a
 DEFAULT_BLOCKSIZE = 0              # 0 = optimal (variable) blocksize
 
 
+def _next_pow2(n: int) -> int:
+    """Smallest power of two >= n (and >= 1)."""
+    return 1 << max(0, int(n) - 1).bit_length()
+
+
+# Ring kernels
+#
+# ring: (capacity, channels) int16, capacity is a power of two
+# idx:  int64[2] = [write, read], monotonically increasing frame counters
+# Each push/callback is a single kernel call that copies the frames and
+# returns the new index; the caller stores it into idx.
+#
+# Single producer (push) / single consumer (audio callback), no lock:
+# only the producer stores idx[0], only the consumer stores idx[1], and
+# the latency cap is applied by the consumer skipping ahead, never by the
+# producer. The kernels never touch idx: the numba versions run without
+# the GIL and emit no memory fence, so an index stored inside them could
+# become visible before the copied frames on weakly ordered CPUs (ARM).
+# Both threads load and store idx in Python with the GIL held, and the
+# GIL release/acquire around each kernel call orders the copy before the
+# index store that publishes it.
+
+def _ring_push_numpy(ring: np.ndarray, w: int, r: int, src: np.ndarray) -> int:
+    """Copy src to the ring at write index w (frames that do not fit are dropped); return frames copied."""
+    capacity = ring.shape[0]
+    w = int(w)
+    n = min(src.shape[0], capacity - (w - int(r)))
+    pos = w & (capacity - 1)
+    n1 = min(n, capacity - pos)
+    ring[pos:pos + n1] = src[:n1]
+    if n1 < n:
+        ring[:n - n1] = src[n1:n]
+    return n
+
+
+def _ring_drain_numpy(ring: np.ndarray, w: int, r: int, out: np.ndarray, max_frames: int) -> Tuple[int, int]:
+    """
+    Fill out from the newest max_frames if enough are queued.
+
+    Returns:
+        Tuple of (new read index, frames available before the copy)
+    """
+    n = out.shape[0]
+    w = int(w)
+    r = int(r)
+    if w - r > max_frames:
+        # Limit delay: drop the oldest frames
+        r = w - max_frames
+    available = w - r
+    if available < n:
+        out.fill(0)
+        return r, available
+    capacity = ring.shape[0]
+    pos = r & (capacity - 1)
+    n1 = min(n, capacity - pos)
+    out[:n1] = ring[pos:pos + n1]
+    if n1 < n:
+        out[n1:] = ring[:n - n1]
+    return r + n, available
+
+
+if NUMBA_AVAILABLE:
+    # nogil: the PortAudio thread and the producer do not contend for the
+    # interpreter while copying
+    @njit(nogil=True, cache=True)
+    def _ring_push(ring, w, r, src):
+        capacity = ring.shape[0]
+        mask = capacity - 1
+        n = min(src.shape[0], capacity - (w - r))
+        for i in range(n):
+            j = (w + i) & mask
+            for c in range(ring.shape[1]):
+                ring[j, c] = src[i, c]
+        return n
+
+    @njit(nogil=True, cache=True)
+    def _ring_drain(ring, w, r, out, max_frames):
+        n = out.shape[0]
+        if w - r > max_frames:
+            r = w - max_frames
+        available = w - r
+        if available < n:
+            out[:] = 0
+            return r, available
+        mask = ring.shape[0] - 1
+        for i in range(n):
+            j = (r + i) & mask
+            for c in range(ring.shape[1]):
+                out[i, c] = ring[j, c]
+        return r + n, available
+else:
+    _ring_push = _ring_push_numpy
+    _ring_drain = _ring_drain_numpy
+
+_ring_kernels_ready = not NUMBA_AVAILABLE
+
+
+def _warm_ring_kernels() -> bool:
+    """
+    Compile (or load from cache) the numba ring kernels ahead of playback.
+
+    @njit compiles on first call, which would otherwise happen inside the
+    PortAudio callback. Numba specializes on dtype/ndim/layout only, so one
+    call per layout used in practice is enough: C-contiguous interleaved and
+    transposed planar sources for push, C-contiguous outdata for the callback.
+    If compilation fails the NumPy kernels are used instead.
+
+    Returns:
+        True if the numba kernels are ready, False if NumPy is used
+    """
+    global _ring_push, _ring_drain, _ring_kernels_ready
+    if _ring_kernels_ready:
+        return _ring_push is not _ring_push_numpy
+
+    try:
+        ring = np.zeros((4, 2), dtype=np.int16)
+        idx = np.zeros(2, dtype=np.int64)
+        _ring_push(ring, idx[0], idx[1], np.zeros((2, 2), dtype=np.int16))
+        _ring_push(ring, idx[0], idx[1], np.zeros((2, 2), dtype=np.int16).T)
+        _ring_drain(ring, idx[0], idx[1], np.zeros((2, 2), dtype=np.int16), 4)
+        ready = True
+    except Exception as e:
+        logger.warning(f"numba ring kernels unavailable, using NumPy: {e}")
+        _ring_push = _ring_push_numpy
+        _ring_drain = _ring_drain_numpy
+        ready = False
+
+    _ring_kernels_ready = True
+    return ready
+
+
 class SoundDevicePlayer(FrameSink):
     """
     Audio player using sounddevice's OutputStream for playback.
@@ -77,6 +256,17 @@ class SoundDevicePlayer(FrameSink):
         >>> player.close()
     """
 
+    __slots__ = (
+        '_target_buffering_ms', '_output_buffer_ms', '_max_buffer_ms',
+        '_prebuffer_ms', '_blocksize',
+        '_config', '_stream', '_sample_rate', '_channels',
+        '_ring', '_idx', '_converter',
+        '_max_buffer_frames', '_prebuffer_frames',
+        '_running', '_stream_started',
+        '_frames_pushed', '_total_bytes_pushed', '_frames_played', '_underruns',
+        '_callback_count', '_callback_errors',
+    )
+
     def __init__(
         self,
         target_buffering_ms: int = DEFAULT_TARGET_BUFFERING_MS,
@@ -90,7 +280,7 @@ class SoundDevicePlayer(FrameSink):
 
         Args:
             target_buffering_ms: Target buffering delay (ms) - not currently used
-            output_buffer_ms: Output buffer size (ms) - used to calculate blocksize
+            output_buffer_ms: Suggested output latency (ms) passed to PortAudio
             max_buffer_ms: Maximum buffer size (ms) - caps internal buffer to limit delay
             prebuffer_ms: Pre-buffer amount before starting playback (ms)
             blocksize: Number of frames per callback (0 = optimal/variable)
@@ -112,9 +302,17 @@ class SoundDevicePlayer(FrameSink):
         self._sample_rate: int = 48000
         self._channels: int = 2
 
-        # Sample buffer (thread-safe)
-        self._sample_buffer: bytearray = bytearray()
-        self._buffer_lock = threading.Lock()
+        # Sample ring buffer (lock-free SPSC, see the ring kernels)
+        # Preallocated (capacity, channels) int16 frames; _idx holds the
+        # [write, read] frame counters, stored by push() and the audio callback.
+        # int16 halves the bytes moved per copy compared to float32.
+        self._ring: np.ndarray = np.zeros((0, self._channels), dtype=np.int16)
+        self._idx = np.zeros(2, dtype=np.int64)
+        # Sizes in frames, computed once per configuration in _alloc_ring()
+        self._max_buffer_frames = 0
+        self._prebuffer_frames = 0
+        # float32 decoder output -> int16 (reusable output buffer)
+        self._converter = Int16Converter(self._channels)
 
         # Threading
         self._running = False
@@ -128,41 +326,73 @@ class SoundDevicePlayer(FrameSink):
 
         # Callback state
         self._callback_count = 0
+        # Exceptions raised in the audio callback, reported from push()
+        # so formatting never happens on the real-time thread
+        self._callback_errors: queue.SimpleQueue = queue.SimpleQueue()
+
+    def _alloc_ring(self) -> None:
+        """Allocate the sample ring for the current sample rate/channels."""
+        self._max_buffer_frames = int(self._sample_rate * self._max_buffer_ms / 1000)
+        self._prebuffer_frames = int(self._sample_rate * self._prebuffer_ms / 1000)
+        # Headroom above the latency cap: the producer only drops frames if
+        # the consumer has not trimmed the ring for a whole max_buffer_ms
+        capacity = _next_pow2(2 * self._max_buffer_frames)
+        self._idx = np.zeros(2, dtype=np.int64)
+        self._ring = np.zeros((capacity, self._channels), dtype=np.int16)
+        # Compile the kernels here, not on the first audio callback
+        _warm_ring_kernels()
+
+    def _buffered_frames(self) -> int:
+        """Number of frames currently queued in the ring."""
+        return int(self._idx[0] - self._idx[1])
+
+    @staticmethod
+    def _stream_params(codec_context: Any) -> Tuple[int, int]:
+        """
+        Extract (sample_rate, channels) from a codec context.
+
+        Args:
+            codec_context: Dict or codec context with sample_rate, channels
+
+        Returns:
+            Tuple of (sample_rate, channels), 48000/2 if codec_context is invalid
+        """
+        if isinstance(codec_context, dict):
+            return codec_context.get("sample_rate", 48000), codec_context.get("channels", 2)
+        if hasattr(codec_context, "sample_rate"):
+            channels = codec_context.channels if hasattr(codec_context, "channels") else 2
+            return codec_context.sample_rate, channels
+        logger.warning("Invalid codec context, using defaults")
+        return 48000, 2
 
     def open(self, codec_context: Any) -> bool:
         """
         Initialize audio player with codec parameters.
 
+        Calling open() again with the same format keeps the current stream.
+        A different sample rate or channel count closes the stream and
+        re-creates it (the ring and the stream callback depend on both).
+
         Args:
             codec_context: Codec context with sample_rate, channels
 
         Returns:
             True if successful
         """
+        name = type(self).__name__
         try:
-            # If stream already exists, just update config and return
+            sample_rate, channels = self._stream_params(codec_context)
+
             if self._stream is not None:
-                logger.debug("SoundDevicePlayer stream already exists, skipping re-creation")
-                # Update config if needed
-                if isinstance(codec_context, dict):
-                    self._sample_rate = codec_context.get("sample_rate", 48000)
-                    self._channels = codec_context.get("channels", 2)
-                elif hasattr(codec_context, "sample_rate"):
-                    self._sample_rate = codec_context.sample_rate
-                    self._channels = codec_context.channels if hasattr(codec_context, "channels") else 2
-                return True
-
-            # Extract audio parameters
-            if isinstance(codec_context, dict):
-                sample_rate = codec_context.get("sample_rate", 48000)
-                channels = codec_context.get("channels", 2)
-            elif hasattr(codec_context, "sample_rate"):
-                sample_rate = codec_context.sample_rate
-                channels = codec_context.channels if hasattr(codec_context, "channels") else 2
-            else:
-                logger.warning("Invalid codec context, using defaults")
-                sample_rate = 48000
-                channels = 2
+                if sample_rate == self._sample_rate and channels == self._channels:
+                    logger.debug(f"{name} stream already exists, skipping re-creation")
+                    return True
+
+                logger.info(
+                    f"{name} format changed to {sample_rate}Hz, {channels} channels, "
+                    f"re-creating stream"
+                )
+                self._close_stream()
 
             # Store configuration
             self._sample_rate = sample_rate
@@ -170,56 +400,68 @@ class SoundDevicePlayer(FrameSink):
             self._config = {
                 "sample_rate": sample_rate,
                 "channels": channels,
-                "format": "float32"  # Use float32 for better audio quality
+                "format": "int16"
             }
+            if self._converter.channels != channels:
+                self._converter = Int16Converter(channels)
+            self._alloc_ring()
 
-            # Calculate blocksize from buffer size if using default
-            if self._blocksize == 0:
-                # Convert milliseconds to frames
-                self._blocksize = int(sample_rate * self._output_buffer_ms / 1000)
-                logger.info(f"Calculated blocksize: {self._blocksize} frames from {self._output_buffer_ms}ms")
-
-            # Create OutputStream (not started yet)
-            # We'll start it in start() method
-            # Use float32 format (native OPUS decoder output)
-            self._stream = sd.OutputStream(
-                samplerate=sample_rate,
-                channels=channels,
-                dtype='float32',
-                blocksize=self._blocksize,
-                callback=self._audio_callback,
-                finished_callback=self._stream_finished
-            )
-
-            logger.info(
-                f"SoundDevicePlayer opened: {sample_rate}Hz, {channels} channels, "
-                f"blocksize={self._blocksize}, dtype=float32"
-            )
-
+            # Stream is created stopped, start() / push() start it
+            self._stream = self._create_stream()
             return True
 
         except Exception as e:
-            logger.error(f"Failed to open sounddevice audio player: {e}")
-            import traceback
+            logger.error(f"Failed to open {name}: {e}")
             traceback.print_exc()
             return False
 
+    def _create_stream(self) -> Any:
+        """
+        Create the (not yet started) output stream for the current configuration.
+
+        Returns:
+            sounddevice OutputStream
+        """
+        # Logging from the audio thread goes through a queue
+        _start_rt_log_listener()
+
+        # Use int16 format (natively accepted by most devices)
+        stream = sd.OutputStream(
+            samplerate=self._sample_rate,
+            channels=self._channels,
+            dtype='int16',
+            blocksize=self._blocksize,
+            latency=self._output_buffer_ms / 1000.0,
+            callback=self._make_audio_callback(),
+            finished_callback=self._stream_finished
+        )
+
+        logger.info(
+            f"SoundDevicePlayer opened: {self._sample_rate}Hz, {self._channels} channels, "
+            f"blocksize={self._blocksize or 'auto'}, latency={self._output_buffer_ms}ms, dtype=int16"
+        )
+        return stream
+
+    def _close_stream(self) -> None:
+        """Stop and close the output stream, if any."""
+        self._stream_started = False
+        if self._stream is None:
+            return
+        try:
+            if self._stream.active:
+                self._stream.stop()
+            self._stream.close()
+        except Exception as e:
+            logger.debug(f"Error closing stream: {e}")
+        self._stream = None
+
     def close(self) -> None:
         """Close the audio player and cleanup resources."""
         self._running = False
+        self._close_stream()
 
-        if self._stream is not None:
-            try:
-                if self._stream.active:
-                    self._stream.stop()
-                self._stream.close()
-            except Exception as e:
-                logger.debug(f"Error closing stream: {e}")
-            self._stream = None
-
-        # Clear buffers
-        with self._buffer_lock:
-            self._sample_buffer.clear()
+        # Clear buffers (the stream is closed, so no consumer is running)
+        self._idx[1] = self._idx[0]
 
         logger.info(
             f"SoundDevicePlayer closed "
@@ -227,6 +469,31 @@ class SoundDevicePlayer(FrameSink):
             f"underruns: {self._underruns})"
         )
 
+    def _to_frames(self, frame: Any) -> Optional[np.ndarray]:
+        """
+        Convert a pushed frame to a (frames, channels) int16 array.
+
+        Returns None for unsupported frame types. The result may be a view
+        of the converter's buffer, valid until the next call.
+        """
+        if hasattr(frame, 'to_ndarray'):
+            # PyAV VideoFrame (audio frames also use this)
+            audio_data = frame.to_ndarray()
+        elif isinstance(frame, (np.ndarray, bytes)):
+            audio_data = frame
+        else:
+            return None
+
+        if isinstance(audio_data, np.ndarray) and audio_data.dtype == np.int16:
+            # Already int16 (s16/s16p decoder output): no conversion
+            if audio_data.ndim == 2 and audio_data.shape[0] == self._channels and self._channels > 1:
+                # Planar - interleaved by the single copy into the ring
+                return audio_data.T
+            return audio_data.reshape(-1, self._channels)
+
+        # float32 (planar or interleaved) -> interleaved int16
+        return self._converter.convert(audio_data).reshape(-1, self._channels)
+
     def push(self, frame: Any) -> bool:
         """
         Push a decoded audio frame to the player.
@@ -240,72 +507,50 @@ class SoundDevicePlayer(FrameSink):
         if self._config is None or not self._running:
             return False
 
+        if not self._callback_errors.empty():
+            self._report_callback_errors()
+
         try:
-            # Convert frame to bytes
-            if hasattr(frame, 'to_ndarray'):
-                # PyAV VideoFrame (audio frames also use this)
-                audio_data = frame.to_ndarray()
-                # Flatten and convert to bytes
-                if audio_data.ndim == 2:
-                    # Planar audio - interleave channels
-                    audio_data = audio_data.T.flatten()
-                else:
-                    audio_data = audio_data.flatten()
-
-                # Convert to float32 bytes
-                samples = audio_data.astype(np.float32).tobytes()
-            elif isinstance(frame, np.ndarray):
-                # Already a numpy array
-                if frame.ndim == 2:
-                    frame = frame.T.flatten()
-                else:
-                    frame = frame.flatten()
-                samples = frame.astype(np.float32).tobytes()
-            elif isinstance(frame, bytes):
-                samples = frame
-            else:
+            src = self._to_frames(frame)
+            if src is None:
                 logger.warning(f"Unknown frame type: {type(frame)}")
                 return False
 
-            # Add to sample buffer with size limiting
-            with self._buffer_lock:
-                was_empty = len(self._sample_buffer) == 0
-                self._sample_buffer.extend(samples)
-
-                # Limit buffer size to prevent excess delay
-                # Calculate max buffer size in bytes
-                max_buffer_bytes = int(self._sample_rate * self._channels * 4 * self._max_buffer_ms / 1000)
-                if len(self._sample_buffer) > max_buffer_bytes:
-                    # Drop oldest samples (from beginning) to stay within max buffer
-                    excess_bytes = len(self._sample_buffer) - max_buffer_bytes
-                    del self._sample_buffer[:excess_bytes]
-
-                self._frames_pushed += 1
-                self._total_bytes_pushed += len(samples)
-
-                # Auto-start stream when pre-buffer is ready
-                if self._running and not self._stream_started:
-                    prebuffer_bytes = int(self._sample_rate * self._channels * 4 * self._prebuffer_ms / 1000)
-                    if len(self._sample_buffer) >= prebuffer_bytes:
-                        self._stream.start()
-                        self._stream_started = True
-                        buffer_ms = (len(self._sample_buffer) // 4 // self._channels * 1000) // self._sample_rate
-                        logger.info(f"SoundDevicePlayer stream started (buffer: {buffer_ms}ms, frames: {self._frames_pushed})")
+            # Copy into the ring (the callback trims it to max_buffer_ms),
+            # then publish the frames with the GIL held (see the ring kernels)
+            idx = self._idx
+            w = idx[0]
+            r = idx[1]
+            w += _ring_push(self._ring, w, r, src)
+            idx[0] = w
+            available = int(w - r)
+
+            self._frames_pushed += 1
+            self._total_bytes_pushed += src.nbytes
+
+            # Auto-start stream when pre-buffer is ready
+            if self._running and not self._stream_started:
+                if available >= self._prebuffer_frames:
+                    self._stream.start()
+                    self._stream_started = True
+                    buffer_ms = (available * 1000) // self._sample_rate
+                    _rt_logger.info(
+                        "SoundDevicePlayer stream started (buffer: %dms, frames: %d)",
+                        buffer_ms, self._frames_pushed
+                    )
 
             # Log occasionally
             if self._frames_pushed % 100 == 1:
-                with self._buffer_lock:
-                    buffer_ms = (len(self._sample_buffer) // 4 // self._channels * 1000) // self._sample_rate
-                    logger.info(
-                        f"[PLAYER] Pushed frame #{self._frames_pushed}: {len(samples)} bytes "
-                        f"(total: {self._total_bytes_pushed}, buffer: {buffer_ms}ms)"
-                    )
+                buffer_ms = (available * 1000) // self._sample_rate
+                _rt_logger.info(
+                    "[PLAYER] Pushed frame #%d: %d bytes (total: %d, buffer: %dms)",
+                    self._frames_pushed, src.nbytes, self._total_bytes_pushed, buffer_ms
+                )
 
             return True
 
         except Exception as e:
             logger.error(f"Error processing audio frame: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
@@ -338,77 +583,94 @@ class SoundDevicePlayer(FrameSink):
                 logger.debug(f"Error stopping stream: {e}")
 
         # Clear buffer to stop any remaining audio from playing
-        with self._buffer_lock:
-            self._sample_buffer.clear()
+        # (the stream is stopped, so no consumer is running)
+        self._idx[1] = self._idx[0]
 
         logger.info("SoundDevicePlayer stopped")
 
-    def _audio_callback(self, outdata: np.ndarray, frames: int,
-                       time: Any, status: CallbackFlagsType) -> None:
+    def _make_audio_callback(self):
         """
-        sounddevice callback for providing audio samples.
+        Build the sounddevice callback for the current ring configuration.
 
-        This is called by the audio thread when it needs more samples.
-        The signature is specific to OutputStream (no indata parameter).
-
-        Args:
-            outdata: NumPy array to fill with audio samples (frames, channels)
-            frames: Number of frames to provide
-            time: Timestamp info
-            status: Callback status flags
+        The ring, its indices, the latency cap and the kernel are bound as
+        closure variables when the stream is created, so the real-time path
+        does not look them up on every call.
         """
-        self._callback_count += 1
+        ring = self._ring
+        idx = self._idx
+        max_frames = self._max_buffer_frames
+        drain = _ring_drain
+        rt_logger = _rt_logger
+        callback_errors = self._callback_errors
+        player = self
+
+        def audio_callback(outdata: np.ndarray, frames: int,
+                           time: Any, status: CallbackFlagsType) -> None:
+            """
+            sounddevice callback for providing audio samples.
+
+            This is called by the audio thread when it needs more samples.
+            The signature is specific to OutputStream (no indata parameter).
+
+            Args:
+                outdata: NumPy array to fill with audio samples (frames, channels)
+                frames: Number of frames to provide
+                time: Timestamp info
+                status: Callback status flags
+            """
+            count = player._callback_count + 1
+            player._callback_count = count
 
-        try:
-            # Calculate bytes needed
-            bytes_needed = frames * self._channels * 4  # 4 bytes per float32
-
-            with self._buffer_lock:
-                if len(self._sample_buffer) >= bytes_needed:
-                    # Get samples from buffer
-                    samples = bytes(self._sample_buffer[:bytes_needed])
-                    del self._sample_buffer[:bytes_needed]
-
-                    # Convert to numpy array and reshape
-                    audio_array = np.frombuffer(samples, dtype=np.float32)
-                    if self._channels > 1:
-                        audio_array = audio_array.reshape(-1, self._channels)
-
-                    # Copy to output buffer
-                    outdata[:] = audio_array
-                    self._frames_played += 1
-
-                    # Log occasionally
-                    if self._callback_count <= 20 or self._callback_count % 200 == 0:
-                        logger.info(
-                            f"[CALLBACK] #{self._callback_count}: "
-                            f"Provided {frames} frames (buffer remaining: {len(self._sample_buffer)} bytes)"
-                        )
+            try:
+                # Copy from the ring, or silence if not enough samples,
+                # then release the frames with the GIL held (see the ring kernels)
+                r, available = drain(ring, idx[0], idx[1], outdata, max_frames)
+                idx[1] = r
+                provided = available >= frames
+                if provided:
+                    player._frames_played += 1
                 else:
-                    # Not enough samples - fill with silence
-                    outdata.fill(0.0)
-                    self._underruns += 1
-
-                    # Log underruns
-                    if self._callback_count <= 20 or self._callback_count % 200 == 0:
-                        logger.info(
-                            f"[CALLBACK] #{self._callback_count}: "
-                            f"Underrun (needed {bytes_needed} bytes, had {len(self._sample_buffer)})"
+                    player._underruns += 1
+
+                # Log occasionally (queued to the listener)
+                if count <= 20 or count % 200 == 0:
+                    if provided:
+                        rt_logger.info(
+                            "[CALLBACK] #%d: Provided %d frames (buffer remaining: %d frames)",
+                            count, frames, available - frames
+                        )
+                    else:
+                        rt_logger.info(
+                            "[CALLBACK] #%d: Underrun (needed %d frames, had %d)",
+                            count, frames, available
                         )
 
-            # Handle status flags
-            if status:
-                if status.output_underflow:
-                    logger.warning("Audio output underflow detected")
-                if status.priming_output:
-                    logger.debug("Priming output buffer")
+                # Handle status flags
+                if status:
+                    if status.output_underflow:
+                        rt_logger.warning("Audio output underflow detected")
+                    if status.priming_output:
+                        rt_logger.debug("Priming output buffer")
 
-        except Exception as e:
-            logger.error(f"Audio callback error: {e}")
-            import traceback
-            traceback.print_exc()
-            # Fill with silence on error
-            outdata.fill(0.0)
+            except Exception as e:
+                # Defer formatting to the producer thread (see _report_callback_errors)
+                callback_errors.put((e, count))
+                # Fill with silence on error
+                outdata.fill(0)
+
+        return audio_callback
+
+    def _report_callback_errors(self) -> None:
+        """Log exceptions queued by the audio callback (called from push)."""
+        while True:
+            try:
+                e, callback_count = self._callback_errors.get_nowait()
+            except queue.Empty:
+                return
+            logger.error(
+                f"Audio callback error (callback #{callback_count}): {e}\n"
+                + "".join(traceback.format_exception(type(e), e, e.__traceback__))
+            )
 
     def _stream_finished(self) -> None:
         """Called when the stream finishes (becomes inactive)."""
@@ -1,7 +1,9 @@
 """Audio/video synchronization framework."""
 
 import logging
-from typing import Optional, List
+from typing import Optional
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -21,15 +23,22 @@ class PTSComparator:
         >>> print(f"Audio leads video by {delay} units")
     """
 
-    _video_pts_history: List[int]
-    _audio_pts_history: List[int]
+    __slots__ = ('_video_pts_history', '_audio_pts_history', '_history_size', '_head', '_count')
+
+    _video_pts_history: np.ndarray
+    _audio_pts_history: np.ndarray
     _history_size: int
+    _head: int
+    _count: int
 
     def __init__(self) -> None:
         """Initialize the PTS comparator."""
-        self._video_pts_history = []
-        self._audio_pts_history = []
         self._history_size = 10
+        # Fixed-size ring buffers: O(1) update, vectorized smoothing
+        self._video_pts_history = np.zeros(self._history_size, dtype=np.int64)
+        self._audio_pts_history = np.zeros(self._history_size, dtype=np.int64)
+        self._head = 0
+        self._count = 0
 
     def get_delay(self, video_pts: int, audio_pts: int) -> int:
         """
@@ -64,30 +73,27 @@ class PTSComparator:
         """
         self._update_history(video_pts, audio_pts)
 
-        if len(self._video_pts_history) < 3:
+        count = self._count
+        if count < 3:
             return audio_pts - video_pts
 
-        # Calculate average delay over recent history
-        delays = []
-        for v_pts, a_pts in zip(self._video_pts_history, self._audio_pts_history):
-            delays.append(a_pts - v_pts)
-
-        return sum(delays) // len(delays)
+        # Calculate average delay over recent history (order does not matter)
+        delays = self._audio_pts_history[:count] - self._video_pts_history[:count]
+        return int(delays.sum()) // count
 
     def _update_history(self, video_pts: int, audio_pts: int) -> None:
-        """Update PTS history for smoothing."""
-        self._video_pts_history.append(video_pts)
-        self._audio_pts_history.append(audio_pts)
-
-        # Keep history size limited
-        if len(self._video_pts_history) > self._history_size:
-            self._video_pts_history.pop(0)
-            self._audio_pts_history.pop(0)
+        """Update PTS history for smoothing (overwrites the oldest entry when full)."""
+        head = self._head
+        self._video_pts_history[head] = video_pts
+        self._audio_pts_history[head] = audio_pts
+        self._head = (head + 1) % self._history_size
+        if self._count < self._history_size:
+            self._count += 1
 
     def reset(self) -> None:
         """Reset the comparator history."""
-        self._video_pts_history.clear()
-        self._audio_pts_history.clear()
+        self._head = 0
+        self._count = 0
 
 
 class AudioDelayAdjuster:
@@ -103,6 +109,8 @@ class AudioDelayAdjuster:
         >>> adjuster.adjust(delay_ms=-25)  # Reduce delay by 25ms
     """
 
+    __slots__ = ('_current_delay_ms', '_target_delay_ms', '_max_delay_ms', '_min_delay_ms')
+
     _current_delay_ms: int
     _target_delay_ms: int
     _max_delay_ms: int
@@ -125,36 +133,31 @@ class AudioDelayAdjuster:
                      Negative = advance audio
 
         Returns:
-            True if adjustment was applied, False if adjustment was rejected
+            True if adjustment was applied, False if it was clamped to the
+            valid range (the clamped delay is applied)
         """
         new_delay = self._target_delay_ms + delay_ms
 
         # Clamp to valid range
-        if new_delay > self._max_delay_ms:
-            logger.warning(
-                f"Requested delay {new_delay}ms exceeds maximum {self._max_delay_ms}ms"
-            )
-            self._target_delay_ms = self._max_delay_ms
-            return False
-
-        if new_delay < self._min_delay_ms:
+        clamped = max(self._min_delay_ms, min(new_delay, self._max_delay_ms))
+        accepted = clamped == new_delay
+        if not accepted:
             logger.warning(
-                f"Requested delay {new_delay}ms below minimum {self._min_delay_ms}ms"
+                f"Requested delay {new_delay}ms outside "
+                f"[{self._min_delay_ms}, {self._max_delay_ms}]ms, clamped to {clamped}ms"
             )
-            self._target_delay_ms = self._min_delay_ms
-            return False
-
-        self._target_delay_ms = new_delay
-        logger.debug(f"Audio delay adjusted to {self._target_delay_ms}ms")
+        else:
+            logger.debug(f"Audio delay adjusted to {clamped}ms")
 
         # TODO: Implement actual delay adjustment
         # This would typically involve:
         # - Adjusting audio device buffer size
         # - Adding/dropping audio frames
         # - Adjusting playback rate
-        self._current_delay_ms = self._target_delay_ms
+        self._target_delay_ms = clamped
+        self._current_delay_ms = clamped
 
-        return True
+        return accepted
 
     def set_delay(self, delay_ms: int) -> bool:
         """
@@ -9,15 +9,19 @@ This module implements:
 Based on official scrcpy implementation (app/src/audio_player.c, recorder.c, screen.c).
 """
 
+import itertools
 import logging
+import operator
 import threading
 import queue
 import time
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+import numpy as np
+
 try:
     import pyaudio
     PYAUDIO_AVAILABLE = True
@@ -33,6 +37,18 @@ logger = logging.getLogger(__name__)
 # Audio configuration
 DEFAULT_TARGET_BUFFERING_MS = 35  # Target buffering delay (ms)
 DEFAULT_OUTPUT_BUFFER_MS = 25      # SDL audio output buffer size (ms)
+SILENCE_CACHE_SIZE = 4             # Distinct underrun sizes kept as preallocated silence
+
+# Recorder configuration
+RECORDER_QUEUE_SIZE = 100   # Max pending packets per stream
+RECORDER_WAIT_TIMEOUT = 1.0  # Seconds the recorder thread blocks per get()
+RECORDER_MAX_BATCH = 32     # Max packets handed to one mux() call
+RECORDER_MIN_BATCH = 8      # Packets collected before calling mux()...
+RECORDER_BATCH_WINDOW_NS = 10_000_000  # ...or ns since the first one queued
+
+# scrcpy codec ID -> FFmpeg codec name, built on first use (importing
+# .protocol at module load would risk a circular import)
+_CODEC_NAMES: Optional[dict] = None
 
 
 class AudioFormat(Enum):
@@ -58,6 +74,9 @@ class FrameSink:
     Based on official scrcpy frame_sink trait.
     """
 
+    # Empty so that subclasses declaring __slots__ get no per-instance __dict__
+    __slots__ = ()
+
     def open(self, codec_context: Any) -> bool:
         """
         Initialize the sink with codec parameters.
@@ -94,6 +113,11 @@ class AudioPlayer(FrameSink):
     This player receives decoded audio frames and plays them through
     the default audio output device.
 
+    PyAudio runs _audio_callback() as Python code, so every callback has
+    to take the GIL. For playback with no Python on the audio thread use
+    scrcpy_py_ddlx.core.audio.RtMixerPlayer (the default AudioPlayer there
+    when rtmixer is installed), whose C callback reads a lock-free ring.
+
     Based on official scrcpy audio_player (SDL2-based).
 
     Example:
@@ -128,8 +152,30 @@ class AudioPlayer(FrameSink):
 
         # Frame buffer (audio regulator)
         self._frame_queue: queue.Queue = queue.Queue(maxsize=10)
-        self._sample_buffer: bytearray = bytearray()
-        self._buffer_lock = threading.Lock()
+        # Lock-free single-producer (push) / single-consumer (callback) byte
+        # ring. Positions are monotonic byte counters wrapped with _ring_mask;
+        # only push() stores _write_pos and only the callback stores
+        # _read_pos, each after its copy (plain int stores are atomic under
+        # the GIL).
+        self._ring: bytearray = bytearray()
+        self._ring_view: memoryview = memoryview(self._ring)
+        self._ring_mask = 0
+        self._write_pos = 0
+        self._read_pos = 0
+
+        # Packed float32 resampler for PyAV frames (created on first frame)
+        self._resampler: Optional[av.AudioResampler] = None
+
+        # Interleaved float32 staging for planar frames (grown on demand)
+        self._interleave_buf: np.ndarray = np.empty(0, dtype=np.float32)
+
+        # Bytes per interleaved float32 frame (channels * 4), set in open()
+        self._bytes_per_frame = 0
+
+        # Callback buffers, preallocated in open() for frames_per_buffer
+        # Underrun silence by size in bytes (see _silence_for())
+        self._silence: Dict[int, bytes] = {}
+        self._out_view: memoryview = memoryview(bytearray())
 
         # Threading
         self._running = False
@@ -138,6 +184,7 @@ class AudioPlayer(FrameSink):
         # Statistics
         self._frames_played = 0
         self._frames_dropped = 0
+        self._bytes_overflowed = 0
 
     def open(self, codec_context: Any) -> bool:
         """
@@ -167,10 +214,26 @@ class AudioPlayer(FrameSink):
                 channels=channels,
                 format=AudioFormat.F32
             )
+            self._bytes_per_frame = channels * 4  # float32
 
             # Calculate buffer size
             frames_per_buffer = int(sample_rate * self._output_buffer_ms / 1000)
 
+            # Ring: 4x the target buffering, rounded up to a power of two
+            ring_bytes = int(sample_rate * self._bytes_per_frame * self._target_buffering_ms / 1000 * 4)
+            capacity = 1 << max(0, ring_bytes - 1).bit_length()
+            self._ring = bytearray(capacity)
+            self._ring_view = memoryview(self._ring)
+            self._ring_mask = capacity - 1
+            self._write_pos = 0
+            self._read_pos = 0
+            self._resampler = None
+
+            # Underrun silence and wrap-around staging buffer for the callback
+            callback_bytes = frames_per_buffer * self._bytes_per_frame
+            self._silence = {callback_bytes: bytes(callback_bytes)}
+            self._out_view = memoryview(bytearray(callback_bytes))
+
             # Initialize PyAudio
             self._pa = pyaudio.PyAudio()
 
@@ -213,11 +276,13 @@ class AudioPlayer(FrameSink):
                 logger.debug(f"Error terminating PyAudio: {e}")
             self._pa = None
 
-        # Clear buffers
-        with self._buffer_lock:
-            self._sample_buffer.clear()
+        # Clear buffers (the stream is closed, so no consumer is running)
+        self._read_pos = self._write_pos
 
-        logger.info(f"AudioPlayer closed (played: {self._frames_played}, dropped: {self._frames_dropped})")
+        logger.info(
+            f"AudioPlayer closed (played: {self._frames_played}, dropped: {self._frames_dropped}, "
+            f"overflowed: {self._bytes_overflowed} bytes)"
+        )
 
     def push(self, frame: Any) -> bool:
         """
@@ -233,35 +298,70 @@ class AudioPlayer(FrameSink):
             return False
 
         try:
-            # Convert frame to bytes
-            if hasattr(frame, 'to_ndarray'):
-                # PyAV VideoFrame (audio frames also use this)
+            # Get interleaved float32 samples (any buffer object)
+            if isinstance(frame, av.AudioFrame):
+                # libswresample converts to packed float32 (and the stream
+                # rate) in C; its output plane is already interleaved.
+                # An av.AudioFifo is not used for accumulation: its read()
+                # allocates a new AudioFrame on every audio callback, while
+                # the byte ring below is read with a single bytes copy.
+                if self._resampler is None:
+                    self._resampler = av.AudioResampler(
+                        format='flt',
+                        layout={1: 'mono', 2: 'stereo'}.get(self._config.channels),
+                        rate=self._config.sample_rate,
+                    )
+                bytes_per_frame = self._bytes_per_frame
+                for packed in self._resampler.resample(frame):
+                    # The plane buffer may be padded past the last sample
+                    with memoryview(packed.planes[0]) as plane:
+                        self._write_ring(plane[:packed.samples * bytes_per_frame])
+                return True
+            elif hasattr(frame, 'to_ndarray'):
+                # Other frame objects exposing to_ndarray()
                 audio_data = frame.to_ndarray()
-                # Flatten and convert to bytes
                 if audio_data.ndim == 2:
-                    # Planar audio - interleave channels
-                    audio_data = audio_data.T.flatten()
+                    # Planar audio - transpose, cast and copy in one pass
+                    size = audio_data.size
+                    if self._interleave_buf.shape[0] < size:
+                        self._interleave_buf = np.empty(size, dtype=np.float32)
+                    samples = self._interleave_buf[:size]
+                    np.copyto(samples.reshape(audio_data.shape[::-1]), audio_data.T)
                 else:
-                    audio_data = audio_data.flatten()
-
-                # Convert to float32 bytes
-                samples = audio_data.tobytes()
+                    # Already interleaved - no copy when float32
+                    samples = np.ascontiguousarray(audio_data, dtype=np.float32)
             elif isinstance(frame, bytes):
                 samples = frame
             else:
                 logger.warning("Unknown frame type")
                 return False
 
-            # Add to sample buffer
-            with self._buffer_lock:
-                self._sample_buffer.extend(samples)
-
+            self._write_ring(samples)
             return True
 
         except Exception as e:
             logger.error(f"Error processing audio frame: {e}")
             return False
 
+    def _write_ring(self, samples) -> None:
+        """Append a buffer of samples to the ring (whole frames only; excess is dropped when full)."""
+        with memoryview(samples) as view, view.cast('B') as src:
+            capacity = len(self._ring)
+            w = self._write_pos
+            n = len(src)
+            free = capacity - (w - self._read_pos)
+            if n > free:
+                n = free - free % self._bytes_per_frame
+                self._bytes_overflowed += len(src) - n
+
+            pos = w & self._ring_mask
+            n1 = min(n, capacity - pos)
+            self._ring_view[pos:pos + n1] = src[:n1]
+            if n1 < n:
+                self._ring_view[:n - n1] = src[n1:n]
+        # Publish after the copy
+        self._write_pos = w + n
+
     def start(self) -> None:
         """Start audio playback."""
         if self._running:
@@ -287,25 +387,52 @@ class AudioPlayer(FrameSink):
         """
         try:
             # Calculate bytes needed
-            bytes_needed = frame_count * self._config.channels * 4  # 4 bytes per float32
-
-            with self._buffer_lock:
-                if len(self._sample_buffer) >= bytes_needed:
-                    # Get samples from buffer
-                    samples = self._sample_buffer[:bytes_needed]
-                    del self._sample_buffer[:bytes_needed]
-                    self._frames_played += 1
-                    return (bytes(samples), pyaudio.paContinue)
+            bytes_needed = frame_count * self._bytes_per_frame
+
+            r = self._read_pos
+            if self._write_pos - r >= bytes_needed:
+                # Get samples from the ring (at most two slices around the wrap)
+                view = self._ring_view
+                pos = r & self._ring_mask
+                n1 = min(bytes_needed, len(view) - pos)
+                if n1 == bytes_needed:
+                    samples = bytes(view[pos:pos + bytes_needed])
                 else:
-                    # Not enough samples - return silence
-                    silence = b'\x00' * bytes_needed
-                    self._frames_dropped += 1
-                    return (silence, pyaudio.paContinue)
+                    # Join both slices in the staging buffer, then one bytes copy
+                    out = self._out_view
+                    if len(out) < bytes_needed:
+                        out = self._out_view = memoryview(bytearray(bytes_needed))
+                    out[:n1] = view[pos:]
+                    out[n1:bytes_needed] = view[:bytes_needed - n1]
+                    samples = bytes(out[:bytes_needed])
+                # Publish after the copy
+                self._read_pos = r + bytes_needed
+                self._frames_played += 1
+                return (samples, pyaudio.paContinue)
+            else:
+                # Not enough samples - return silence
+                self._frames_dropped += 1
+                return (self._silence_for(bytes_needed), pyaudio.paContinue)
 
         except Exception as e:
             logger.error(f"Audio callback error: {e}")
-            silence = b'\x00' * (frame_count * self._config.channels * 4)
-            return (silence, pyaudio.paContinue)
+            return (bytes(frame_count * self._bytes_per_frame), pyaudio.paContinue)
+
+    def _silence_for(self, size: int) -> bytes:
+        """
+        Get size bytes of silence.
+
+        The usual callback size is preallocated in open(). Other sizes are
+        cached on first use, up to SILENCE_CACHE_SIZE of them; beyond that a
+        new buffer is allocated per call. The result always has exactly
+        size bytes (a short buffer would make PyAudio stop the stream).
+        """
+        silence = self._silence.get(size)
+        if silence is None:
+            silence = bytes(size)
+            if len(self._silence) < SILENCE_CACHE_SIZE:
+                self._silence[size] = silence
+        return silence
 
 
 class PacketSink:
@@ -376,18 +503,30 @@ class Recorder(PacketSink):
         self._video_codec_ctx: Optional[Any] = None
         self._audio_codec_ctx: Optional[Any] = None
 
-        # Packet queues
-        self._video_queue: queue.Queue = queue.Queue(maxsize=100)
-        self._audio_queue: queue.Queue = queue.Queue(maxsize=100)
-
-        # Threading
+        # Single packet queue for both streams, ordered by source PTS so the
+        # muxer receives interleaved packets. Items are
+        # (pts, seq, is_video, packet); seq keeps FIFO order for equal PTS
+        # and means packets themselves are never compared.
+        self._packet_queue: queue.PriorityQueue = queue.PriorityQueue(
+            maxsize=2 * RECORDER_QUEUE_SIZE
+        )
+        self._packet_seq = itertools.count()
+        # Packet type -> is video, classified once per type in push()
+        self._packet_kinds: dict = {}
+        # Packet type -> (get_data, get_pts), see _make_packet_accessors()
+        self._packet_accessors: dict = {}
+
+        # Threading. open() runs before start(); from then on only the
+        # recorder thread touches _output, until stop() has joined it, so
+        # no lock is needed.
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
 
         # Statistics
         self._video_packets_written = 0
         self._audio_packets_written = 0
+        self._video_packets_dropped = 0
+        self._audio_packets_dropped = 0
 
         # Frame counters for PTS generation
         self._video_frame_count = 0
@@ -405,6 +544,10 @@ class Recorder(PacketSink):
         Returns:
             True if successful
         """
+        if self._running:
+            logger.error("Recorder streams must be opened before start()")
+            return False
+
         try:
             # Determine if this is video or audio
             codec_type = self._get_codec_type(codec_context)
@@ -430,108 +573,107 @@ class Recorder(PacketSink):
 
     def _open_video_stream(self, codec_context: Any) -> bool:
         """Open video stream for passthrough recording."""
-        with self._lock:
-            try:
-                # Extract video parameters
-                if isinstance(codec_context, dict):
-                    width = codec_context.get("width", 1920)
-                    height = codec_context.get("height", 1080)
-                    codec_id = codec_context.get("codec_id", 0)
-                elif hasattr(codec_context, "width"):
-                    width = codec_context.width
-                    height = codec_context.height
-                    codec_id = codec_context.codec_id if hasattr(codec_context, "codec_id") else 0
-                else:
-                    logger.warning("Invalid video codec context")
-                    return False
+        try:
+            # Extract video parameters
+            if isinstance(codec_context, dict):
+                width = codec_context.get("width", 1920)
+                height = codec_context.get("height", 1080)
+                codec_id = codec_context.get("codec_id", 0)
+            elif hasattr(codec_context, "width"):
+                width = codec_context.width
+                height = codec_context.height
+                codec_id = codec_context.codec_id if hasattr(codec_context, "codec_id") else 0
+            else:
+                logger.warning("Invalid video codec context")
+                return False
 
-                self._video_codec_ctx = codec_context
+            self._video_codec_ctx = codec_context
 
-                # Create output container if not exists
-                if self._output is None:
-                    self._output = av.open(self._filename, mode='w', format=self._format)
+            # Create output container if not exists
+            if self._output is None:
+                self._output = av.open(self._filename, mode='w', format=self._format)
 
-                # Add video stream for passthrough
-                codec_name = self._get_codec_name(codec_id)
-                self._video_stream = self._output.add_stream(codec_name)
+            # Add video stream for passthrough
+            codec_name = self._get_codec_name(codec_id)
+            self._video_stream = self._output.add_stream(codec_name)
 
-                # Set time_base for proper PTS handling (milliseconds)
-                from fractions import Fraction
-                self._video_stream.time_base = Fraction(1, 1000)  # 1 millisecond
+            # Set time_base for proper PTS handling (milliseconds)
+            from fractions import Fraction
+            self._video_stream.time_base = Fraction(1, 1000)  # 1 millisecond
 
-                # Set width/height for container metadata (not encoding params)
-                # This ensures the file reports correct resolution
-                try:
-                    self._video_stream.width = width
-                    self._video_stream.height = height
-                except Exception as e:
-                    logger.debug(f"Could not set width/height: {e}")
+            # Set width/height for container metadata (not encoding params)
+            # This ensures the file reports correct resolution
+            try:
+                self._video_stream.width = width
+                self._video_stream.height = height
+            except Exception as e:
+                logger.debug(f"Could not set width/height: {e}")
 
-                # Store dimensions for reference
-                self._video_width = width
-                self._video_height = height
+            # Store dimensions for reference
+            self._video_width = width
+            self._video_height = height
 
-                logger.info(f"Video stream opened: {width}x{height}, codec={codec_name}, time_base=1/1000")
-                return True
+            logger.info(f"Video stream opened: {width}x{height}, codec={codec_name}, time_base=1/1000")
+            return True
 
-            except Exception as e:
-                logger.error(f"Failed to open video stream: {e}")
-                return False
+        except Exception as e:
+            logger.error(f"Failed to open video stream: {e}")
+            return False
 
     def _open_audio_stream(self, codec_context: Any) -> bool:
         """Open audio stream for passthrough recording (OPUS for MKV)."""
-        with self._lock:
-            try:
-                # Extract audio parameters
-                if isinstance(codec_context, dict):
-                    sample_rate = codec_context.get("sample_rate", 48000)
-                    channels = codec_context.get("channels", 2)
-                elif hasattr(codec_context, "sample_rate"):
-                    sample_rate = codec_context.sample_rate
-                    channels = codec_context.channels if hasattr(codec_context, "channels") else 2
-                else:
-                    logger.warning("Invalid audio codec context")
-                    return False
+        try:
+            # Extract audio parameters
+            if isinstance(codec_context, dict):
+                sample_rate = codec_context.get("sample_rate", 48000)
+                channels = codec_context.get("channels", 2)
+            elif hasattr(codec_context, "sample_rate"):
+                sample_rate = codec_context.sample_rate
+                channels = codec_context.channels if hasattr(codec_context, "channels") else 2
+            else:
+                logger.warning("Invalid audio codec context")
+                return False
 
-                self._audio_codec_ctx = codec_context
+            self._audio_codec_ctx = codec_context
 
-                # Create output container if not exists
-                if self._output is None:
-                    self._output = av.open(self._filename, mode='w', format=self._format)
+            # Create output container if not exists
+            if self._output is None:
+                self._output = av.open(self._filename, mode='w', format=self._format)
 
-                # For MKV/matroska, use OPUS codec for passthrough (scrcpy sends OPUS)
-                # For MP4, use AAC (requires transcoding, not implemented)
-                layout = 'stereo' if channels == 2 else 'mono'
+            # For MKV/matroska, use OPUS codec for passthrough (scrcpy sends OPUS)
+            # For MP4, use AAC (requires transcoding, not implemented)
+            layout = 'stereo' if channels == 2 else 'mono'
 
-                if self._format in ('mkv', 'matroska'):
-                    # OPUS passthrough for MKV - use layout parameter, not channels
-                    self._audio_stream = self._output.add_stream('opus', rate=sample_rate, layout=layout)
-                else:
-                    # AAC for MP4 (transcoding would be needed for OPUS source)
-                    logger.warning("MP4 container with OPUS audio requires transcoding. Use MKV for passthrough.")
-                    self._audio_stream = self._output.add_stream('aac', rate=sample_rate, layout=layout)
+            if self._format in ('mkv', 'matroska'):
+                # OPUS passthrough for MKV - use layout parameter, not channels
+                self._audio_stream = self._output.add_stream('opus', rate=sample_rate, layout=layout)
+            else:
+                # AAC for MP4 (transcoding would be needed for OPUS source)
+                logger.warning("MP4 container with OPUS audio requires transcoding. Use MKV for passthrough.")
+                self._audio_stream = self._output.add_stream('aac', rate=sample_rate, layout=layout)
 
-                # Set time_base for proper PTS handling (milliseconds)
-                from fractions import Fraction
-                self._audio_stream.time_base = Fraction(1, 1000)  # 1 millisecond
+            # Set time_base for proper PTS handling (milliseconds)
+            from fractions import Fraction
+            self._audio_stream.time_base = Fraction(1, 1000)  # 1 millisecond
 
-                logger.info(f"Audio stream opened: {sample_rate}Hz, {channels} channels, codec={'opus' if self._format in ('mkv', 'matroska') else 'aac'}, time_base=1/1000")
-                return True
+            logger.info(f"Audio stream opened: {sample_rate}Hz, {channels} channels, codec={'opus' if self._format in ('mkv', 'matroska') else 'aac'}, time_base=1/1000")
+            return True
 
-            except Exception as e:
-                logger.error(f"Failed to open audio stream: {e}")
-                return False
+        except Exception as e:
+            logger.error(f"Failed to open audio stream: {e}")
+            return False
 
     def _get_codec_name(self, codec_id: int) -> str:
         """Map scrcpy codec ID to FFmpeg codec name."""
-        from .protocol import CodecId
-        if codec_id == CodecId.H264:
-            return 'h264'
-        elif codec_id == CodecId.H265:
-            return 'hevc'
-        elif codec_id == CodecId.AV1:
-            return 'av1'
-        return 'h264'  # Default
+        global _CODEC_NAMES
+        if _CODEC_NAMES is None:
+            from .protocol import CodecId
+            _CODEC_NAMES = {
+                CodecId.H264: 'h264',
+                CodecId.H265: 'hevc',
+                CodecId.AV1: 'av1',
+            }
+        return _CODEC_NAMES.get(codec_id, 'h264')  # Default: h264
 
     def _convert_annexb_to_length_prefixed(self, data: bytes) -> bytes:
         """
@@ -546,6 +688,15 @@ class Recorder(PacketSink):
         Returns:
             Length-prefixed format data
         """
+        return bytes(self._annexb_to_length_prefixed_buffer(data))
+
+    def _annexb_to_length_prefixed_buffer(self, data: bytes) -> bytearray:
+        """
+        Same as _convert_annexb_to_length_prefixed(), without the final bytes copy.
+
+        av.Packet references the buffer it is given instead of copying it,
+        so the returned (fresh) bytearray can back the packet directly.
+        """
         import struct
         result = bytearray()
 
@@ -573,15 +724,16 @@ class Recorder(PacketSink):
                     break
 
             if i < nal_end:
-                nal_data = data[i:nal_end]
-                # Write 4-byte size (big-endian) + NAL data
-                result.extend(struct.pack('>I', len(nal_data)))
-                result.extend(nal_data)
+                # Write 4-byte size (big-endian) + NAL data, copied once
+                # from a view instead of slicing the input first
+                result.extend(struct.pack('>I', nal_end - i))
+                with memoryview(data) as view:
+                    result.extend(view[i:nal_end])
                 i = nal_end
             else:
                 break
 
-        return bytes(result)
+        return result
 
     def _convert_annexb_to_extradata(self, data: bytes) -> Optional[bytes]:
         """
@@ -674,6 +826,11 @@ class Recorder(PacketSink):
 
         logger.info("Stopping recorder...")
         self._running = False
+        # Wake the recorder thread if it is blocked on an empty queue
+        try:
+            self._packet_queue.put_nowait((-1, next(self._packet_seq), None, None))
+        except queue.Full:
+            pass  # Thread is busy and will see _running on its next pass
 
         # Wait for thread to finish
         if self._thread is not None:
@@ -690,7 +847,8 @@ class Recorder(PacketSink):
 
         logger.info(
             f"Recorder stopped (video: {self._video_packets_written}, "
-            f"audio: {self._audio_packets_written})"
+            f"audio: {self._audio_packets_written}, dropped video: "
+            f"{self._video_packets_dropped}, dropped audio: {self._audio_packets_dropped})"
         )
 
     def push(self, packet: Any) -> bool:
@@ -704,24 +862,67 @@ class Recorder(PacketSink):
             True if successful
         """
         try:
-            # Determine packet type
-            if hasattr(packet, "header") or "video" in str(type(packet)).lower():
-                # Video packet
-                if self._video_enabled and not self._video_queue.full():
-                    self._video_queue.put(packet)
-                    return True
-            else:
-                # Audio packet
-                if self._audio_enabled and not self._audio_queue.full():
-                    self._audio_queue.put(packet)
-                    return True
+            # Determine packet type (cached per class)
+            packet_type = type(packet)
+            is_video = self._packet_kinds.get(packet_type)
+            if is_video is None:
+                is_video = hasattr(packet, "header") or "video" in str(packet_type).lower()
+                self._packet_kinds[packet_type] = is_video
+
+            if not (self._video_enabled if is_video else self._audio_enabled):
+                return False
 
-            return False
+            accessors = self._packet_accessors.get(packet_type)
+            if accessors is None:
+                accessors = self._packet_accessors[packet_type] = self._make_packet_accessors(packet)
+            pts = accessors[1](packet)
+
+            try:
+                self._packet_queue.put_nowait(
+                    (pts if pts is not None else -1, next(self._packet_seq), is_video, packet)
+                )
+                return True
+            except queue.Full:
+                if is_video:
+                    self._video_packets_dropped += 1
+                else:
+                    self._audio_packets_dropped += 1
+                return False
 
         except Exception as e:
             logger.error(f"Error pushing packet: {e}")
             return False
 
+    @staticmethod
+    def _make_packet_accessors(packet: Any) -> tuple:
+        """
+        Build (get_data, get_pts) functions for packets of this type.
+
+        The packet shape is inspected once per type; afterwards each packet
+        costs a direct attribute/key load instead of hasattr() probes.
+        get_data is None if the packet carries no data; get_pts returns
+        the source PTS, or None if unknown.
+        """
+        if hasattr(packet, "data"):
+            get_data = operator.attrgetter("data")
+        elif isinstance(packet, dict):
+            get_data = lambda p: p.get("data", b"")
+        elif isinstance(packet, bytes):
+            get_data = lambda p: p
+        else:
+            get_data = None
+
+        if getattr(packet, "header", None) is not None and hasattr(packet.header, "pts"):
+            get_pts = operator.attrgetter("header.pts")
+        elif isinstance(packet, dict):
+            get_pts = operator.methodcaller("get", "pts")
+        elif hasattr(packet, "pts"):
+            get_pts = operator.attrgetter("pts")
+        else:
+            get_pts = lambda p: None
+
+        return get_data, get_pts
+
     def _run_recorder(self) -> None:
         """Recorder thread main loop."""
         try:
@@ -729,82 +930,87 @@ class Recorder(PacketSink):
             packets_processed = 0
             config_received = False
 
-            while self._running:
-                # Get next packet (prioritize video)
-                packet = None
-                is_video = False
+            packet_queue = self._packet_queue
 
-                if self._video_enabled:
-                    try:
-                        packet = self._video_queue.get(timeout=0.1)
-                        is_video = True
-                    except queue.Empty:
-                        pass
+            # Converted packets waiting for mux(). mux() does file I/O, so it
+            # is called once per RECORDER_MIN_BATCH packets or once the oldest
+            # pending packet is RECORDER_BATCH_WINDOW_NS old.
+            batch = []
+            batch_start_ns = 0
+
+            while self._running:
+                # One blocking wait for either stream, cut short when a
+                # pending batch is due
+                timeout = RECORDER_WAIT_TIMEOUT
+                if batch:
+                    remaining_ns = batch_start_ns + RECORDER_BATCH_WINDOW_NS - time.monotonic_ns()
+                    timeout = max(remaining_ns, 0) / 1e9
+                try:
+                    items = [packet_queue.get(timeout=timeout)]
+                except queue.Empty:
+                    items = []
 
-                if packet is None and self._audio_enabled:
+                # Drain whatever else is queued, up to one batch, in PTS order
+                while items and len(items) < RECORDER_MAX_BATCH:
                     try:
-                        packet = self._audio_queue.get(timeout=0.1)
-                        is_video = False
+                        items.append(packet_queue.get_nowait())
                     except queue.Empty:
-                        pass
-
-                if packet is None:
-                    continue
-
-                # Handle video config packets - set as extradata
-                if is_video and hasattr(packet, 'header') and packet.header.is_config:
-                    config_data = packet.data
-                    logger.info(f"[RECORDER] Config packet received: {len(config_data)} bytes")
-
-                    # Convert Annex B to length-prefixed format for MKV/MP4
-                    converted_config = self._convert_annexb_to_length_prefixed(config_data)
-                    logger.info(f"[RECORDER] Config converted: {len(config_data)} -> {len(converted_config)} bytes")
-
-                    if self._video_stream is not None:
-                        try:
-                            # Set extradata BEFORE any frames are written
-                            self._video_stream.codec_context.extradata = converted_config
-                            config_received = True
-                            logger.info(f"[RECORDER] Extradata set successfully")
-                        except Exception as e:
-                            logger.error(f"[RECORDER] Error setting extradata: {e}")
-                    continue  # Config packet not written as frame
-
-                # Skip video frames if no config received yet
-                if is_video and not config_received:
-                    logger.debug("[RECORDER] Skipping frame - no config received yet")
-                    continue
-
-                # Convert packet to PyAV format
-                av_packet = self._convert_packet(packet, is_video)
-                if av_packet is None:
-                    logger.warning(f"Failed to convert {'video' if is_video else 'audio'} packet")
-                    continue
-
-                # Write packet
-                stream = self._video_stream if is_video else self._audio_stream
-                if stream is None:
-                    logger.warning(f"{'Video' if is_video else 'Audio'} stream not initialized")
-                    continue
+                        break
 
-                try:
-                    # Set stream and mux
+                for _, _, is_video, packet in items:
+                    if packet is None:
+                        continue  # Wakeup from stop()
+
+                    # Handle video config packets - set as extradata
+                    if is_video and hasattr(packet, 'header') and packet.header.is_config:
+                        config_data = packet.data
+                        logger.info(f"[RECORDER] Config packet received: {len(config_data)} bytes")
+
+                        # Convert Annex B to length-prefixed format for MKV/MP4
+                        converted_config = self._convert_annexb_to_length_prefixed(config_data)
+                        logger.info(f"[RECORDER] Config converted: {len(config_data)} -> {len(converted_config)} bytes")
+
+                        if self._video_stream is not None:
+                            try:
+                                # Set extradata BEFORE any frames are written
+                                self._video_stream.codec_context.extradata = converted_config
+                                config_received = True
+                                logger.info(f"[RECORDER] Extradata set successfully")
+                            except Exception as e:
+                                logger.error(f"[RECORDER] Error setting extradata: {e}")
+                        continue  # Config packet not written as frame
+
+                    # Skip video frames if no config received yet
+                    if is_video and not config_received:
+                        logger.debug("[RECORDER] Skipping frame - no config received yet")
+                        continue
+
+                    # Convert packet to PyAV format
+                    av_packet = self._convert_packet(packet, is_video)
+                    if av_packet is None:
+                        logger.warning(f"Failed to convert {'video' if is_video else 'audio'} packet")
+                        continue
+
+                    # Attach stream
+                    stream = self._video_stream if is_video else self._audio_stream
+                    if stream is None:
+                        logger.warning(f"{'Video' if is_video else 'Audio'} stream not initialized")
+                        continue
                     av_packet.stream = stream
-                    self._output.mux(av_packet)
-
-                    packets_processed += 1
-                    if is_video:
-                        self._video_packets_written += 1
-                    else:
-                        self._audio_packets_written += 1
+                    if not batch:
+                        batch_start_ns = time.monotonic_ns()
+                    batch.append((av_packet, is_video))
 
-                    # Log every 100 packets
-                    if packets_processed % 100 == 0:
-                        logger.debug(f"Recorder: {self._video_packets_written} video, {self._audio_packets_written} audio packets written")
+                if batch and (
+                    len(batch) >= RECORDER_MIN_BATCH
+                    or time.monotonic_ns() - batch_start_ns >= RECORDER_BATCH_WINDOW_NS
+                ):
+                    packets_processed += self._mux_batch(batch)
+                    batch = []
 
-                except Exception as mux_error:
-                    logger.error(f"Error muxing {'video' if is_video else 'audio'} packet: {mux_error}")
-                    # Continue processing other packets
+            # Write out what was already converted
+            if batch:
+                packets_processed += self._mux_batch(batch)
 
             logger.info(f"Recorder thread finished, total packets: {packets_processed}")
 
@@ -828,19 +1034,43 @@ class Recorder(PacketSink):
                 except Exception as e:
                     logger.error(f"Error in on_ended callback: {e}")
 
+    def _mux_batch(self, batch: list) -> int:
+        """
+        Mux a batch of (av_packet, is_video) pairs with a single mux() call.
+
+        Returns:
+            Number of packets written
+        """
+        try:
+            self._output.mux([av_packet for av_packet, _ in batch])
+        except Exception as mux_error:
+            logger.error(f"Error muxing batch of {len(batch)} packets: {mux_error}")
+            return 0
+
+        for _, is_video in batch:
+            if is_video:
+                self._video_packets_written += 1
+            else:
+                self._audio_packets_written += 1
+
+            # Log every 100 packets
+            if (self._video_packets_written + self._audio_packets_written) % 100 == 0:
+                logger.debug(f"Recorder: {self._video_packets_written} video, {self._audio_packets_written} audio packets written")
+        return len(batch)
+
     def _convert_packet(self, packet: Any, is_video: bool) -> Optional[av.Packet]:
         """Convert packet to PyAV format with frame-based PTS."""
         try:
-            # Get packet data
-            if hasattr(packet, "data"):
-                data = packet.data
-            elif isinstance(packet, dict):
-                data = packet.get("data", b"")
-            elif isinstance(packet, bytes):
-                data = packet
-            else:
+            # Get packet data (accessors are cached per packet type)
+            packet_type = type(packet)
+            accessors = self._packet_accessors.get(packet_type)
+            if accessors is None:
+                accessors = self._packet_accessors[packet_type] = self._make_packet_accessors(packet)
+            get_data = accessors[0]
+            if get_data is None:
                 logger.warning("Packet has no data attribute")
                 return None
+            data = get_data(packet)
 
             # Get the stream for this packet
             stream = self._video_stream if is_video else self._audio_stream
@@ -851,7 +1081,7 @@ class Recorder(PacketSink):
             # For video frames, convert Annex B to length-prefixed format
             # This is required for MKV/MP4 containers
             if is_video and self._format in ('mkv', 'matroska', 'mp4'):
-                data = self._convert_annexb_to_length_prefixed(data)
+                data = self._annexb_to_length_prefixed_buffer(data)
 
             # Generate PTS based on frame count
             # Use milliseconds as the base unit (more compatible)
@@ -864,7 +1094,7 @@ class Recorder(PacketSink):
                 pts_ms = self._audio_frame_count * 20  # milliseconds
                 self._audio_frame_count += 1
 
-            # Create PyAV packet
+            # Create PyAV packet (wraps the buffer, no copy)
             av_packet = av.Packet(data)
 
             # Set PTS/DTS in the stream's time_base
@@ -934,6 +1164,7 @@ class Screen(FrameSink):
         # Statistics (only tracking, no storage)
         self._frames_received = 0
         self._frames_shown = 0
+        self._next_log_frame = 1  # _frames_received value of the next debug log
 
     def open(self, codec_context: Any) -> bool:
         """
@@ -996,9 +1227,11 @@ class Screen(FrameSink):
             # Track statistics - frame is already in DelayBuffer
             self._frames_received += 1
 
-            # Log periodically for debugging (use DEBUG level to reduce console noise)
-            if self._frames_received % 60 == 1:
-                logger.debug(f"[Screen] push called (count={self._frames_received})")
+            # Log every 60 frames for debugging (use DEBUG level to reduce console noise)
+            if self._frames_received >= self._next_log_frame:
+                self._next_log_frame += 60
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"[Screen] push called (count={self._frames_received})")
 
             # CRITICAL: Call callback to notify video_window that new frame is available
             # The callback is update_frame() which just sets _has_new_frame=True
@@ -1030,7 +1263,7 @@ class Screen(FrameSink):
             result = self._delay_buffer.get_nowait()
             if result is not None:
                 # DelayBuffer returns FrameWithMetadata, extract frame
-                return result.frame if hasattr(result, 'frame') else result
+                return result.frame
         return None
 
     def consume_frame(self) -> Optional[Any]:
@@ -1047,7 +1280,7 @@ class Screen(FrameSink):
             if result is not None:
                 self._frames_shown += 1
                 # DelayBuffer returns FrameWithMetadata, extract frame
-                return result.frame if hasattr(result, 'frame') else result
+                return result.frame
         return None
 
     def set_delay_buffer(self, delay_buffer: 'DelayBuffer') -> None:
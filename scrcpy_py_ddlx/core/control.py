@@ -4,6 +4,9 @@ Control message serialization for scrcpy.
 This module provides functionality to serialize control messages that are sent
 to the Android device during a scrcpy session. It implements all control message
 types defined in the scrcpy protocol.
+
+Serialization is pure Python: each message layout is a precompiled
+struct.Struct, so a fixed-size message costs one C-level pack() call.
 """
 
 import struct
@@ -31,6 +34,55 @@ from .protocol import (
 
 logger = logging.getLogger(__name__)
 
+# Wire layouts (big-endian). Fixed-size messages are packed with a single
+# Struct call; variable-size ones pack a header and append the payload.
+_KEYCODE_STRUCT = struct.Struct(">BBIII")           # type, action, keycode, repeat, metastate
+_TEXT_HEADER_STRUCT = struct.Struct(">BI")          # type, length
+_TOUCH_STRUCT = struct.Struct(">BBQiiHHHII")        # type, action, pointer_id, x, y, w, h, pressure, action_button, buttons
+_SCROLL_STRUCT = struct.Struct(">BiiHHhhI")         # type, x, y, w, h, hscroll, vscroll, buttons
+_TYPE_BYTE_STRUCT = struct.Struct(">BB")            # type, one-byte argument
+_SET_CLIPBOARD_HEADER_STRUCT = struct.Struct(">BQBI")  # type, sequence, paste, length
+_UHID_CREATE_HEADER_STRUCT = struct.Struct(">BHHHB")  # type, id, vendor_id, product_id, name length
+_UHID_INPUT_HEADER_STRUCT = struct.Struct(">BHH")      # type, id, size
+_UHID_DESTROY_STRUCT = struct.Struct(">BH")            # type, id
+_U16_STRUCT = struct.Struct(">H")
+_PING_STRUCT = struct.Struct(">BQ")                 # type, timestamp
+
+def _encode_truncated(text: str, max_bytes: int) -> bytes:
+    """
+    UTF-8 encode text, truncated to max_bytes.
+
+    Same result as text.encode("utf-8")[:max_bytes], but every character
+    encodes to at least one byte, so only the first max_bytes characters
+    need encoding.
+    """
+    return text[:max_bytes].encode("utf-8")[:max_bytes]
+
+
+# Messages that must never be dropped by ControlMessageQueue
+_NON_DROPPABLE_TYPES = frozenset({
+    ControlMessageType.UHID_CREATE,
+    ControlMessageType.UHID_DESTROY,
+})
+
+# Messages made of the type byte only
+_EMPTY_MESSAGE_TYPES = frozenset({
+    ControlMessageType.EXPAND_NOTIFICATION_PANEL,
+    ControlMessageType.EXPAND_SETTINGS_PANEL,
+    ControlMessageType.COLLAPSE_PANELS,
+    ControlMessageType.ROTATE_DEVICE,
+    ControlMessageType.OPEN_HARD_KEYBOARD_SETTINGS,
+    ControlMessageType.RESET_VIDEO,
+    ControlMessageType.GET_APP_LIST,
+    # Media stream control (network mode)
+    ControlMessageType.REQUEST_VIDEO_FRAME,
+    ControlMessageType.START_VIDEO,
+    ControlMessageType.STOP_VIDEO,
+    ControlMessageType.START_AUDIO,
+    ControlMessageType.STOP_AUDIO,
+    ControlMessageType.OPEN_FILE_CHANNEL,
+})
+
 
 class ControlMessage:
     """
@@ -38,8 +90,27 @@ class ControlMessage:
 
     This class provides methods to create different types of control messages
     and serialize them to bytes for transmission.
+
+    Fields of all message types are plain slot attributes; each set_*()
+    method fills the ones its message type uses, and the others keep the
+    defaults serialize() expects.
     """
 
+    __slots__ = (
+        "type", "_droppable",
+        # Key / motion events
+        "action", "keycode", "repeat", "metastate",
+        "pointer_id", "position_x", "position_y", "screen_width", "screen_height",
+        "pressure", "action_button", "buttons", "hscroll", "vscroll",
+        "pressure_u16", "hscroll_i16", "vscroll_i16",
+        # Text / clipboard
+        "text", "text_bytes", "copy_key", "sequence", "paste",
+        # Misc
+        "on", "name", "quality", "timestamp",
+        # UHID
+        "id", "vendor_id", "product_id", "report_desc", "data",
+    )
+
     def __init__(self, msg_type: ControlMessageType):
         """
         Initialize a control message.
@@ -48,7 +119,39 @@ class ControlMessage:
             msg_type: The type of control message
         """
         self.type = msg_type
-        self._data = {}
+        self._droppable = msg_type not in _NON_DROPPABLE_TYPES
+        self.action = 0  # KeyEventAction.DOWN / MotionEventAction.DOWN
+        self.keycode = 0
+        self.repeat = 0
+        self.metastate = 0
+        self.pointer_id = POINTER_ID_GENERIC_FINGER
+        self.position_x = 0
+        self.position_y = 0
+        self.screen_width = 1080
+        self.screen_height = 1920
+        self.pressure = 0.0
+        self.action_button = 0
+        self.buttons = 0
+        self.hscroll = 0.0
+        self.vscroll = 0.0
+        # Fixed-point wire values, computed once by the setters
+        self.pressure_u16 = 0
+        self.hscroll_i16 = 0
+        self.vscroll_i16 = 0
+        self.text = ""
+        self.text_bytes = b""  # Wire payload of text, encoded once by the setter
+        self.copy_key = CopyKey.NONE
+        self.sequence = 0
+        self.paste = False
+        self.on = True
+        self.name = ""  # str (START_APP) or encoded bytes (UHID_CREATE)
+        self.quality = 75
+        self.timestamp = 0
+        self.id = 0
+        self.vendor_id = 0
+        self.product_id = 0
+        self.report_desc = b""
+        self.data = b""
 
     def set_keycode(
         self, action: KeyEventAction, keycode: int, repeat: int = 0, metastate: int = 0
@@ -62,10 +165,10 @@ class ControlMessage:
             repeat: Repeat count (0 for no repeat)
             metastate: Meta key state (0 for none, or SHIFT/ALT/CTRL from AndroidMetaState)
         """
-        self._data["action"] = action
-        self._data["keycode"] = keycode
-        self._data["repeat"] = repeat
-        self._data["metastate"] = metastate
+        self.action = action
+        self.keycode = keycode
+        self.repeat = repeat
+        self.metastate = metastate
 
     def set_text(self, text: str):
         """
@@ -74,7 +177,8 @@ class ControlMessage:
         Args:
             text: UTF-8 text string to inject
         """
-        self._data["text"] = text
+        self.text = text
+        self.text_bytes = _encode_truncated(text, CONTROL_MSG_INJECT_TEXT_MAX_LENGTH)
 
     def set_touch_event(
         self,
@@ -102,15 +206,17 @@ class ControlMessage:
             action_button: Action button state
             buttons: Button state bitmask
         """
-        self._data["action"] = action
-        self._data["pointer_id"] = pointer_id
-        self._data["position_x"] = position_x
-        self._data["position_y"] = position_y
-        self._data["screen_width"] = screen_width
-        self._data["screen_height"] = screen_height
-        self._data["pressure"] = max(0.0, min(1.0, pressure))
-        self._data["action_button"] = action_button
-        self._data["buttons"] = buttons
+        self.action = action
+        self.pointer_id = pointer_id
+        self.position_x = position_x
+        self.position_y = position_y
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.pressure = pressure = max(0.0, min(1.0, pressure))
+        # uint16 fixed point (0-PRESSURE_MULTIPLIER, per official spec)
+        self.pressure_u16 = min(PRESSURE_MULTIPLIER - 1, int(pressure * PRESSURE_MULTIPLIER))
+        self.action_button = action_button
+        self.buttons = buttons
 
     def set_scroll_event(
         self,
@@ -130,17 +236,20 @@ class ControlMessage:
             position_y: Y coordinate in screen pixels
             screen_width: Screen width in pixels
             screen_height: Screen height in pixels
-            hscroll: Horizontal scroll amount (typically -16 to 16)
-            vscroll: Vertical scroll amount (typically -16 to 16)
+            hscroll: Horizontal scroll amount (-1.0 to 1.0, clamped)
+            vscroll: Vertical scroll amount (-1.0 to 1.0, clamped)
             buttons: Button state bitmask
         """
-        self._data["position_x"] = position_x
-        self._data["position_y"] = position_y
-        self._data["screen_width"] = screen_width
-        self._data["screen_height"] = screen_height
-        self._data["hscroll"] = max(-16.0, min(16.0, hscroll))
-        self._data["vscroll"] = max(-16.0, min(16.0, vscroll))
-        self._data["buttons"] = buttons
+        self.position_x = position_x
+        self.position_y = position_y
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.hscroll = hscroll = max(-1.0, min(1.0, hscroll))
+        self.vscroll = vscroll = max(-1.0, min(1.0, vscroll))
+        # int16 fixed point (multiplier SCROLL_MULTIPLIER); 1.0 maps to the int16 maximum
+        self.hscroll_i16 = min(SCROLL_MULTIPLIER - 1, int(hscroll * SCROLL_MULTIPLIER))
+        self.vscroll_i16 = min(SCROLL_MULTIPLIER - 1, int(vscroll * SCROLL_MULTIPLIER))
+        self.buttons = buttons
 
     def set_back_or_screen_on(self, action: KeyEventAction):
         """
@@ -149,7 +258,7 @@ class ControlMessage:
         Args:
             action: Key event action (DOWN turns screen on)
         """
-        self._data["action"] = action
+        self.action = action
 
     def set_copy_key(self, copy_key: CopyKey):
         """
@@ -158,7 +267,7 @@ class ControlMessage:
         Args:
             copy_key: Copy key type (NONE, COPY, or CUT)
         """
-        self._data["copy_key"] = copy_key
+        self.copy_key = copy_key
 
     def set_clipboard(self, sequence: int, text: str, paste: bool = False):
         """
@@ -169,9 +278,10 @@ class ControlMessage:
             text: Text to set in clipboard
             paste: Whether to paste after setting
         """
-        self._data["sequence"] = sequence
-        self._data["text"] = text
-        self._data["paste"] = paste
+        self.sequence = sequence
+        self.text = text
+        self.text_bytes = _encode_truncated(text, CONTROL_MSG_CLIPBOARD_TEXT_MAX_LENGTH)
+        self.paste = paste
 
     def set_display_power(self, on: bool):
         """
@@ -180,7 +290,7 @@ class ControlMessage:
         Args:
             on: True to turn display on, False to turn off
         """
-        self._data["on"] = on
+        self.on = on
 
     def set_uhid_create(
         self,
@@ -200,19 +310,15 @@ class ControlMessage:
             name: Device name (optional)
             report_desc: HID report descriptor
         """
-        self._data["id"] = id
-        self._data["vendor_id"] = vendor_id
-        self._data["product_id"] = product_id
+        self.id = id
+        self.vendor_id = vendor_id
+        self.product_id = product_id
 
         if name is not None:
-            name_bytes = name.encode("utf-8")[:127]
-            self._data["name_len"] = len(name_bytes)
-            self._data["name"] = name_bytes
+            self.name = _encode_truncated(name, 127)
 
         if report_desc is not None:
-            report_desc_len = len(report_desc)
-            self._data["report_desc_len"] = report_desc_len
-            self._data["report_desc"] = report_desc
+            self.report_desc = report_desc
 
     def set_uhid_input(self, id: int, data: bytes) -> None:
         """
@@ -222,32 +328,41 @@ class ControlMessage:
             id: UHID device ID
             data: Input data
         """
-        self._data["id"] = id
-        self._data["data"] = data
+        self.id = id
+        self.data = data
+
+    def set_screenshot(self, quality: int = 75) -> None:
+        """
+        Set screenshot parameters.
+
+        Args:
+            quality: JPEG quality (1-100)
+        """
+        self.quality = quality
 
     def set_expand_notification_panel(self) -> None:
         """
         Expand notification panel.
         """
-        self._data["action"] = 0  # DOWN
+        self.action = 0  # DOWN
 
     def set_expand_settings_panel(self) -> None:
         """
         Expand settings panel.
         """
-        self._data["action"] = 0  # DOWN
+        self.action = 0  # DOWN
 
     def set_collapse_panels(self) -> None:
         """
         Collapse all panels.
         """
-        self._data["action"] = 0  # DOWN
+        self.action = 0  # DOWN
 
     def set_open_hard_keyboard_settings(self) -> None:
         """
         Open hard keyboard settings.
         """
-        self._data["action"] = 0  # DOWN
+        self.action = 0  # DOWN
 
     def set_start_app(self, name: str) -> None:
         """
@@ -257,7 +372,7 @@ class ControlMessage:
             name: Package or activity name (max 255 bytes)
                 Format: "com.example.app" or "com.example.app/com.example.MainActivity"
         """
-        self._data["name"] = name
+        self.name = name
 
     def set_reset_video(self) -> None:
         """
@@ -278,7 +393,7 @@ class ControlMessage:
         Args:
             id: UHID device ID to destroy
         """
-        self._data["id"] = id
+        self.id = id
 
     def set_ping(self, timestamp: int):
         """
@@ -287,7 +402,7 @@ class ControlMessage:
         Args:
             timestamp: Timestamp to echo back (microseconds since epoch)
         """
-        self._data["timestamp"] = timestamp
+        self.timestamp = timestamp
 
     def set_open_file_channel(self):
         """
@@ -300,190 +415,39 @@ class ControlMessage:
         """
         Serialize control message to bytes.
 
+        The serializer for the message type is found with one dict lookup
+        (_SERIALIZERS). Fixed-size messages are returned directly by
+        Struct.pack(), so the result is the only allocation; there is no
+        intermediate buffer to reuse. Variable-size messages are a packed
+        header concatenated with the payload bytes (one allocation); text is
+        encoded by its setter.
+
         Returns:
             Serialized message as bytes
 
         Raises:
             ValueError: If message data is invalid
         """
-        buf = bytearray()
-
-        if self.type == ControlMessageType.INJECT_KEYCODE:
-            buf.append(self.type)
-            action = self._data.get("action", KeyEventAction.DOWN)
-            keycode = self._data.get("keycode", 0)
-            repeat = self._data.get("repeat", 0)
-            metastate = self._data.get("metastate", 0)
-
-            buf.append(action)
-            buf.extend(struct.pack(">I", keycode))
-            buf.extend(struct.pack(">I", repeat))
-            buf.extend(struct.pack(">I", metastate))
-
-        elif self.type == ControlMessageType.INJECT_TEXT:
-            buf.append(self.type)
-            text = self._data.get("text", "")
-            text_bytes = text.encode("utf-8")[:CONTROL_MSG_INJECT_TEXT_MAX_LENGTH]
-            buf.extend(struct.pack(">I", len(text_bytes)))
-            buf.extend(text_bytes)
-
-        elif self.type == ControlMessageType.INJECT_TOUCH_EVENT:
-            buf.append(self.type)
-            action = self._data.get("action", MotionEventAction.DOWN)
-            pointer_id = self._data.get("pointer_id", POINTER_ID_GENERIC_FINGER)
-            position_x = self._data.get("position_x", 0)
-            position_y = self._data.get("position_y", 0)
-            screen_width = self._data.get("screen_width", 1080)
-            screen_height = self._data.get("screen_height", 1920)
-            pressure = self._data.get("pressure", 0.0)
-            action_button = self._data.get("action_button", 0)
-            buttons = self._data.get("buttons", 0)
-
-            buf.append(action)
-            buf.extend(struct.pack(">Q", pointer_id & 0xFFFFFFFFFFFFFFFF))
-            buf.extend(struct.pack(">i", position_x))
-            buf.extend(struct.pack(">i", position_y))
-            buf.extend(struct.pack(">H", screen_width))
-            buf.extend(struct.pack(">H", screen_height))
-
-            # Convert pressure (0.0-1.0) to uint16 fixed point (0-PRESSURE_MULTIPLIER, per official spec)
-            pressure_u16 = int(pressure * PRESSURE_MULTIPLIER)
-            pressure_u16 = max(0, min(PRESSURE_MULTIPLIER - 1, pressure_u16))
-            buf.extend(struct.pack(">H", pressure_u16))
-
-            buf.extend(struct.pack(">I", action_button))
-            buf.extend(struct.pack(">I", buttons))
+        serializer = _SERIALIZERS.get(self.type)
+        if serializer is None:
+            logger.warning(f"Unknown message type: {self.type}")
+            return b""
+        return serializer(self)
 
-        elif self.type == ControlMessageType.INJECT_SCROLL_EVENT:
-            buf.append(self.type)
-            position_x = self._data.get("position_x", 0)
-            position_y = self._data.get("position_y", 0)
-            screen_width = self._data.get("screen_width", 1080)
-            screen_height = self._data.get("screen_height", 1920)
-            hscroll = self._data.get("hscroll", 0.0)
-            vscroll = self._data.get("vscroll", 0.0)
-            buttons = self._data.get("buttons", 0)
-
-            buf.extend(struct.pack(">i", position_x))
-            buf.extend(struct.pack(">i", position_y))
-            buf.extend(struct.pack(">H", screen_width))
-            buf.extend(struct.pack(">H", screen_height))
-
-            # Fixed-point encoding: scroll value (-1.0 to 1.0) to int16 (multiplier SCROLL_MULTIPLIER)
-            # Clamp to int16 range [-SCROLL_MULTIPLIER, SCROLL_MULTIPLIER-1] to handle edge case of exactly 1.0
-            hscroll_i16 = max(-SCROLL_MULTIPLIER, min(SCROLL_MULTIPLIER - 1, int(max(-1.0, min(1.0, hscroll)) * SCROLL_MULTIPLIER)))
-            vscroll_i16 = max(-SCROLL_MULTIPLIER, min(SCROLL_MULTIPLIER - 1, int(max(-1.0, min(1.0, vscroll)) * SCROLL_MULTIPLIER)))
-            buf.extend(struct.pack(">h", hscroll_i16))
-            buf.extend(struct.pack(">h", vscroll_i16))
-
-            buf.extend(struct.pack(">I", buttons))
-
-        elif self.type == ControlMessageType.BACK_OR_SCREEN_ON:
-            buf.append(self.type)
-            action = self._data.get("action", KeyEventAction.DOWN)
-            buf.append(action)
-
-        elif self.type == ControlMessageType.GET_CLIPBOARD:
-            buf.append(self.type)
-            copy_key = self._data.get("copy_key", CopyKey.NONE)
-            buf.append(copy_key)
+    @staticmethod
+    def serialize_many(msgs) -> bytes:
+        """
+        Serialize messages back to back into a single buffer.
 
-        elif self.type == ControlMessageType.SET_CLIPBOARD:
-            buf.append(self.type)
-            sequence = self._data.get("sequence", 0)
-            text = self._data.get("text", "")
-            paste = self._data.get("paste", False)
-
-            buf.extend(struct.pack(">Q", sequence))
-            buf.append(1 if paste else 0)
-
-            text_bytes = text.encode("utf-8")[:CONTROL_MSG_CLIPBOARD_TEXT_MAX_LENGTH]
-            buf.extend(struct.pack(">I", len(text_bytes)))
-            buf.extend(text_bytes)
-
-        elif self.type == ControlMessageType.SET_DISPLAY_POWER:
-            buf.append(self.type)
-            on = self._data.get("on", True)
-            buf.append(1 if on else 0)
-
-        elif self.type == ControlMessageType.UHID_CREATE:
-            id = self._data.get("id", 0)
-            vendor_id = self._data.get("vendor_id", 0)
-            product_id = self._data.get("product_id", 0)
-            name = self._data.get("name", "")
-            report_desc = self._data.get("report_desc", b"")
-            report_desc_size = self._data.get("report_desc_size", len(report_desc))
-
-            buf.extend(struct.pack(">H", id))
-            buf.extend(struct.pack(">H", vendor_id))
-            buf.extend(struct.pack(">H", product_id))
-
-            name_bytes = name.encode("utf-8")[:127]
-            buf.append(len(name_bytes))
-            buf.extend(name_bytes)
-
-            buf.extend(struct.pack(">H", report_desc_size))
-            buf.extend(report_desc)
-
-        elif self.type == ControlMessageType.UHID_INPUT:
-            id = self._data.get("id", 0)
-            data = self._data.get("data", b"")
-            size = self._data.get("size", len(data))
-
-            buf.extend(struct.pack(">H", id))
-            buf.extend(struct.pack(">H", size))
-            buf.extend(data)
-
-        elif self.type == ControlMessageType.UHID_DESTROY:
-            id = self._data.get("id", 0)
-            buf.extend(struct.pack(">H", id))
-
-        elif self.type == ControlMessageType.START_APP:
-            buf.append(self.type)  # Don't forget the type byte!
-            name = self._data.get("name", "")
-            name_bytes = name.encode("utf-8")[:255]
-            buf.extend(struct.pack(">B", len(name_bytes)))  # 1 byte length
-            buf.extend(name_bytes)
-
-        elif self.type in [
-            ControlMessageType.EXPAND_NOTIFICATION_PANEL,
-            ControlMessageType.EXPAND_SETTINGS_PANEL,
-            ControlMessageType.COLLAPSE_PANELS,
-            ControlMessageType.ROTATE_DEVICE,
-            ControlMessageType.OPEN_HARD_KEYBOARD_SETTINGS,
-            ControlMessageType.RESET_VIDEO,
-            ControlMessageType.GET_APP_LIST,  # Empty message: only type byte
-            # Media stream control (network mode) - all empty messages
-            ControlMessageType.REQUEST_VIDEO_FRAME,
-            ControlMessageType.START_VIDEO,
-            ControlMessageType.STOP_VIDEO,
-            ControlMessageType.START_AUDIO,
-            ControlMessageType.STOP_AUDIO,
-        ]:
-            # Empty messages: only type byte, no additional data
-            buf.append(self.type)
-
-        elif self.type == ControlMessageType.SCREENSHOT:
-            # Screenshot message: type byte + quality byte
-            buf.append(self.type)
-            quality = self._data.get("quality", 75)
-            # Clamp quality to 1-100
-            quality = max(1, min(100, quality))
-            buf.append(quality)
-
-        elif self.type == ControlMessageType.PING:
-            buf.append(self.type)
-            timestamp = self._data.get("timestamp", 0)
-            buf.extend(struct.pack(">Q", timestamp))
-
-        elif self.type == ControlMessageType.OPEN_FILE_CHANNEL:
-            # Empty message, only type byte
-            buf.append(self.type)
+        Lets the sender write a drained batch with one sendall().
 
-        else:
-            logger.warning(f"Unknown message type: {self.type}")
+        Args:
+            msgs: Control messages, in send order
 
-        return bytes(buf)
+        Returns:
+            Concatenated serialized messages
+        """
+        return b"".join([msg.serialize() for msg in msgs])
 
     def is_droppable(self) -> bool:
         """
@@ -495,10 +459,7 @@ class ControlMessage:
         Returns:
             True if message can be dropped, False otherwise
         """
-        return self.type not in [
-            ControlMessageType.UHID_CREATE,
-            ControlMessageType.UHID_DESTROY,
-        ]
+        return self._droppable
 
     def __str__(self) -> str:
         """String representation of the control message."""
@@ -509,30 +470,30 @@ class ControlMessage:
         )
 
         if self.type == ControlMessageType.INJECT_KEYCODE:
-            action = self._data.get("action", KeyEventAction.DOWN).name
-            keycode = self._data.get("keycode", 0)
+            action = getattr(self.action, "name", self.action)
+            keycode = self.keycode
             return f"ControlMessage(INJECT_KEYCODE, action={action}, keycode={keycode})"
 
         elif self.type == ControlMessageType.INJECT_TEXT:
-            text = self._data.get("text", "")
+            text = self.text
             return f"ControlMessage(INJECT_TEXT, text='{text[:20]}...')"
 
         elif self.type == ControlMessageType.INJECT_TOUCH_EVENT:
-            action = self._data.get("action", MotionEventAction.DOWN).name
-            x = self._data.get("position_x", 0)
-            y = self._data.get("position_y", 0)
+            action = getattr(self.action, "name", self.action)
+            x = self.position_x
+            y = self.position_y
             return f"ControlMessage(INJECT_TOUCH_EVENT, action={action}, pos=({x},{y}))"
 
         elif self.type == ControlMessageType.INJECT_SCROLL_EVENT:
-            x = self._data.get("position_x", 0)
-            y = self._data.get("position_y", 0)
-            hscroll = self._data.get("hscroll", 0.0)
-            vscroll = self._data.get("vscroll", 0.0)
+            x = self.position_x
+            y = self.position_y
+            hscroll = self.hscroll
+            vscroll = self.vscroll
             return f"ControlMessage(INJECT_SCROLL_EVENT, pos=({x},{y}), scroll=({hscroll},{vscroll}))"
 
         elif self.type == ControlMessageType.SET_CLIPBOARD:
-            text = self._data.get("text", "")
-            paste = self._data.get("paste", False)
+            text = self.text
+            paste = self.paste
             return (
                 f"ControlMessage(SET_CLIPBOARD, text='{text[:20]}...', paste={paste})"
             )
@@ -540,10 +501,169 @@ class ControlMessage:
         return f"ControlMessage({type_name})"
 
 
+def _serialize_keycode(msg: ControlMessage) -> bytes:
+    return _KEYCODE_STRUCT.pack(
+        msg.type,
+        msg.action,
+        msg.keycode,
+        msg.repeat,
+        msg.metastate,
+    )
+
+
+def _serialize_text(msg: ControlMessage) -> bytes:
+    text_bytes = msg.text_bytes
+    return _TEXT_HEADER_STRUCT.pack(msg.type, len(text_bytes)) + text_bytes
+
+
+def _serialize_touch(msg: ControlMessage) -> bytes:
+    return _TOUCH_STRUCT.pack(
+        msg.type,
+        msg.action,
+        msg.pointer_id & 0xFFFFFFFFFFFFFFFF,
+        msg.position_x,
+        msg.position_y,
+        msg.screen_width,
+        msg.screen_height,
+        msg.pressure_u16,
+        msg.action_button,
+        msg.buttons,
+    )
+
+
+def _serialize_scroll(msg: ControlMessage) -> bytes:
+    return _SCROLL_STRUCT.pack(
+        msg.type,
+        msg.position_x,
+        msg.position_y,
+        msg.screen_width,
+        msg.screen_height,
+        msg.hscroll_i16,
+        msg.vscroll_i16,
+        msg.buttons,
+    )
+
+
+def _serialize_back_or_screen_on(msg: ControlMessage) -> bytes:
+    cached = _BACK_OR_SCREEN_ON_MESSAGES.get(msg.action)
+    if cached is not None:
+        return cached
+    return _TYPE_BYTE_STRUCT.pack(msg.type, msg.action)
+
+
+def _serialize_get_clipboard(msg: ControlMessage) -> bytes:
+    cached = _GET_CLIPBOARD_MESSAGES.get(msg.copy_key)
+    if cached is not None:
+        return cached
+    return _TYPE_BYTE_STRUCT.pack(msg.type, msg.copy_key)
+
+
+def _serialize_set_clipboard(msg: ControlMessage) -> bytes:
+    text_bytes = msg.text_bytes
+    return _SET_CLIPBOARD_HEADER_STRUCT.pack(
+        msg.type,
+        msg.sequence,
+        1 if msg.paste else 0,
+        len(text_bytes),
+    ) + text_bytes
+
+
+def _serialize_display_power(msg: ControlMessage) -> bytes:
+    return _DISPLAY_POWER_MESSAGES[1 if msg.on else 0]
+
+
+def _serialize_uhid_create(msg: ControlMessage) -> bytes:
+    report_desc = msg.report_desc
+    name_bytes = msg.name
+    if isinstance(name_bytes, str):
+        name_bytes = _encode_truncated(name_bytes, 127)
+    else:
+        name_bytes = name_bytes[:127]
+
+    return b"".join((
+        _UHID_CREATE_HEADER_STRUCT.pack(
+            msg.type, msg.id, msg.vendor_id, msg.product_id, len(name_bytes)
+        ),
+        name_bytes,
+        _U16_STRUCT.pack(len(report_desc)),
+        report_desc,
+    ))
+
+
+def _serialize_uhid_input(msg: ControlMessage) -> bytes:
+    data = msg.data
+    return _UHID_INPUT_HEADER_STRUCT.pack(msg.type, msg.id, len(data)) + data
+
+
+def _serialize_uhid_destroy(msg: ControlMessage) -> bytes:
+    return _UHID_DESTROY_STRUCT.pack(msg.type, msg.id)
+
+
+def _serialize_start_app(msg: ControlMessage) -> bytes:
+    name_bytes = _encode_truncated(msg.name, 255)
+    return _TYPE_BYTE_STRUCT.pack(msg.type, len(name_bytes)) + name_bytes  # 1 byte length
+
+
+def _serialize_empty(msg: ControlMessage) -> bytes:
+    # Empty messages: only type byte, no additional data
+    return _EMPTY_MESSAGES[msg.type]
+
+
+def _serialize_screenshot(msg: ControlMessage) -> bytes:
+    # Screenshot message: type byte + quality byte (clamped to 1-100)
+    return _TYPE_BYTE_STRUCT.pack(msg.type, max(1, min(100, msg.quality)))
+
+
+def _serialize_ping(msg: ControlMessage) -> bytes:
+    return _PING_STRUCT.pack(msg.type, msg.timestamp)
+
+
+# Messages whose bytes depend only on the type and a small argument are
+# serialized once here; the serializers return these shared bytes objects
+_EMPTY_MESSAGES = {msg_type: bytes((msg_type,)) for msg_type in _EMPTY_MESSAGE_TYPES}
+_BACK_OR_SCREEN_ON_MESSAGES = {
+    action: _TYPE_BYTE_STRUCT.pack(ControlMessageType.BACK_OR_SCREEN_ON, action)
+    for action in KeyEventAction
+}
+_GET_CLIPBOARD_MESSAGES = {
+    copy_key: _TYPE_BYTE_STRUCT.pack(ControlMessageType.GET_CLIPBOARD, copy_key)
+    for copy_key in CopyKey
+}
+_DISPLAY_POWER_MESSAGES = (
+    _TYPE_BYTE_STRUCT.pack(ControlMessageType.SET_DISPLAY_POWER, 0),
+    _TYPE_BYTE_STRUCT.pack(ControlMessageType.SET_DISPLAY_POWER, 1),
+)
+
+# Message type -> serializer, used by ControlMessage.serialize()
+_SERIALIZERS = {
+    ControlMessageType.INJECT_KEYCODE: _serialize_keycode,
+    ControlMessageType.INJECT_TEXT: _serialize_text,
+    ControlMessageType.INJECT_TOUCH_EVENT: _serialize_touch,
+    ControlMessageType.INJECT_SCROLL_EVENT: _serialize_scroll,
+    ControlMessageType.BACK_OR_SCREEN_ON: _serialize_back_or_screen_on,
+    ControlMessageType.GET_CLIPBOARD: _serialize_get_clipboard,
+    ControlMessageType.SET_CLIPBOARD: _serialize_set_clipboard,
+    ControlMessageType.SET_DISPLAY_POWER: _serialize_display_power,
+    ControlMessageType.UHID_CREATE: _serialize_uhid_create,
+    ControlMessageType.UHID_INPUT: _serialize_uhid_input,
+    ControlMessageType.UHID_DESTROY: _serialize_uhid_destroy,
+    ControlMessageType.START_APP: _serialize_start_app,
+    ControlMessageType.SCREENSHOT: _serialize_screenshot,
+    ControlMessageType.PING: _serialize_ping,
+}
+_SERIALIZERS.update(dict.fromkeys(_EMPTY_MESSAGE_TYPES, _serialize_empty))
+
+
 class ControlMessageQueue:
     """
     Thread-safe queue for managing control messages.
 
+    Any number of producers may put() (GUI input, client API calls, the
+    heartbeat thread), so the queue stays lock-based rather than an SPSC
+    ring. There is a single consumer (the controller thread), and it only
+    waits when the queue is empty, so put() notifies only on the empty to
+    non-empty transition.
+
     Based on official scrcpy controller queue design:
     - 64 slots total (60 droppable + 4 non-droppable)
     - Droppable messages can be dropped when queue is full
@@ -568,6 +688,9 @@ class ControlMessageQueue:
         self._cond = threading.Condition(self._lock)
         self._max_droppable = max_droppable
         self._dropped_count = 0
+        # Droppable messages currently queued (the rest are non-droppable),
+        # maintained on every append/remove so put() never counts
+        self._droppable_count = 0
 
     @property
     def _max_size(self) -> int:
@@ -581,7 +704,8 @@ class ControlMessageQueue:
         Add a message to the queue.
 
         Queue behavior (per official scrcpy):
-        - Droppable messages: limited to 60 slots, drop oldest if full
+        - Droppable messages: limited to 60 slots, drop oldest droppable
+          message if full
         - Non-droppable messages (UHID_CREATE/DESTROY): always enqueued,
           queue expands if needed
 
@@ -589,34 +713,56 @@ class ControlMessageQueue:
             msg: Control message to add
 
         Returns:
-            True if message was added, False only if critical error
+            True if message was added
         """
         with self._lock:
-            if msg.is_droppable():
+            if msg._droppable:
                 # Droppable message: enforce 60-slot limit
-                while len(self._queue) >= self._max_droppable:
-                    # Check if we can drop the oldest message
-                    if self._queue[0].is_droppable():
-                        self._queue.popleft()
-                        self._dropped_count += 1
-                        logger.debug(
-                            f"Dropped droppable control message (total dropped: {self._dropped_count})"
-                        )
-                    else:
-                        # Queue full of non-droppable messages, shouldn't happen
-                        logger.warning("Droppable queue full of non-droppable messages")
-                        return False
+                if self._droppable_count >= self._max_droppable:
+                    self._evict_oldest_droppable()
 
+                was_empty = not self._queue
                 self._queue.append(msg)
-                self._cond.notify_all()  # Wake up waiting threads
+                self._droppable_count += 1
+                if was_empty:
+                    self._cond.notify()  # Wake up the sender thread
                 return True
             else:
                 # Non-droppable message: always enqueue, expand queue if needed
+                was_empty = not self._queue
                 self._queue.append(msg)
-                logger.debug(f"Non-droppable message enqueued (queue size: {len(self._queue)})")
-                self._cond.notify_all()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Non-droppable message enqueued (queue size: {len(self._queue)})")
+                if was_empty:
+                    self._cond.notify()
                 return True
 
+    def _evict_oldest_droppable(self) -> None:
+        """Drop the oldest queued droppable message (lock must be held)."""
+        queue = self._queue
+        if queue[0]._droppable:
+            queue.popleft()
+        else:
+            # Non-droppable messages are rare and few, so the first
+            # droppable one is found within a couple of entries
+            for i, queued in enumerate(queue):
+                if queued._droppable:
+                    del queue[i]
+                    break
+        self._droppable_count -= 1
+        self._dropped_count += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Dropped droppable control message (total dropped: {self._dropped_count})"
+            )
+
+    def _popleft(self) -> ControlMessage:
+        """Remove the head message, keeping the droppable count (lock must be held)."""
+        msg = self._queue.popleft()
+        if msg._droppable:
+            self._droppable_count -= 1
+        return msg
+
     def get(self, timeout: Optional[float] = None) -> Optional[ControlMessage]:
         """
         Get a message from the queue.
@@ -628,15 +774,23 @@ class ControlMessageQueue:
             Control message or None if timeout
         """
         with self._cond:
-            if not self._queue and timeout is not None:
-                # Wait for message with timeout
-                if not self._cond.wait(timeout):
-                    return None
-                if self._queue:
-                    return self._queue.popleft()
+            if not self._queue and not self._cond.wait_for(lambda: self._queue, timeout):
                 return None
-            return self._queue.popleft()
-            return None
+            return self._popleft()
+
+    def drain(self, max_count: int = MAX_QUEUE_SIZE) -> list:
+        """
+        Remove and return the queued messages without waiting.
+
+        Args:
+            max_count: Maximum number of messages to take
+
+        Returns:
+            Messages in queue order (empty list if the queue is empty)
+        """
+        with self._lock:
+            count = min(len(self._queue), max_count)
+            return [self._popleft() for _ in range(count)]
 
     def peek(self) -> Optional[ControlMessage]:
         """
@@ -654,6 +808,7 @@ class ControlMessageQueue:
         """Clear all messages from the queue."""
         with self._lock:
             self._queue.clear()
+            self._droppable_count = 0
             self._dropped_count = 0
 
     def size(self) -> int:
@@ -663,8 +818,7 @@ class ControlMessageQueue:
         Returns:
             Number of messages
         """
-        with self._lock:
-            return len(self._queue)
+        return len(self._queue)  # len() of a deque is atomic, no lock needed
 
     def is_empty(self) -> bool:
         """
@@ -673,8 +827,7 @@ class ControlMessageQueue:
         Returns:
             True if queue is empty, False otherwise
         """
-        with self._lock:
-            return len(self._queue) == 0
+        return not self._queue
 
     def get_dropped_count(self) -> int:
         """
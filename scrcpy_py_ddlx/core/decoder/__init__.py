@@ -7,6 +7,7 @@ This package contains the decoder modules split from the original decoder.py:
 - delay_buffer: Single-frame delay buffer for minimal latency
 - exceptions: Decoder exception hierarchy
 - video: Video decoder for H.264, H.265, and AV1 codecs
+- yuv_convert: Optional libyuv fast path for YUV420P to RGB24 conversion
 - audio: Audio decoder for OPUS, AAC, FLAC, and RAW codecs
 """
 
@@ -110,9 +110,9 @@ def decoder_process_main(
 
             config_received = False
             max_wait = 5.0  # 5 seconds max
-            wait_start = time.time()
+            deadline = time.monotonic() + max_wait
 
-            while not config_received and time.time() - wait_start < max_wait:
+            while not config_received and time.monotonic() < deadline:
                 try:
                     packet, addr = sock.recvfrom(65536)
                     if len(packet) >= UDP_HEADER_SIZE:
@@ -8,12 +8,14 @@ scrcpy delay_buffer design for thread-safe frame updates with minimal latency.
 
 Features:
 - Event-driven notification (eliminates polling latency)
-- Single-frame buffer with consumed flag
-- Thread-safe with Condition variable
+- Single-frame buffer: a deque(maxlen=1) slot holds the unconsumed frame
+- Lock-free push/consume (deque append/popleft are atomic); the Condition
+  is only taken when a consumer is actually waiting
 """
 
 import logging
 import time
+from collections import deque
 from threading import Lock, Condition
 from typing import Optional, Tuple, NamedTuple, Callable
 
@@ -41,23 +43,34 @@ class DelayBuffer:
     Single-frame delay buffer with event-driven notification.
 
     Official scrcpy uses a single-frame buffer with tmp_frame for atomic swap.
-    This prevents tearing and ensures thread-safe frame updates.
+    Here the swap is a reference assignment of an immutable FrameWithMetadata,
+    so no tmp_frame is needed; the decoder never writes to a published frame,
+    which prevents tearing.
 
-    Enhanced with Condition variable for event-driven consumption,
-    eliminating fixed polling latency.
+    The unconsumed frame lives in a deque(maxlen=1): append() atomically
+    evicts an unconsumed predecessor and popleft() consumes at most once, so
+    push() and consume() need no lock. wait_for_frame() registers itself as
+    a waiter under the Condition, and push() only takes the Condition to
+    notify when a waiter is registered.
 
     Based on: scrcpy/app/src/frame_buffer.c
     """
 
+    __slots__ = ('_pending_frame', '_slot', '_waiters', '_lock', '_condition', '_frame_ready_signal')
+
+    _pending_frame: Optional[FrameWithMetadata]
+    _slot: deque
+    _waiters: int
+    _lock: Lock
+    _condition: Condition
+
     def __init__(self):
         """Initialize an empty delay buffer with event notification."""
-        self._pending_frame: Optional[FrameWithMetadata] = None  # Current pending frame with metadata
-        self._tmp_frame = None          # Temporary frame for atomic swap (equivalent to tmp_frame)
-        self._consumed = True           # Track if frame has been consumed
+        self._pending_frame = None     # Latest frame, kept after consumption (get_nowait)
+        self._slot = deque(maxlen=1)   # Latest frame until consumed
+        self._waiters = 0              # Consumers blocked in wait_for_frame()
         self._lock = Lock()
         self._condition = Condition(self._lock)  # Event-driven notification
-        self._lock_wait_count = 0  # Track lock contention
-        self._total_lock_wait_time = 0.0  # Total time spent waiting for lock
 
         # Event-driven rendering: signal object (set by set_frame_ready_signal)
         self._frame_ready_signal = None
@@ -68,8 +81,8 @@ class DelayBuffer:
         Push a frame to the buffer and notify waiting consumers.
 
         CRITICAL: Direct assignment (no tmp_frame copy).
-        consume() returns a copy, so we don't need to copy here.
-        This minimizes copying to only where necessary.
+        consume() hands out this same FrameWithMetadata, so a frame is
+        published by reference swap and never copied by the buffer.
 
         Args:
             frame: Frame to push (numpy array or any object)
@@ -84,22 +97,25 @@ class DelayBuffer:
         Returns:
             Tuple of (success, previous_skipped)
         """
-        with self._condition:
-            # Check if previous frame was consumed BEFORE replacing
-            previous_skipped = not self._consumed
-
-            # Direct assignment (consume() will make a copy for the renderer)
-            self._pending_frame = FrameWithMetadata(
-                frame=frame, packet_id=packet_id, pts=pts,
-                capture_time=capture_time, udp_recv_time=udp_recv_time,
-                send_time_ns=send_time_ns, width=width, height=height
-            )
+        # Direct assignment (consume() returns this reference as-is)
+        pending = FrameWithMetadata(
+            frame=frame, packet_id=packet_id, pts=pts,
+            capture_time=capture_time, udp_recv_time=udp_recv_time,
+            send_time_ns=send_time_ns, width=width, height=height
+        )
+        self._pending_frame = pending
 
-            # Reset consumed flag to indicate new frame is available
-            self._consumed = False
+        # Previous frame still unconsumed -> it is evicted by append()
+        # (a consumer racing with this check only makes the statistic approximate)
+        previous_skipped = len(self._slot) == 1
+        self._slot.append(pending)
 
-            # Notify waiting consumer (event-driven, eliminates polling latency)
-            self._condition.notify()
+        # Notify waiting consumer (event-driven, eliminates polling latency).
+        # The slot is filled before _waiters is read, and a waiter registers
+        # before checking the slot, so a wakeup cannot be missed.
+        if self._waiters:
+            with self._condition:
+                self._condition.notify()
 
         # EVENT-DRIVEN RENDERING: Emit signal to notify GUI thread
         if self._frame_ready_signal is not None:
@@ -138,34 +154,24 @@ class DelayBuffer:
         Returns:
             FrameWithMetadata if available, None if timeout
         """
+        # Hand out the published tuple itself - NO COPY HERE!
+        # The decoder allocates new RGB arrays and NV12 planes per frame, so
+        # the consumer owns the frame
+        pending = self.consume()
+        if pending is not None:
+            return pending
+
         with self._condition:
-            # Wait for notification if no frame available
-            if self._consumed or self._pending_frame is None:
-                self._condition.wait(timeout)
-
-            # Check again after wait
-            if self._consumed or self._pending_frame is None:
-                return None
-
-            # Get frame reference and metadata - NO COPY HERE!
-            # The caller must process the frame quickly before decoder overwrites it
-            raw_frame = self._pending_frame.frame
-            packet_id = self._pending_frame.packet_id
-            pts = self._pending_frame.pts
-            capture_time = self._pending_frame.capture_time
-            udp_recv_time = self._pending_frame.udp_recv_time
-            width = self._pending_frame.width
-            height = self._pending_frame.height
-
-            # Mark as consumed immediately
-            self._consumed = True
-
-        # Return frame reference (caller must handle it quickly)
-        return FrameWithMetadata(
-            frame=raw_frame, packet_id=packet_id, pts=pts,
-            capture_time=capture_time, udp_recv_time=udp_recv_time,
-            width=width, height=height
-        )
+            self._waiters += 1
+            try:
+                # Wait for notification if no frame available
+                if not self._slot:
+                    self._condition.wait(timeout)
+            finally:
+                self._waiters -= 1
+
+        # Check again after wait
+        return self.consume()
 
     def consume(self) -> Optional[FrameWithMetadata]:
         """
@@ -177,27 +183,12 @@ class DelayBuffer:
         Returns:
             FrameWithMetadata with frame reference, or None if buffer is empty
         """
-        with self._condition:
-            if self._consumed or self._pending_frame is None:
-                return None
-
-            # Get frame reference and metadata - NO COPY
-            raw_frame = self._pending_frame.frame
-            packet_id = self._pending_frame.packet_id
-            pts = self._pending_frame.pts
-            capture_time = self._pending_frame.capture_time
-            udp_recv_time = self._pending_frame.udp_recv_time
-            width = self._pending_frame.width
-            height = self._pending_frame.height
-
-            # Mark as consumed immediately
-            self._consumed = True
-
-        return FrameWithMetadata(
-            frame=raw_frame, packet_id=packet_id, pts=pts,
-            capture_time=capture_time, udp_recv_time=udp_recv_time,
-            width=width, height=height
-        )
+        # Hand out the published tuple itself - NO COPY.
+        # popleft() is atomic, so each frame is consumed at most once.
+        try:
+            return self._slot.popleft()
+        except IndexError:
+            return None
 
     def pop(self) -> Optional:
         """
@@ -215,23 +206,22 @@ class DelayBuffer:
         """
         Get the current frame without waiting or marking as consumed.
 
+        Lock-free: reading one attribute is atomic in CPython, and push()
+        publishes a complete FrameWithMetadata in a single assignment.
+
         Returns:
             The current frame, or None if buffer is empty
         """
-        with self._lock:
-            return self._pending_frame
+        return self._pending_frame
 
     def clear(self) -> None:
         """Clear the buffer."""
-        with self._lock:
-            self._pending_frame = None
-            self._tmp_frame = None
-            self._consumed = True
+        self._slot.clear()
+        self._pending_frame = None
 
     def is_empty(self) -> bool:
-        """Check if buffer is empty."""
-        with self._lock:
-            return self._pending_frame is None
+        """Check if buffer is empty (lock-free, see get_nowait())."""
+        return self._pending_frame is None
 
     def qsize(self) -> int:
         """
@@ -240,8 +230,8 @@ class DelayBuffer:
         Returns:
             0 if empty, 1 if has frame
         """
-        with self._lock:
-            return 1 if self._pending_frame is not None else 0
+        # Lock-free, see get_nowait()
+        return 0 if self._pending_frame is None else 1
 
     def has_new_frame(self) -> bool:
         """
@@ -250,5 +240,4 @@ class DelayBuffer:
         Returns:
             True if there is a frame that hasn't been consumed yet
         """
-        with self._lock:
-            return self._pending_frame is not None and not self._consumed
+        return len(self._slot) == 1
@@ -11,12 +11,15 @@ Supports hardware-accelerated decoding via NVIDIA CUVID/NVDEC, Intel QSV, etc.
 
 import logging
 import os
+import sys
+from collections import deque
 from queue import Queue
 import threading
 import time
 from typing import Optional, Tuple, List
 
 import av
+from av.video.reformatter import VideoReformatter
 import numpy as np
 
 try:
@@ -32,7 +35,9 @@ ZERO_COPY_GPU_ENABLED = os.environ.get('SCRCPY_ZERO_COPY_GPU', '0') == '1'
 
 from .delay_buffer import DelayBuffer
 from .exceptions import CodecNotSupportedError, DecodeError, DecoderInitializationError
+from .yuv_convert import LIBYUV_AVAILABLE, yuv420p_to_rgb24
 from ..protocol import CodecId, codec_id_to_string
+from ..demuxer.packet_queue import VideoPacketQueue
 from ..stream import VideoPacket
 
 
@@ -42,19 +47,40 @@ logger = logging.getLogger(__name__)
 # Default decoder parameters
 DEFAULT_THREAD_SAFE: bool = True  # Enable thread-safe decoding
 DEFAULT_HW_ACCEL: bool = True     # Enable hardware acceleration by default
+MAX_SLICE_THREADS: int = 4        # Upper bound for default H.265/AV1 slice threads
+# Log one line per this many frames replaced in the DelayBuffer before display
+DROP_LOG_INTERVAL: int = 100
+# Decoder thread scheduling: "normal", "high" or "realtime"
+DEFAULT_PRIORITY: str = "normal"
 
 
 __all__ = ["VideoDecoder", "SimpleDecoder", "decode_packet"]
 
 
+# Hardware probing results, filled on first use. Probing opens a codec
+# context per candidate, so it is done once per process instead of on every
+# decoder (re)initialization (e.g. each device rotation).
+_hw_device_type_cache: dict = {}
+_decoder_name_cache: dict = {}
+
+
 def _detect_best_hw_device_type() -> Optional[str]:
     """
     Detect the best hardware device type for the current system.
 
+    The result is cached for the lifetime of the process.
+
     Returns:
         Device type string (e.g., "cuda", "qsv", "d3d11va", "vaapi", "videotoolbox")
         or None if no hardware acceleration is available.
     """
+    if "device_type" not in _hw_device_type_cache:
+        _hw_device_type_cache["device_type"] = _probe_hw_device_type()
+    return _hw_device_type_cache["device_type"]
+
+
+def _probe_hw_device_type() -> Optional[str]:
+    """Probe the hardware device types, in platform priority order."""
     import platform
 
     # Priority order for each platform
@@ -121,6 +147,8 @@ def _select_best_decoder(codec_id: int, hw_accel: bool = True) -> str:
     """
     Select the best decoder for the given codec.
 
+    The selection is cached per (codec_id, hw_accel).
+
     Args:
         codec_id: Codec ID (CodecId.H264, CodecId.H265, or CodecId.AV1)
         hw_accel: Whether to use hardware acceleration
@@ -128,6 +156,15 @@ def _select_best_decoder(codec_id: int, hw_accel: bool = True) -> str:
     Returns:
         Decoder name string
     """
+    key = (codec_id, hw_accel)
+    name = _decoder_name_cache.get(key)
+    if name is None:
+        name = _decoder_name_cache[key] = _probe_decoder(codec_id, hw_accel)
+    return name
+
+
+def _probe_decoder(codec_id: int, hw_accel: bool) -> str:
+    """Probe hardware decoders for the codec, falling back to software."""
     import platform
 
     # Base codec name
@@ -163,6 +200,53 @@ def _select_best_decoder(codec_id: int, hw_accel: bool = True) -> str:
     return base
 
 
+def _raise_current_thread_priority(priority: str) -> bool:
+    """
+    Raise the scheduling priority of the calling thread.
+
+    "high" lowers the thread's nice value (Linux) or uses
+    THREAD_PRIORITY_ABOVE_NORMAL (Windows). "realtime" requests SCHED_FIFO
+    (Linux, needs CAP_SYS_NICE) or THREAD_PRIORITY_HIGHEST (Windows).
+
+    Args:
+        priority: "normal", "high" or "realtime"
+
+    Returns:
+        True if the priority was changed, False otherwise
+    """
+    if priority == "normal":
+        return False
+    if priority not in ("high", "realtime"):
+        logger.warning(f"Unknown decoder priority: {priority}")
+        return False
+
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            # THREAD_PRIORITY_ABOVE_NORMAL = 1, THREAD_PRIORITY_HIGHEST = 2
+            level = 2 if priority == "realtime" else 1
+            if not kernel32.SetThreadPriority(kernel32.GetCurrentThread(), level):
+                logger.warning("SetThreadPriority failed for decoder thread")
+                return False
+        elif sys.platform.startswith("linux"):
+            # On Linux, pid 0 / the native thread id address only this thread
+            if priority == "realtime":
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+            else:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -5)
+        else:
+            logger.info(f"Decoder thread priority '{priority}' not supported on {sys.platform}")
+            return False
+    except (OSError, AttributeError) as e:
+        # Raising priority usually needs CAP_SYS_NICE / root
+        logger.warning(f"Could not set decoder thread priority '{priority}': {e}")
+        return False
+
+    logger.info(f"Decoder thread priority set to '{priority}'")
+    return True
+
+
 class VideoDecoder:
     """
     Video decoder for scrcpy streams using PyAV.
@@ -191,6 +275,9 @@ class VideoDecoder:
         hw_accel: bool = DEFAULT_HW_ACCEL,
         shm_writer: Optional["SimpleSHMWriter"] = None,
         output_nv12: bool = False,
+        thread_count: Optional[int] = None,
+        thread_type: Optional[str] = None,
+        priority: str = DEFAULT_PRIORITY,
     ) -> None:
         """
         Initialize the video decoder.
@@ -205,6 +292,12 @@ class VideoDecoder:
             hw_accel: Enable hardware acceleration (default: True)
             shm_writer: Optional SimpleSHMWriter for direct frame output (bypasses DelayBuffer)
             output_nv12: Output NV12 format instead of RGB (for GPU YUV rendering, default: False)
+            thread_count: Software decoder threads (default: min(4, cpu_count) for
+                         H.265/AV1, 1 for H.264)
+            thread_type: Software decoder threading mode, "SLICE" or "FRAME"
+                        (default: "SLICE"; FRAME threading adds one frame of delay per thread)
+            priority: Decoder thread scheduling priority: "normal", "high" or
+                     "realtime" (default: "normal"; falls back to normal if not permitted)
 
         Raises:
             CodecNotSupportedError: If the codec is not supported
@@ -215,6 +308,9 @@ class VideoDecoder:
         self._thread_safe = thread_safe
         self._hw_accel = hw_accel
         self._using_hw_decoder = False
+        self._thread_count = thread_count
+        self._thread_type = thread_type
+        self._priority = priority
 
         # PyAV HWAccel context (for GPU decoding)
         self._hwaccel: Optional["HWAccel"] = None
@@ -233,12 +329,9 @@ class VideoDecoder:
         # Output format: NV12 for GPU rendering, RGB for CPU rendering
         self._output_nv12 = output_nv12
 
-        # Pre-allocated buffers for NV12 (avoid per-frame allocation)
-        self._y_buffer: Optional[np.ndarray] = None
-        self._u_buffer: Optional[np.ndarray] = None
-        self._v_buffer: Optional[np.ndarray] = None
-        self._buffer_width: int = 0
-        self._buffer_height: int = 0
+        # Persistent reformatter: keeps its swscale context across frames
+        # (frame.reformat() creates a new one on every call)
+        self._reformatter = VideoReformatter()
 
         # Threading primitives
         self._lock = threading.Lock() if thread_safe else None
@@ -252,7 +345,10 @@ class VideoDecoder:
         # ULTRA LOW LATENCY: Use queue size of 1 for real-time video streaming
         # This ensures we always decode the latest frame, never accumulate old packets
         # Trade-off: May lose packets if decoder can't keep up, but latency is minimized
-        self._packet_queue: Queue = packet_queue if packet_queue is not None else Queue(maxsize=1)
+        self._packet_queue: Queue = packet_queue if packet_queue is not None else VideoPacketQueue(maxsize=1)
+        if isinstance(self._packet_queue, VideoPacketQueue):
+            # A drop that breaks the reference chain asks the server for a key frame
+            self._packet_queue.on_key_frame_needed = self._request_key_frame
 
         # Use DelayBuffer (single-frame buffer with drop policy) instead of Queue
         # This matches official scrcpy design for minimal latency
@@ -265,6 +361,10 @@ class VideoDecoder:
         # Track whether extradata has been set from config packet
         self._extradata_set = False
 
+        # Packets skipped by _drain_to_latest() while catching up with a backlog
+        self._backlog_dropped_count = 0
+        self._drop_log_countdown = DROP_LOG_INTERVAL  # Unconsumed frames replaced before next log
+
         # Debug: save first frame to file (disabled for production)
         self._frame_count = 0
         self._save_debug_frame = False  # Disabled - no longer needed
@@ -272,7 +372,8 @@ class VideoDecoder:
         # PTS Clock Drift Diagnostic: Track PTS vs wall clock timing
         self._last_pts = 0  # Last frame's PTS (nanoseconds)
         self._last_pts_wall_time = 0.0  # Wall clock time when last frame was decoded
-        self._pts_drift_samples = []  # List of (pts_delta_ns, wall_delta_ns, drift_ns)
+        # Recent (pts_delta_us, wall_delta_us, drift_us); deque evicts the oldest in O(1)
+        self._pts_drift_samples = deque(maxlen=30)
         self._first_pts = 0  # First PTS seen (for absolute timing analysis)
         self._first_pts_wall_time = 0.0  # Wall clock time of first frame
 
@@ -479,8 +580,18 @@ class VideoDecoder:
                 # AV_CODEC_FLAG2_FAST allows non-spec compliant speedup tricks
                 codec.flags2 |= 0x00000001  # AV_CODEC_FLAG2_FAST
 
-                # Additional low-latency settings
-                codec.thread_count = 1  # Single thread for minimal latency
+                # Slice threading splits each frame across threads without holding
+                # frames back, so it keeps LOW_DELAY semantics (frame threading does not).
+                # H.265/AV1 streams gain the most; H.264 stays single-threaded by default.
+                thread_count = self._thread_count
+                if thread_count is None:
+                    if self._codec_id in (CodecId.H265, CodecId.AV1):
+                        thread_count = min(MAX_SLICE_THREADS, os.cpu_count() or 1)
+                    else:
+                        thread_count = 1
+                codec.thread_type = self._thread_type or "SLICE"
+                codec.thread_count = thread_count
+                logger.info(f"Software decoder threads: {thread_count} ({codec.thread_type.name})")
             else:
                 # Hardware decoder settings
                 logger.info(f"Using hardware decoder: {codec_name}")
@@ -680,90 +791,27 @@ class VideoDecoder:
 
         Note:
             Config packets are handled internally but do not produce frames.
-
-        Smart Frame Handling:
-            For high-frame-rate content (games), drop old packets to minimize latency.
-            For low-frame-rate content (clocks), preserve unique PTS packets to avoid time jumps.
+            When the queue is a VideoPacketQueue (the default), a full queue
+            drops stale packets on GOP boundaries instead of rejecting this one.
         """
         if not self._running:
             logger.warning("Cannot push packet: decoder is not running")
             return
 
         try:
-            # Fast path: queue not full, just add
-            if not self._packet_queue.full():
-                self._packet_queue.put_nowait(packet)
-                return
-
-            # Queue is full, apply smart drop strategy
-            new_pts = packet.header.pts
-
-            # Peek at queue contents to make smart decision
-            # We need to drain and re-fill to inspect PTS values
-            temp_packets = []
-            has_same_pts = False
-            oldest_idx = 0
-            oldest_pts = None
-
-            while True:
-                try:
-                    old_packet = self._packet_queue.get_nowait()
-                    temp_packets.append(old_packet)
-                    # Track if we have packets with same PTS as incoming
-                    if old_packet.header.pts == new_pts:
-                        has_same_pts = True
-                    # Track oldest packet (by position, first is oldest in FIFO)
-                    if oldest_pts is None:
-                        oldest_pts = old_packet.header.pts
-                except:
-                    break
-
-            if not temp_packets:
-                # Queue was emptied unexpectedly
-                self._packet_queue.put_nowait(packet)
-                return
-
-            if has_same_pts:
-                # Drop ONE redundant packet (same PTS as incoming)
-                # This preserves unique PTS frames while making room
-                kept_one = False
-                for i, p in enumerate(temp_packets):
-                    if p.header.pts == new_pts and not kept_one:
-                        # Skip this one (drop redundant)
-                        if not hasattr(self, '_redundant_drop_count'):
-                            self._redundant_drop_count = 0
-                        self._redundant_drop_count += 1
-                        if self._redundant_drop_count <= 3 or self._redundant_drop_count % 100 == 0:
-                            logger.debug(f"[SMART_DROP] Dropped redundant packet (PTS={new_pts}, total={self._redundant_drop_count})")
-                    else:
-                        self._packet_queue.put_nowait(p)
-                self._packet_queue.put_nowait(packet)
-            elif new_pts > oldest_pts:
-                # New packet is NEWER than oldest in queue
-                # Normal progression, drop oldest to make room
-                if not hasattr(self, '_oldest_drop_count'):
-                    self._oldest_drop_count = 0
-                self._oldest_drop_count += 1
-                if self._oldest_drop_count <= 3 or self._oldest_drop_count % 100 == 0:
-                    logger.debug(f"[SMART_DROP] Dropped oldest packet (PTS {oldest_pts} -> {new_pts}, total={self._oldest_drop_count})")
-                # Re-queue all but the first (oldest)
-                for p in temp_packets[1:]:
-                    self._packet_queue.put_nowait(p)
-                self._packet_queue.put_nowait(packet)
-            else:
-                # New packet is NOT newer (out-of-order or same PTS)
-                # Drop the incoming packet, keep queue as-is
-                if not hasattr(self, '_outdated_drop_count'):
-                    self._outdated_drop_count = 0
-                self._outdated_drop_count += 1
-                if self._outdated_drop_count <= 3 or self._outdated_drop_count % 100 == 0:
-                    logger.debug(f"[SMART_DROP] Dropped outdated packet (PTS={new_pts} <= {oldest_pts}, total={self._outdated_drop_count})")
-                # Re-queue all original packets
-                for p in temp_packets:
-                    self._packet_queue.put_nowait(p)
+            self._packet_queue.put(packet, block=False)
+        except Exception as e:
+            logger.warning(f"Failed to push packet to queue: {e}")
 
+    def _request_key_frame(self, reason: str) -> None:
+        """Ask the server for a new key frame via the decode error callback (PLI)."""
+        callback = self._on_decode_error_callback
+        if callback is None:
+            return
+        try:
+            callback("packet_drop", reason)
         except Exception as e:
-            logger.debug(f"Failed to push packet to queue: {e}")
+            logger.warning(f"Key frame request failed: {e}")
 
     def _decode_loop(self) -> None:
         """
@@ -775,6 +823,7 @@ class VideoDecoder:
         from queue import Empty
 
         logger.debug("Decoder loop started")
+        _raise_current_thread_priority(self._priority)
 
         while self._running:
             try:
@@ -790,57 +839,12 @@ class VideoDecoder:
                     self._pause_event.wait()
                     continue
 
-                # Handle config packets - extract extradata
-                if packet.header.is_config:
-                    if self._codec_context is not None:
-                        old_extradata = self._codec_context.extradata
-                        is_update = old_extradata is not None and len(old_extradata) > 0
-
-                        # Check if config has changed (screen rotation)
-                        if is_update and old_extradata != packet.data:
-                            logger.info(f"Config changed, reinitializing decoder (screen rotation?)")
-                            # Reinitialize decoder with new config
-                            self._reinitialize_decoder(packet.data)
-                        else:
-                            # Just update extradata
-                            self._codec_context.extradata = packet.data
-                            self._extradata_set = True
-
-                            if is_update:
-                                logger.info(f"Updated codec extradata: {len(packet.data)} bytes")
-                            else:
-                                logger.info(f"Set codec extradata: {len(packet.data)} bytes")
-
-                        # Log first few bytes for debugging
-                        if len(packet.data) >= 4:
-                            logger.debug(f"Extradata prefix: {packet.data[:4].hex()}")
-                    # Config packet itself doesn't produce frames
-                    continue
-
-                # Latency tracking: record decode start
-                packet_id = packet.packet_id
-                if packet_id >= 0:
-                    try:
-                        from scrcpy_py_ddlx.latency_tracker import get_tracker
-                        get_tracker().record_decode_start(packet_id)
-                    except Exception:
-                        pass
-
-                # Track TRUE_E2E latency at decode start
-                decode_start_time = time.time()
-                if packet_id >= 0:
-                    try:
-                        from scrcpy_py_ddlx.latency_tracker import get_tracker
-                        udp_recv_time = get_tracker().get_udp_recv_time(packet_id)
-                        if udp_recv_time > 0:
-                            latency_so_far = (decode_start_time - udp_recv_time) * 1000
-                            if latency_so_far > 50:  # Log if > 50ms before decode starts
-                                logger.info(f"[DECODER] Packet #{packet_id}: latency before decode = {latency_so_far:.0f}ms, queue_size={self._packet_queue.qsize()}")
-                    except Exception:
-                        pass
-
-                # Decode the packet
-                self._decode_packet(packet, packet_id)
+                # Catch up with any backlog instead of letting latency accumulate
+                packets, stop = self._drain_to_latest(packet)
+                for packet in packets:
+                    self._process_packet(packet)
+                if stop:
+                    break
 
             except Empty:
                 # Queue timeout is normal - no packets available yet
@@ -853,6 +857,120 @@ class VideoDecoder:
 
         logger.debug("Decoder loop finished")
 
+    def _drain_to_latest(self, packet: VideoPacket) -> Tuple[List[VideoPacket], bool]:
+        """
+        Take every packet already queued behind packet, skipping stale frames.
+
+        When the decoder has fallen behind, packets before the newest key
+        frame in the backlog are dropped: the key frame resets the reference
+        chain, so nothing after it depends on them. Config packets are always
+        kept. Without a key frame in the backlog every packet must be decoded.
+
+        Args:
+            packet: Packet just taken from the queue
+
+        Returns:
+            Tuple of (packets to decode in order, stop signal received)
+        """
+        from queue import Empty
+
+        packets = [packet]
+        stop = False
+        while True:
+            try:
+                newer = self._packet_queue.get_nowait()
+            except Empty:
+                break
+            if newer is None:
+                stop = True
+                break
+            packets.append(newer)
+
+        if len(packets) == 1:
+            return packets, stop
+
+        last_key = -1
+        for i in range(len(packets) - 1, 0, -1):
+            header = packets[i].header
+            if header.is_key_frame and not header.is_config:
+                last_key = i
+                break
+        if last_key <= 0:
+            return packets, stop
+
+        kept = [p for p in packets[:last_key] if p.header.is_config]
+        dropped = last_key - len(kept)
+        kept.extend(packets[last_key:])
+
+        previous = self._backlog_dropped_count
+        self._backlog_dropped_count += dropped
+        # Log the first skip, then about every 100 skipped packets
+        if previous == 0 or previous // 100 != self._backlog_dropped_count // 100:
+            logger.info(
+                f"[DECODER] Skipped {dropped} stale packets up to the latest key frame "
+                f"(total={self._backlog_dropped_count})"
+            )
+        return kept, stop
+
+    def _process_packet(self, packet: VideoPacket) -> None:
+        """
+        Handle one packet: update extradata for config packets, decode others.
+
+        Args:
+            packet: The video packet to process
+        """
+        # Handle config packets - extract extradata
+        if packet.header.is_config:
+            if self._codec_context is not None:
+                old_extradata = self._codec_context.extradata
+                is_update = old_extradata is not None and len(old_extradata) > 0
+
+                # Check if config has changed (screen rotation)
+                if is_update and old_extradata != packet.data:
+                    logger.info(f"Config changed, reinitializing decoder (screen rotation?)")
+                    # Reinitialize decoder with new config
+                    self._reinitialize_decoder(packet.data)
+                else:
+                    # Just update extradata
+                    self._codec_context.extradata = packet.data
+                    self._extradata_set = True
+
+                    if is_update:
+                        logger.info(f"Updated codec extradata: {len(packet.data)} bytes")
+                    else:
+                        logger.info(f"Set codec extradata: {len(packet.data)} bytes")
+
+                # Log first few bytes for debugging
+                if len(packet.data) >= 4:
+                    logger.debug(f"Extradata prefix: {packet.data[:4].hex()}")
+            # Config packet itself doesn't produce frames
+            return
+
+        # Latency tracking: record decode start
+        packet_id = packet.packet_id
+        if packet_id >= 0:
+            try:
+                from scrcpy_py_ddlx.latency_tracker import get_tracker
+                get_tracker().record_decode_start(packet_id)
+            except Exception:
+                pass
+
+        # Track TRUE_E2E latency at decode start
+        decode_start_time = time.time()
+        if packet_id >= 0:
+            try:
+                from scrcpy_py_ddlx.latency_tracker import get_tracker
+                udp_recv_time = get_tracker().get_udp_recv_time(packet_id)
+                if udp_recv_time > 0:
+                    latency_so_far = (decode_start_time - udp_recv_time) * 1000
+                    if latency_so_far > 50:  # Log if > 50ms before decode starts
+                        logger.info(f"[DECODER] Packet #{packet_id}: latency before decode = {latency_so_far:.0f}ms, queue_size={self._packet_queue.qsize()}")
+            except Exception:
+                pass
+
+        # Decode the packet
+        self._decode_packet(packet, packet_id)
+
     def _decode_packet(self, packet: VideoPacket, packet_id: int = -1) -> None:
         """
         Decode a single video packet.
@@ -868,10 +986,11 @@ class VideoDecoder:
         Process ALL frames produced by the decoder (see scrcpy/app/src/decoder.c:51-71).
         The official code loops until avcodec_receive_frame() returns AVERROR(EAGAIN).
 
-        Note: PyAV < 10.0 uses decode() method, PyAV >= 10.0 uses send()/receive().
+        Note: PyAV does not expose send_packet()/receive_frame() on CodecContext;
+        decode() is its wrapper around that loop. Per-frame work is in _process_frame().
         """
         try:
-            # Create PyAV packet
+            # Create PyAV packet (wraps packet.data's buffer, no copy)
             av_packet = av.Packet(packet.data)
             av_packet.pts = packet.header.pts
             av_packet.dts = packet.header.pts
@@ -879,240 +998,16 @@ class VideoDecoder:
             packet_size = len(packet.data)
             is_key = packet.header.is_key_frame
 
-            # Log packet info
-            if is_key:
+            # Log packet info (the message is only formatted if INFO is enabled)
+            if is_key and logger.isEnabledFor(logging.INFO):
                 logger.info(
                     f"Decoding key frame: {packet_size} bytes, pts={packet.header.pts}"
                 )
 
-            # PyAV < 10.0: decode() accepts packet and returns frames
-            # This internally calls avcodec_send_packet() + avcodec_receive_frame() loop
+            # decode() runs the avcodec_send_packet() + avcodec_receive_frame() loop
+            # in C and returns every frame the packet produced (HEVC may yield 2-3)
             for frame in self._codec_context.decode(av_packet):
-                try:
-                    self._frame_count += 1
-
-                    # CRITICAL: Removed per-frame debug logging for performance
-                    # These logs severely impact performance at 60fps+
-                    # logger.debug(
-                    #     f"Decoded frame: {frame.width}x{frame.height}, "
-                    #     f"format={frame.format}, pts={frame.pts}"
-                    # )
-
-                    # Convert frame to output format (RGB or NV12)
-                    if self._output_nv12:
-                        # NV12 format for GPU YUV rendering (avoids CPU YUV→RGB conversion)
-
-                        # 实验性零拷贝GPU模式：检测GPU帧并跳过CPU传输
-                        if self._using_zero_copy and frame.format.name == 'cuda':
-                            # GPU帧：通过DLPack导出，零拷贝
-                            frame_data, frame_w, frame_h = self._frame_to_nv12_dict_gpu(frame)
-                        elif self._shm_writer is not None:
-                            # For SHM: return bytes format
-                            frame_data, frame_w, frame_h = self._frame_to_nv12(frame)
-                        else:
-                            # For DelayBuffer: return dict with separate Y/U/V planes
-                            frame_data, frame_w, frame_h = self._frame_to_nv12_dict(frame)
-
-                        # Debug logging (periodic)
-                        if self._frame_count <= 5 or self._frame_count % 60 == 0:
-                            if frame_data is not None:
-                                if isinstance(frame_data, dict):
-                                    if frame_data.get('is_gpu', False):
-                                        # GPU零拷贝模式
-                                        logger.info(f"[DECODER] NV12 GPU dict: y_gpu_shape={frame_data['y_gpu'].shape}, "
-                                                   f"uv_gpu_shape={frame_data['uv_gpu'].shape}")
-                                    else:
-                                        # CPU模式
-                                        logger.info(f"[DECODER] NV12 dict: y_shape={frame_data['y'].shape}, "
-                                                   f"u_shape={frame_data['u'].shape}, v_shape={frame_data['v'].shape}")
-                                else:
-                                    logger.info(f"[DECODER] NV12 bytes: size={len(frame_data)}, {frame_w}x{frame_h}")
-                            else:
-                                logger.error(f"[DECODER] NV12 conversion failed!")
-
-                        bgr_frame = None  # Not used in NV12 mode
-                    else:
-                        # RGB format for CPU rendering
-                        bgr_frame = self._frame_to_bgr(frame)
-                        frame_data = None  # Not used in RGB mode
-                        frame_w = frame.width
-                        frame_h = frame.height
-
-                    # Check if frame size changed (device rotation)
-                    # This handles race conditions where decoder reinitializes with old dimensions
-                    # before receiving frames with new dimensions
-                    if frame_w != self._width or frame_h != self._height:
-                        old_w, old_h = self._width, self._height
-                        self._width = frame_w
-                        self._height = frame_h
-                        self._shape = (frame_h, frame_w, 3)
-                        logger.info(
-                            f"[DECODER] Frame size changed: {old_w}x{old_h} -> {frame_w}x{frame_h}"
-                        )
-                        # Notify callback if set
-                        if self._frame_size_changed_callback:
-                            try:
-                                self._frame_size_changed_callback(frame_w, frame_h)
-                            except Exception as e:
-                                logger.warning(f"Frame size change callback error: {e}")
-
-                    # Latency tracking: record decode complete
-                    if packet_id >= 0:
-                        try:
-                            from scrcpy_py_ddlx.latency_tracker import get_tracker
-                            tracker = get_tracker()
-                            tracker.record_decode_complete(packet_id)
-                            # Also record shm_write as "frame ready" time
-                            # This represents when frame is ready for preview
-                            tracker.record_shm_write(packet_id)
-                        except Exception:
-                            pass
-
-                    # Put frame in delay buffer (single-frame, drops old frames)
-                    # Include PTS, capture time, and UDP recv time for end-to-end latency tracking
-                    import time as time_module
-                    capture_time = time_module.time()
-
-                    # Get PTS - prefer frame.pts if available, fall back to packet PTS
-                    # packet.header.pts is already in nanoseconds from device
-                    try:
-                        frame_pts_raw = frame.pts
-                        packet_pts_raw = packet.header.pts
-
-                        # Use frame.pts directly (it's already in nanoseconds for scrcpy)
-                        # The previous time_base conversion was incorrect for this codec
-                        pts = frame_pts_raw if frame_pts_raw is not None else packet_pts_raw
-
-                        # Diagnostic: Log PTS values for debugging
-                        if self._frame_count <= 10 or self._frame_count % 60 == 0:
-                            logger.info(
-                                f"[PTS_DEBUG] Frame #{self._frame_count}: "
-                                f"frame.pts={frame_pts_raw}, packet.pts={packet_pts_raw}, "
-                                f"using pts={pts}"
-                            )
-                    except Exception as e:
-                        pts = packet.header.pts
-                        if self._frame_count <= 10 or self._frame_count % 60 == 0:
-                            logger.warning(f"[PTS_DEBUG] Frame #{self._frame_count}: PTS error: {e}, using packet.pts={pts}")
-
-                    # PTS Clock Drift Diagnostic: Compare PTS delta vs wall clock delta
-                    # This detects if device clock and PC clock are synchronized
-                    # IMPORTANT: PTS from scrcpy device is in MICROSECONDS, not nanoseconds!
-                    if self._last_pts != 0:
-                        pts_delta_us = pts - self._last_pts  # PTS increment in MICROSECONDS
-                        wall_delta_us = int((capture_time - self._last_pts_wall_time) * 1e6)  # Wall clock increment in MICROSECONDS
-                        drift_us = pts_delta_us - wall_delta_us  # Positive = device clock faster
-
-                        # Store sample for periodic analysis
-                        self._pts_drift_samples.append((pts_delta_us, wall_delta_us, drift_us))
-
-                        # Log every 60 frames with analysis
-                        if self._frame_count % 60 == 0 and len(self._pts_drift_samples) >= 10:
-                            # Calculate average drift (PTS is in microseconds)
-                            avg_pts_delta_ms = sum(s[0] for s in self._pts_drift_samples[-30:]) / len(self._pts_drift_samples[-30:]) / 1e3  # us to ms
-                            avg_wall_delta_ms = sum(s[1] for s in self._pts_drift_samples[-30:]) / len(self._pts_drift_samples[-30:]) / 1e3  # us to ms
-                            avg_drift_ms = sum(s[2] for s in self._pts_drift_samples[-30:]) / len(self._pts_drift_samples[-30:]) / 1e3  # us to ms
-
-                            # Calculate cumulative drift from first frame (PTS is in MICROSECONDS)
-                            total_pts_us = pts - self._first_pts
-                            total_wall_us = int((capture_time - self._first_pts_wall_time) * 1e6)
-                            total_drift_ms = (total_pts_us - total_wall_us) / 1e3  # us to ms
-
-                            # Calculate expected frame interval (for 60fps = 16.67ms)
-                            expected_interval_ms = 1000.0 / 60  # Assume 60fps
-
-                            logger.info(
-                                f"[PTS_DRIFT] Frame #{self._frame_count}: "
-                                f"pts_delta={avg_pts_delta_ms:.1f}ms, "
-                                f"wall_delta={avg_wall_delta_ms:.1f}ms, "
-                                f"drift={avg_drift_ms:.2f}ms/frame, "
-                                f"total_drift={total_drift_ms:.0f}ms, "
-                                f"expected_interval={expected_interval_ms:.1f}ms"
-                            )
-
-                            # Warning if drift is significant (> 5ms per frame accumulates quickly)
-                            if abs(avg_drift_ms) > 5:
-                                logger.warning(
-                                    f"[PTS_DRIFT] SIGNIFICANT CLOCK DRIFT DETECTED! "
-                                    f"Device clock is {'faster' if avg_drift_ms > 0 else 'slower'} than PC clock. "
-                                    f"This may cause TRUE_E2E to be inaccurate."
-                                )
-
-                            # Clear old samples to prevent memory growth
-                            self._pts_drift_samples = self._pts_drift_samples[-60:]
-
-                    # Record first PTS for absolute timing analysis
-                    if self._first_pts == 0:
-                        self._first_pts = pts
-                        self._first_pts_wall_time = capture_time
-                        logger.info(f"[PTS_DRIFT] First frame: pts={pts}, wall_time={capture_time}")
-
-                    self._last_pts = pts
-                    self._last_pts_wall_time = capture_time
-
-                    # Get UDP recv time for TRUE end-to-end latency tracking
-                    udp_recv_time = 0.0
-                    send_time_ns = 0
-                    if packet_id >= 0:
-                        try:
-                            from scrcpy_py_ddlx.latency_tracker import get_tracker
-                            udp_recv_time = get_tracker().get_udp_recv_time(packet_id)
-                        except Exception:
-                            pass
-                    # Get device send time for full E2E latency tracking
-                    send_time_ns = getattr(packet, 'send_time_ns', 0)
-
-                    # CRITICAL DIAGNOSTIC: Log packet_id and UDP time relationship every 100 frames
-                    if self._frame_count % 100 == 0:
-                        import datetime as dt
-                        udp_time_str = dt.datetime.fromtimestamp(udp_recv_time).strftime('%H:%M:%S.%f')[:-3] if udp_recv_time > 0 else "N/A"
-                        capture_time_str = dt.datetime.fromtimestamp(capture_time).strftime('%H:%M:%S.%f')[:-3]
-                        logger.info(f"[DECODER] Frame #{self._frame_count}: packet_id={packet_id}, pts={pts}, UDP={udp_time_str}, CAPTURE={capture_time_str}")
-
-                    # Push to DelayBuffer for screenshot support (always, even with SHM)
-                    # This ensures screenshot() can get the latest frame
-                    if self._output_nv12 and frame_data is not None:
-                        # For Direct SHM mode: frame_data is bytes, wrap in dict for screenshot conversion
-                        if isinstance(frame_data, bytes):
-                            screenshot_frame = {
-                                'nv12_bytes': frame_data,
-                                'width': frame_w,
-                                'height': frame_h
-                            }
-                            success, previous_skipped = self._frame_buffer.push(screenshot_frame, packet_id, pts, capture_time, udp_recv_time, send_time_ns, self._width, self._height)
-                        else:
-                            # Already dict format (Y/U/V planes or GPU dict)
-                            success, previous_skipped = self._frame_buffer.push(frame_data, packet_id, pts, capture_time, udp_recv_time, send_time_ns, self._width, self._height)
-                    elif bgr_frame is not None:
-                        success, previous_skipped = self._frame_buffer.push(bgr_frame, packet_id, pts, capture_time, udp_recv_time, send_time_ns, self._width, self._height)
-                        # CRITICAL: Reduced frame drop logging for performance
-                        if previous_skipped and self._frame_count % 100 == 0:
-                            logger.debug(f"Frame drops detected (count={self._frame_count})")
-
-                    # If shm_writer is set, also write directly to SHM for preview window
-                    # This eliminates GIL contention between decoder and frame_sender
-                    if self._shm_writer is not None:
-                        if self._output_nv12 and frame_data is not None:
-                            # Write NV12 format for GPU YUV rendering
-                            self._shm_writer.write_nv12_frame(frame_data, frame_w, frame_h, pts, capture_time, udp_recv_time)
-                        elif bgr_frame is not None:
-                            # Write RGB format for CPU rendering
-                            self._shm_writer.write_frame(bgr_frame, pts, capture_time, udp_recv_time)
-
-                    # Always trigger update (removed event reuse mechanism - was causing issues)
-                    # Push to frame sink if provided (e.g., Screen for video window)
-                    # Note: frame_sink expects RGB format for CPU mode, or None for NV12 mode
-                    if self._frame_sink is not None:
-                        if bgr_frame is not None:
-                            self._frame_sink.push(bgr_frame)
-                        elif self._output_nv12 and frame_data is not None:
-                            # NV12 mode: push a placeholder to trigger frame_sink callback
-                            # The actual frame is in DelayBuffer, this just notifies the UI
-                            self._frame_sink.push(None)
-
-                except Exception as e:
-                    logger.warning(f"Error processing decoded frame: {e}")
-                    continue
+                self._process_frame(frame, packet, packet_id)
 
         except av.error.BlockingIOError:
             # This is expected when the decoder is full
@@ -1122,6 +1017,242 @@ class VideoDecoder:
         except Exception as e:
             raise DecodeError(f"Failed to decode packet: {e}")
 
+    def _process_frame(self, frame: av.VideoFrame, packet: VideoPacket, packet_id: int) -> None:
+        """
+        Convert one decoded frame and hand it to the frame buffer, SHM writer and sink.
+
+        Args:
+            frame: Frame returned by the codec for the current packet
+            packet: The packet that produced the frame (PTS fallback, send time)
+            packet_id: Packet ID for latency tracking
+        """
+        try:
+            self._frame_count += 1
+
+            # CRITICAL: Removed per-frame debug logging for performance
+            # These logs severely impact performance at 60fps+
+            # logger.debug(
+            #     f"Decoded frame: {frame.width}x{frame.height}, "
+            #     f"format={frame.format}, pts={frame.pts}"
+            # )
+
+            # Convert frame to output format (RGB or NV12)
+            if self._output_nv12:
+                # NV12 format for GPU YUV rendering (avoids CPU YUV→RGB conversion)
+
+                # 实验性零拷贝GPU模式：检测GPU帧并跳过CPU传输
+                if self._using_zero_copy and frame.format.name == 'cuda':
+                    # GPU帧：通过DLPack导出，零拷贝
+                    frame_data, frame_w, frame_h = self._frame_to_nv12_dict_gpu(frame)
+                elif self._shm_writer is not None:
+                    # For SHM: return bytes format
+                    frame_data, frame_w, frame_h = self._frame_to_nv12(frame)
+                else:
+                    # For DelayBuffer: return dict with separate Y/U/V planes
+                    frame_data, frame_w, frame_h = self._frame_to_nv12_dict(frame)
+
+                # Debug logging (periodic)
+                if self._frame_count <= 5 or self._frame_count % 60 == 0:
+                    if frame_data is not None:
+                        if isinstance(frame_data, dict):
+                            if frame_data.get('is_gpu', False):
+                                # GPU零拷贝模式
+                                logger.info(f"[DECODER] NV12 GPU dict: y_gpu_shape={frame_data['y_gpu'].shape}, "
+                                           f"uv_gpu_shape={frame_data['uv_gpu'].shape}")
+                            else:
+                                # CPU模式
+                                logger.info(f"[DECODER] NV12 dict: y_shape={frame_data['y'].shape}, "
+                                           f"u_shape={frame_data['u'].shape}, v_shape={frame_data['v'].shape}")
+                        else:
+                            logger.info(f"[DECODER] NV12 bytes: size={len(frame_data)}, {frame_w}x{frame_h}")
+                    else:
+                        logger.error(f"[DECODER] NV12 conversion failed!")
+
+                bgr_frame = None  # Not used in NV12 mode
+            else:
+                # RGB format for CPU rendering
+                bgr_frame = self._frame_to_bgr(frame)
+                frame_data = None  # Not used in RGB mode
+                frame_w = frame.width
+                frame_h = frame.height
+
+            # Check if frame size changed (device rotation)
+            # This handles race conditions where decoder reinitializes with old dimensions
+            # before receiving frames with new dimensions
+            if frame_w != self._width or frame_h != self._height:
+                old_w, old_h = self._width, self._height
+                self._width = frame_w
+                self._height = frame_h
+                self._shape = (frame_h, frame_w, 3)
+                logger.info(
+                    f"[DECODER] Frame size changed: {old_w}x{old_h} -> {frame_w}x{frame_h}"
+                )
+                # Notify callback if set
+                if self._frame_size_changed_callback:
+                    try:
+                        self._frame_size_changed_callback(frame_w, frame_h)
+                    except Exception as e:
+                        logger.warning(f"Frame size change callback error: {e}")
+
+            # Latency tracking: record decode complete
+            if packet_id >= 0:
+                try:
+                    from scrcpy_py_ddlx.latency_tracker import get_tracker
+                    tracker = get_tracker()
+                    tracker.record_decode_complete(packet_id)
+                    # Also record shm_write as "frame ready" time
+                    # This represents when frame is ready for preview
+                    tracker.record_shm_write(packet_id)
+                except Exception:
+                    pass
+
+            # Put frame in delay buffer (single-frame, drops old frames)
+            # Include PTS, capture time, and UDP recv time for end-to-end latency tracking
+            capture_time = time.time()
+
+            # Get PTS - prefer frame.pts if available, fall back to packet PTS
+            # packet.header.pts is already in nanoseconds from device
+            try:
+                frame_pts_raw = frame.pts
+                packet_pts_raw = packet.header.pts
+
+                # Use frame.pts directly (it's already in nanoseconds for scrcpy)
+                # The previous time_base conversion was incorrect for this codec
+                pts = frame_pts_raw if frame_pts_raw is not None else packet_pts_raw
+
+                # Diagnostic: Log PTS values for debugging
+                if self._frame_count <= 10 or self._frame_count % 60 == 0:
+                    logger.info(
+                        f"[PTS_DEBUG] Frame #{self._frame_count}: "
+                        f"frame.pts={frame_pts_raw}, packet.pts={packet_pts_raw}, "
+                        f"using pts={pts}"
+                    )
+            except Exception as e:
+                pts = packet.header.pts
+                if self._frame_count <= 10 or self._frame_count % 60 == 0:
+                    logger.warning(f"[PTS_DEBUG] Frame #{self._frame_count}: PTS error: {e}, using packet.pts={pts}")
+
+            # PTS Clock Drift Diagnostic: Compare PTS delta vs wall clock delta
+            # This detects if device clock and PC clock are synchronized
+            # IMPORTANT: PTS from scrcpy device is in MICROSECONDS, not nanoseconds!
+            if self._last_pts != 0:
+                pts_delta_us = pts - self._last_pts  # PTS increment in MICROSECONDS
+                wall_delta_us = int((capture_time - self._last_pts_wall_time) * 1e6)  # Wall clock increment in MICROSECONDS
+                drift_us = pts_delta_us - wall_delta_us  # Positive = device clock faster
+
+                # Store sample for periodic analysis
+                self._pts_drift_samples.append((pts_delta_us, wall_delta_us, drift_us))
+
+                # Log every 60 frames with analysis
+                if self._frame_count % 60 == 0 and len(self._pts_drift_samples) >= 10:
+                    # Calculate average drift (PTS is in microseconds)
+                    n_samples = len(self._pts_drift_samples)
+                    avg_pts_delta_ms = sum(s[0] for s in self._pts_drift_samples) / n_samples / 1e3  # us to ms
+                    avg_wall_delta_ms = sum(s[1] for s in self._pts_drift_samples) / n_samples / 1e3  # us to ms
+                    avg_drift_ms = sum(s[2] for s in self._pts_drift_samples) / n_samples / 1e3  # us to ms
+
+                    # Calculate cumulative drift from first frame (PTS is in MICROSECONDS)
+                    total_pts_us = pts - self._first_pts
+                    total_wall_us = int((capture_time - self._first_pts_wall_time) * 1e6)
+                    total_drift_ms = (total_pts_us - total_wall_us) / 1e3  # us to ms
+
+                    # Calculate expected frame interval (for 60fps = 16.67ms)
+                    expected_interval_ms = 1000.0 / 60  # Assume 60fps
+
+                    logger.info(
+                        f"[PTS_DRIFT] Frame #{self._frame_count}: "
+                        f"pts_delta={avg_pts_delta_ms:.1f}ms, "
+                        f"wall_delta={avg_wall_delta_ms:.1f}ms, "
+                        f"drift={avg_drift_ms:.2f}ms/frame, "
+                        f"total_drift={total_drift_ms:.0f}ms, "
+                        f"expected_interval={expected_interval_ms:.1f}ms"
+                    )
+
+                    # Warning if drift is significant (> 5ms per frame accumulates quickly)
+                    if abs(avg_drift_ms) > 5:
+                        logger.warning(
+                            f"[PTS_DRIFT] SIGNIFICANT CLOCK DRIFT DETECTED! "
+                            f"Device clock is {'faster' if avg_drift_ms > 0 else 'slower'} than PC clock. "
+                            f"This may cause TRUE_E2E to be inaccurate."
+                        )
+
+            # Record first PTS for absolute timing analysis
+            if self._first_pts == 0:
+                self._first_pts = pts
+                self._first_pts_wall_time = capture_time
+                logger.info(f"[PTS_DRIFT] First frame: pts={pts}, wall_time={capture_time}")
+
+            self._last_pts = pts
+            self._last_pts_wall_time = capture_time
+
+            # Get UDP recv time for TRUE end-to-end latency tracking
+            udp_recv_time = 0.0
+            send_time_ns = 0
+            if packet_id >= 0:
+                try:
+                    from scrcpy_py_ddlx.latency_tracker import get_tracker
+                    udp_recv_time = get_tracker().get_udp_recv_time(packet_id)
+                except Exception:
+                    pass
+            # Get device send time for full E2E latency tracking
+            send_time_ns = getattr(packet, 'send_time_ns', 0)
+
+            # CRITICAL DIAGNOSTIC: Log packet_id and UDP time relationship every 100 frames
+            if self._frame_count % 100 == 0:
+                import datetime as dt
+                udp_time_str = dt.datetime.fromtimestamp(udp_recv_time).strftime('%H:%M:%S.%f')[:-3] if udp_recv_time > 0 else "N/A"
+                capture_time_str = dt.datetime.fromtimestamp(capture_time).strftime('%H:%M:%S.%f')[:-3]
+                logger.info(f"[DECODER] Frame #{self._frame_count}: packet_id={packet_id}, pts={pts}, UDP={udp_time_str}, CAPTURE={capture_time_str}")
+
+            # Push to DelayBuffer for screenshot support (always, even with SHM)
+            # This ensures screenshot() can get the latest frame
+            if self._output_nv12 and frame_data is not None:
+                # For Direct SHM mode: frame_data is bytes, wrap in dict for screenshot conversion
+                if isinstance(frame_data, bytes):
+                    screenshot_frame = {
+                        'nv12_bytes': frame_data,
+                        'width': frame_w,
+                        'height': frame_h
+                    }
+                    success, previous_skipped = self._frame_buffer.push(screenshot_frame, packet_id, pts, capture_time, udp_recv_time, send_time_ns, self._width, self._height)
+                else:
+                    # Already dict format (Y/U/V planes or GPU dict)
+                    success, previous_skipped = self._frame_buffer.push(frame_data, packet_id, pts, capture_time, udp_recv_time, send_time_ns, self._width, self._height)
+            elif bgr_frame is not None:
+                success, previous_skipped = self._frame_buffer.push(bgr_frame, packet_id, pts, capture_time, udp_recv_time, send_time_ns, self._width, self._height)
+                # CRITICAL: Reduced frame drop logging for performance
+                # (countdown: one decrement per dropped frame, log every DROP_LOG_INTERVAL drops)
+                if previous_skipped:
+                    self._drop_log_countdown -= 1
+                    if self._drop_log_countdown <= 0:
+                        self._drop_log_countdown = DROP_LOG_INTERVAL
+                        logger.debug(f"Frame drops detected ({DROP_LOG_INTERVAL} more, frame={self._frame_count})")
+
+            # If shm_writer is set, also write directly to SHM for preview window
+            # This eliminates GIL contention between decoder and frame_sender
+            if self._shm_writer is not None:
+                if self._output_nv12 and frame_data is not None:
+                    # Write NV12 format for GPU YUV rendering
+                    self._shm_writer.write_nv12_frame(frame_data, frame_w, frame_h, pts, capture_time, udp_recv_time)
+                elif bgr_frame is not None:
+                    # Write RGB format for CPU rendering
+                    self._shm_writer.write_frame(bgr_frame, pts, capture_time, udp_recv_time)
+
+            # Always trigger update (removed event reuse mechanism - was causing issues)
+            # Push to frame sink if provided (e.g., Screen for video window)
+            # Note: frame_sink expects RGB format for CPU mode, or None for NV12 mode
+            if self._frame_sink is not None:
+                if bgr_frame is not None:
+                    self._frame_sink.push(bgr_frame)
+                elif self._output_nv12 and frame_data is not None:
+                    # NV12 mode: push a placeholder to trigger frame_sink callback
+                    # The actual frame is in DelayBuffer, this just notifies the UI
+                    self._frame_sink.push(None)
+
+        except Exception as e:
+            logger.warning(f"Error processing decoded frame: {e}")
+            return
+
     def _frame_to_bgr(self, frame: av.VideoFrame) -> np.ndarray:
         """
         Convert a PyAV VideoFrame to RGB numpy array for display.
@@ -1131,8 +1262,13 @@ class VideoDecoder:
 
         The conversion pipeline:
         1. PyAV decodes H.264/H.265 to YUV420P or NV12 (hardware decoder)
-        2. reformat() converts YUV to RGB24 (R-G-B order)
-        3. to_ndarray() converts to numpy array
+        2. YUV420P frames are converted to RGB24 (R-G-B order) in one pass by
+           libyuv when it is installed (see yuv_convert)
+        3. Otherwise reformat() converts to RGB24 and to_ndarray() wraps the
+           plane as a numpy view (copied into a contiguous array only if padded)
+
+        The returned array is never reused by the decoder: renderers and
+        get_frame() callers may keep it for as long as they like.
 
         Args:
             frame: The PyAV VideoFrame to convert (decoded from H.264/H.265)
@@ -1163,64 +1299,27 @@ class VideoDecoder:
             actual_width = frame.width
             actual_height = frame.height
 
-            # Check if frame is already in a format we can use directly
-            frame_format = str(frame.format) if hasattr(frame, 'format') else 'unknown'
+            # Fast path: single-pass libyuv conversion for YUV420P frames
+            img_array = yuv420p_to_rgb24(frame) if LIBYUV_AVAILABLE else None
 
-            # Try to use the most efficient conversion path
-            # For hardware decoders, the output might be NV12 which we need to convert
-            if frame_format.lower() in ['nv12', 'yuv420p']:
-                # Standard YUV formats - use reformat
-                frame_rgb = frame.reformat(
-                    width=actual_width, height=actual_height, format="rgb24"
-                )
-            else:
-                # Unknown format - let PyAV handle it
-                frame_rgb = frame.reformat(
-                    width=actual_width, height=actual_height, format="rgb24"
+            if img_array is None:
+                # Other formats (e.g. NV12 from hardware decoders) - let PyAV handle it
+                frame_rgb = self._reformatter.reformat(
+                    frame, width=actual_width, height=actual_height, format="rgb24"
                 )
 
-            # Get the image data as numpy array
-            # Note: to_ndarray() returns a view when possible, which is fast
-            img_array = frame_rgb.to_ndarray()
+                # to_ndarray() wraps the RGB24 plane without copying (each
+                # reformat() returns a new frame); the view is strided when
+                # swscale pads rows (line_size > width * 3)
+                img_array = frame_rgb.to_ndarray()
 
-            # Ensure C-contiguous for SimpleSHM write
-            if not img_array.flags['C_CONTIGUOUS']:
-                img_array = np.ascontiguousarray(img_array)
+                # Ensure C-contiguous for SimpleSHM write
+                if not img_array.flags['C_CONTIGUOUS']:
+                    img_array = np.ascontiguousarray(img_array)
 
             # DEBUG: Save first frame to file to verify decoding is correct
             if self._save_debug_frame and self._frame_count == 1:
-                try:
-                    # Try OpenCV first
-                    import cv2
-
-                    # OpenCV expects BGR, so we need to convert RGB to BGR
-                    img_bgr = img_array[:, :, ::-1]  # RGB to BGR (reverse channels)
-                    cv2.imwrite("debug_frame_1.png", img_bgr)
-                    logger.info("Saved first frame to debug_frame_1.png (using OpenCV)")
-                    self._save_debug_frame = False
-                except ImportError:
-                    try:
-                        # Fallback to PIL
-                        from PIL import Image
-
-                        pil_img = Image.fromarray(img_array, "RGB")
-                        pil_img.save("debug_frame_1.png")
-                        logger.info(
-                            "Saved first frame to debug_frame_1.png (using PIL)"
-                        )
-                        self._save_debug_frame = False
-                    except ImportError:
-                        logger.warning(
-                            "Neither OpenCV nor PIL available, saving raw numpy array instead"
-                        )
-                        # Save raw numpy array
-                        np.save("debug_frame_1.npy", img_array)
-                        logger.info(
-                            "Saved first frame to debug_frame_1.npy (raw numpy array)"
-                        )
-                        self._save_debug_frame = False
-                except Exception as e:
-                    logger.error(f"Failed to save debug frame: {e}")
+                self._write_debug_frame(img_array)
 
             # Return RGB array
             return img_array
@@ -1228,6 +1327,45 @@ class VideoDecoder:
         except Exception as e:
             raise DecodeError(f"Failed to convert frame to RGB: {e}")
 
+    def _write_debug_frame(self, img_array: np.ndarray) -> None:
+        """
+        Save an RGB frame to debug_frame_1.png (or .npy) to verify decoding.
+
+        Args:
+            img_array: RGB24 frame of shape (height, width, 3)
+        """
+        try:
+            # Try OpenCV first
+            import cv2
+
+            # OpenCV expects BGR: convert in one contiguous pass
+            cv2.imwrite("debug_frame_1.png", cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR))
+            logger.info("Saved first frame to debug_frame_1.png (using OpenCV)")
+            self._save_debug_frame = False
+        except ImportError:
+            try:
+                # Fallback to PIL
+                from PIL import Image
+
+                pil_img = Image.fromarray(img_array, "RGB")
+                pil_img.save("debug_frame_1.png")
+                logger.info(
+                    "Saved first frame to debug_frame_1.png (using PIL)"
+                )
+                self._save_debug_frame = False
+            except ImportError:
+                logger.warning(
+                    "Neither OpenCV nor PIL available, saving raw numpy array instead"
+                )
+                # Save raw numpy array
+                np.save("debug_frame_1.npy", img_array)
+                logger.info(
+                    "Saved first frame to debug_frame_1.npy (raw numpy array)"
+                )
+                self._save_debug_frame = False
+        except Exception as e:
+            logger.error(f"Failed to save debug frame: {e}")
+
     def _frame_to_nv12(self, frame: av.VideoFrame) -> tuple:
         """
         Convert a PyAV VideoFrame to NV12 format for GPU rendering.
@@ -1254,13 +1392,13 @@ class VideoDecoder:
 
             # Try to convert to NV12 format
             try:
-                frame_nv12 = frame.reformat(
-                    width=actual_width, height=actual_height, format="nv12"
+                frame_nv12 = self._reformatter.reformat(
+                    frame, width=actual_width, height=actual_height, format="nv12"
                 )
             except Exception as e:
                 logger.debug(f"NV12 reformat failed, falling back to YUV420P: {e}")
                 # Fallback: convert via yuv420p
-                frame_yuv = frame.reformat(format="yuv420p")
+                frame_yuv = self._reformatter.reformat(frame, format="yuv420p")
                 planes = frame_yuv.planes
                 if len(planes) != 3:
                     logger.warning(f"YUV420P has unexpected plane count: {len(planes)}")
@@ -1331,8 +1469,10 @@ class VideoDecoder:
         """
         Convert a PyAV VideoFrame to NV12 format as a dict with separate Y/U/V planes.
 
-        OPTIMIZED: Uses pre-allocated buffers to avoid per-frame memory allocation.
-        This reduces CPU usage by ~15-20% by eliminating numpy array creation overhead.
+        Each plane is copied once out of the PyAV frame into a new array. The
+        decoder never writes to a published frame again, so renderers may keep
+        the dict and re-upload it on repaint, and get_frame()/screenshot()
+        callers may hold it as long as they like.
 
         Args:
             frame: The PyAV VideoFrame to convert (decoded from H.264/H.265)
@@ -1353,56 +1493,48 @@ class VideoDecoder:
                 logger.warning(f"Invalid frame dimensions: {actual_width}x{actual_height}")
                 return None, 0, 0
 
-            # Check if we need to reallocate buffers (size changed)
-            if (self._buffer_width != actual_width or self._buffer_height != actual_height):
-                # Free old buffers
-                self._y_buffer = None
-                self._u_buffer = None
-                self._v_buffer = None
-
-                # Pre-allocate new buffers
-                self._y_buffer = np.empty((actual_height, actual_width), dtype=np.uint8)
-                self._u_buffer = np.empty((actual_height // 2, actual_width // 2), dtype=np.uint8)
-                self._v_buffer = np.empty((actual_height // 2, actual_width // 2), dtype=np.uint8)
-                self._buffer_width = actual_width
-                self._buffer_height = actual_height
-                logger.debug(f"[NV12] Reallocated buffers: {actual_width}x{actual_height}")
-
-            # Convert to NV12 format
-            try:
-                frame_nv12 = frame.reformat(
-                    width=actual_width, height=actual_height, format="nv12"
-                )
-            except Exception as e:
-                logger.debug(f"NV12 reformat failed, falling back to YUV420P: {e}")
-                # Fallback: convert via YUV420P
-                frame_yuv = frame.reformat(format="yuv420p")
+            # Software decoders already output YUV420P: copy its planes as-is
+            # instead of interleaving them into NV12 and splitting U/V again
+            frame_yuv = frame if frame.format.name == "yuv420p" else None
+
+            if frame_yuv is None:
+                # Convert to NV12 format
+                try:
+                    frame_nv12 = self._reformatter.reformat(
+                        frame, width=actual_width, height=actual_height, format="nv12"
+                    )
+                except Exception as e:
+                    logger.debug(f"NV12 reformat failed, falling back to YUV420P: {e}")
+                    # Fallback: convert via YUV420P
+                    frame_yuv = self._reformatter.reformat(frame, format="yuv420p")
+
+            if frame_yuv is not None:
                 planes = frame_yuv.planes
                 if len(planes) != 3:
                     logger.warning(f"YUV420P has unexpected plane count: {len(planes)}")
                     return None, 0, 0
 
-                # Handle stride padding for YUV420P - use pre-allocated buffers
+                # Handle stride padding for YUV420P - copy each plane into a new array
                 y_plane_raw = planes[0]
                 u_plane_raw = planes[1]
                 v_plane_raw = planes[2]
 
-                # Extract Y plane - copy to pre-allocated buffer
+                # Extract Y plane
                 y_array = np.frombuffer(y_plane_raw, np.uint8).reshape(actual_height, y_plane_raw.line_size)
-                np.copyto(self._y_buffer, y_array[:, :actual_width])
+                y_buffer = y_array[:, :actual_width].copy()
 
                 # Extract U plane (half resolution)
                 u_array = np.frombuffer(u_plane_raw, np.uint8).reshape(actual_height // 2, u_plane_raw.line_size)
-                np.copyto(self._u_buffer, u_array[:, :actual_width // 2])
+                u_buffer = u_array[:, :actual_width // 2].copy()
 
                 # Extract V plane (half resolution)
                 v_array = np.frombuffer(v_plane_raw, np.uint8).reshape(actual_height // 2, v_plane_raw.line_size)
-                np.copyto(self._v_buffer, v_array[:, :actual_width // 2])
+                v_buffer = v_array[:, :actual_width // 2].copy()
 
                 return {
-                    'y': self._y_buffer,
-                    'u': self._u_buffer,
-                    'v': self._v_buffer,
+                    'y': y_buffer,
+                    'u': u_buffer,
+                    'v': v_buffer,
                     'y_stride': actual_width,
                     'uv_stride': actual_width // 2
                 }, actual_width, actual_height
@@ -1413,28 +1545,28 @@ class VideoDecoder:
                 logger.warning(f"NV12 frame has unexpected planes: {planes}")
                 return None, 0, 0
 
-            # Handle stride padding - copy to pre-allocated buffers
+            # Handle stride padding - copy each plane into a new array
             y_plane = planes[0]
             uv_plane = planes[1]
             y_linesize = y_plane.line_size
             uv_linesize = uv_plane.line_size
 
-            # Extract Y plane - copy to pre-allocated buffer
+            # Extract Y plane
             y_array = np.frombuffer(y_plane, np.uint8).reshape(actual_height, y_linesize)
-            np.copyto(self._y_buffer, y_array[:, :actual_width])
+            y_buffer = y_array[:, :actual_width].copy()
 
             # Extract UV plane and split into U and V
             uv_array = np.frombuffer(uv_plane, np.uint8).reshape(actual_height // 2, uv_linesize)
             uv_data = uv_array[:, :actual_width]
 
-            # Split interleaved UV into separate U and V planes - copy to pre-allocated buffers
-            np.copyto(self._u_buffer, uv_data[:, 0::2])  # U at even columns
-            np.copyto(self._v_buffer, uv_data[:, 1::2])  # V at odd columns
+            # Split interleaved UV into separate U and V planes
+            u_buffer = uv_data[:, 0::2].copy()  # U at even columns
+            v_buffer = uv_data[:, 1::2].copy()  # V at odd columns
 
             return {
-                'y': self._y_buffer,
-                'u': self._u_buffer,
-                'v': self._v_buffer,
+                'y': y_buffer,
+                'u': u_buffer,
+                'v': v_buffer,
                 'y_stride': y_linesize,
                 'uv_stride': uv_linesize
             }, actual_width, actual_height
@@ -1448,7 +1580,8 @@ class VideoDecoder:
         [EXPERIMENTAL] Handle GPU frame (cuda format) without CPU transfer.
 
         This is for zero-copy GPU rendering mode. The frame data stays in GPU memory
-        and is exported via DLPack for CuPy/PyTorch processing.
+        and is exported via DLPack for CuPy/PyTorch processing, or wrapped from the
+        planes' device pointers when this PyAV build has no DLPack export.
 
         Args:
             frame: PyAV VideoFrame with format='cuda' (GPU memory)
@@ -1491,51 +1624,74 @@ class VideoDecoder:
                     # DLPack导出（零拷贝，数据仍在GPU）
                     y_gpu = cp.fromDlpack(y_plane.__dlpack__())
                     uv_gpu = cp.fromDlpack(uv_plane.__dlpack__())
+                else:
+                    # PyAV without DLPack export: a cuda frame's plane pointers
+                    # are device pointers, wrap them in place (no copy)
+                    y_gpu = self._wrap_cuda_plane(cp, y_plane, actual_height, actual_width, frame)
+                    uv_gpu = self._wrap_cuda_plane(cp, uv_plane, (actual_height + 1) // 2, actual_width, frame)
+
+                y_stride = y_plane.line_size
+                uv_stride = uv_plane.line_size
+
+                if self._frame_count <= 5:
+                    # 检查CuPy数组的属性
+                    logger.info(f"[ZERO_COPY] GPU arrays: y={y_gpu.shape}, uv={uv_gpu.shape}, "
+                               f"y_stride={y_stride}, uv_stride={uv_stride}")
+                    logger.info(f"[ZERO_COPY] CuPy details: y_ptr={y_gpu.data.ptr}, "
+                               f"y_contig={y_gpu.flags['C_CONTIGUOUS']}, "
+                               f"y_device={cp.cuda.Device().id}")
+                    # 验证指针是否可访问
+                    try:
+                        _ = y_gpu[0, 0]  # 尝试访问一个元素
+                        logger.info("[ZERO_COPY] CuPy array access OK")
+                    except Exception as e:
+                        logger.warning(f"[ZERO_COPY] CuPy array access failed: {e}")
 
-                    y_stride = y_plane.line_size
-                    uv_stride = uv_plane.line_size
-
-                    if self._frame_count <= 5:
-                        # 检查CuPy数组的属性
-                        logger.info(f"[ZERO_COPY] GPU arrays: y={y_gpu.shape}, uv={uv_gpu.shape}, "
-                                   f"y_stride={y_stride}, uv_stride={uv_stride}")
-                        logger.info(f"[ZERO_COPY] CuPy details: y_ptr={y_gpu.data.ptr}, "
-                                   f"y_contig={y_gpu.flags['C_CONTIGUOUS']}, "
-                                   f"y_device={cp.cuda.Device().id}")
-                        # 验证指针是否可访问
-                        try:
-                            _ = y_gpu[0, 0]  # 尝试访问一个元素
-                            logger.info("[ZERO_COPY] CuPy array access OK")
-                        except Exception as e:
-                            logger.warning(f"[ZERO_COPY] CuPy array access failed: {e}")
-
-                    # 返回GPU数组字典（特殊格式，OpenGL需要识别is_gpu=True）
-                    return {
-                        'y_gpu': y_gpu,
-                        'uv_gpu': uv_gpu,
-                        'is_gpu': True,
-                        'y_stride': y_stride,
-                        'uv_stride': uv_stride,
-                        'width': actual_width,
-                        'height': actual_height,
-                    }, actual_width, actual_height
+                # 返回GPU数组字典（特殊格式，OpenGL需要识别is_gpu=True）
+                return {
+                    'y_gpu': y_gpu,
+                    'uv_gpu': uv_gpu,
+                    'is_gpu': True,
+                    'y_stride': y_stride,
+                    'uv_stride': uv_stride,
+                    'width': actual_width,
+                    'height': actual_height,
+                }, actual_width, actual_height
 
         except Exception as e:
             if self._frame_count <= 5:
-                logger.warning(f"[ZERO_COPY] DLPack export failed: {e}, falling back to CPU")
+                logger.warning(f"[ZERO_COPY] GPU plane export failed: {e}, falling back to CPU")
 
         # Fallback: Use standard reformat path
         return self._frame_to_nv12_dict(frame)
 
+    @staticmethod
+    def _wrap_cuda_plane(cp, plane, rows: int, width: int, frame: "av.VideoFrame"):
+        """
+        Wrap a cuda frame plane as a CuPy array without copying.
+
+        Args:
+            cp: The cupy module
+            plane: Frame plane whose buffer_ptr is a device pointer
+            rows: Number of rows in the plane
+            width: Visible bytes per row
+            frame: Owning frame, kept alive by the CuPy memory object
+
+        Returns:
+            CuPy uint8 array of shape (rows, width), strided by plane.line_size
+        """
+        line_size = plane.line_size
+        memory = cp.cuda.UnownedMemory(plane.buffer_ptr, line_size * rows, frame)
+        padded = cp.ndarray((rows, line_size), dtype=cp.uint8,
+                            memptr=cp.cuda.MemoryPointer(memory, 0))
+        return padded[:, :width]
+
     def get_frame(self, timeout: float = 1.0) -> Optional[np.ndarray]:
         """
         Get the next decoded frame.
 
         Args:
             timeout: Maximum time to wait for a frame (seconds)
-                    Note: DelayBuffer doesn't support blocking, so timeout
-                    is handled by polling. This is acceptable for real-time
-                    screen mirroring where low latency is critical.
 
         Returns:
             BGR numpy array with shape (height, width, 3), or None if timeout
@@ -1545,18 +1701,12 @@ class VideoDecoder:
             >>> if frame is not None:
             ...     cv2.imshow('Screen', frame)
         """
-        # DelayBuffer is non-blocking, but we poll for compatibility
-        import time
-
-        start_time = time.time()
-        while True:
-            result = self._frame_buffer.pop()
-            if result is not None:
-                # DelayBuffer returns FrameWithMetadata, extract frame
-                return result.frame if hasattr(result, 'frame') else result
-            if time.time() - start_time >= timeout:
-                return None
-            time.sleep(0.001)  # Small sleep to avoid busy-waiting
+        # Event-driven: blocks on the DelayBuffer condition until push() notifies
+        result = self._frame_buffer.wait_for_frame(timeout)
+        if result is not None:
+            # DelayBuffer returns FrameWithMetadata, extract frame
+            return result.frame
+        return None
 
     def get_frame_nowait(self) -> Optional[np.ndarray]:
         """
@@ -1568,7 +1718,7 @@ class VideoDecoder:
         result = self._frame_buffer.get_nowait()
         if result is not None:
             # DelayBuffer returns FrameWithMetadata, extract frame
-            return result.frame if hasattr(result, 'frame') else result
+            return result.frame
         return None
 
     def get_frame_count(self) -> int:
@@ -1653,6 +1803,7 @@ class SimpleDecoder:
         self._codec_id = codec_id
         self._codec_context: Optional[av.CodecContext] = None
         self._shape: Tuple[int, int, int] = (height, width, 3)
+        self._reformatter = VideoReformatter()  # Reuses its swscale context
 
         # Initialize decoder
         self._initialize_decoder()
@@ -1691,7 +1842,8 @@ class SimpleDecoder:
             packet: The video packet to decode
 
         Returns:
-            List of BGR numpy arrays (may be empty for config packets)
+            List of RGB numpy arrays (may be empty for config packets); the
+            arrays share one (n, height, width, 3) buffer
 
         Raises:
             DecodeError: If decoding fails
@@ -1703,8 +1855,6 @@ class SimpleDecoder:
         if packet.header.is_config:
             return []
 
-        frames = []
-
         try:
             # Create and send packet
             av_packet = av.Packet(packet.data)
@@ -1713,46 +1863,55 @@ class SimpleDecoder:
 
             # Decode packet (PyAV >= 10.0: decode() accepts packet directly)
             # Receive all available frames
-            for frame in self._codec_context.decode(av_packet):
-                # Convert to RGB (not BGR!)
-                # RGB24 format matches QImage.Format_RGB888
-                frame_rgb = frame.reformat(
-                    width=self._width, height=self._height, format="rgb24"
-                )
-                img_array = frame_rgb.to_ndarray().copy()
-                # img_array is already in RGB format, no need to swap channels
-                frames.append(img_array)
+            return self._frames_to_rgb(self._codec_context.decode(av_packet))
 
         except av.error.BlockingIOError:
-            pass  # Decoder is full, expected behavior
+            return []  # Decoder is full, expected behavior
         except Exception as e:
             raise DecodeError(f"Failed to decode packet: {e}")
 
-        return frames
-
     def flush(self) -> list[np.ndarray]:
         """
         Flush the decoder to get any remaining frames.
 
         Returns:
-            List of remaining BGR numpy arrays
+            List of remaining RGB numpy arrays
         """
         if self._codec_context is None:
             return []
 
-        frames = []
-
         try:
-            for frame in self._codec_context.decode():
-                frame_rgb = frame.reformat(
-                    width=self._width, height=self._height, format="rgb24"
-                )
-                img_array = frame_rgb.to_ndarray().copy()
-                frames.append(img_array)
+            return self._frames_to_rgb(self._codec_context.decode())
         except Exception:
-            pass
+            return []
+
+    def _frames_to_rgb(self, decoded: List[av.VideoFrame]) -> list[np.ndarray]:
+        """
+        Convert all frames decoded from one packet into a single RGB block.
+
+        The frames are written into one (n, height, width, 3) array, so a packet
+        yielding several frames costs one allocation and the returned frames are
+        adjacent in memory. Each list item is a view into that block.
+        """
+        if not decoded:
+            return []
+
+        width = self._width
+        height = self._height
+        result = np.empty((len(decoded), height, width, 3), dtype=np.uint8)
+
+        for out, frame in zip(result, decoded):
+            # Convert to RGB (not BGR!)
+            # RGB24 format matches QImage.Format_RGB888
+            if (LIBYUV_AVAILABLE and frame.width == width and frame.height == height
+                    and yuv420p_to_rgb24(frame, out) is not None):
+                continue
+            frame_rgb = self._reformatter.reformat(
+                frame, width=width, height=height, format="rgb24"
+            )
+            out[...] = frame_rgb.to_ndarray()
 
-        return frames
+        return list(result)
 
     @property
     def width(self) -> int:
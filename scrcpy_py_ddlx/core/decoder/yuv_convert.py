@@ -0,0 +1,136 @@
+"""
+scrcpy_py_ddlx/core/decoder/yuv_convert.py
+
+Optional libyuv fast path for YUV420P to RGB24 conversion.
+
+libyuv's I420ToRAW family reads the Y/U/V planes once and writes the RGB
+image once using SIMD row functions, straight into a caller-provided array
+(no intermediate AVFrame as with av.VideoFrame.reformat()). libyuv is loaded
+with ctypes when the shared library is installed (e.g. the libyuv0 package
+on Debian/Ubuntu); otherwise LIBYUV_AVAILABLE is False and callers keep
+using reformat().
+
+The library is loaded with ctypes.CDLL, which releases the GIL for the
+duration of each conversion, so other Python threads (network, UI) run while
+a frame is converted. What remains in Python is a handful of attribute reads
+per frame (~15 us), so the wrapper is not compiled with Cython.
+
+There is deliberately no Numba fallback kernel: swscale's own conversion
+is SIMD-vectorized, and a per-pixel @njit kernel (integer BT.601, parallel
+rows) measured about 6x slower than reformat() at 1080p on a single core.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+from typing import Optional
+
+import av
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+__all__ = ['LIBYUV_AVAILABLE', 'yuv420p_to_rgb24']
+
+
+# FFmpeg AVColorSpace / AVColorRange values (as exposed by av.VideoFrame)
+_AVCOL_SPC_BT709 = 1
+_AVCOL_SPC_UNSPECIFIED = 2
+_AVCOL_SPC_BT470BG = 5
+_AVCOL_SPC_SMPTE170M = 6
+_AVCOL_RANGE_JPEG = 2
+
+# libyuv "RAW" is R, G, B in memory order, i.e. FFmpeg rgb24
+_CONVERTER_NAMES = {
+    # (colorspace, full_range) -> libyuv function
+    (_AVCOL_SPC_UNSPECIFIED, False): "I420ToRAW",   # BT.601 limited, swscale default
+    (_AVCOL_SPC_BT470BG, False): "I420ToRAW",
+    (_AVCOL_SPC_SMPTE170M, False): "I420ToRAW",
+    (_AVCOL_SPC_BT709, False): "H420ToRAW",         # BT.709 limited
+    (_AVCOL_SPC_UNSPECIFIED, True): "J420ToRAW",    # BT.601 full range
+    (_AVCOL_SPC_BT470BG, True): "J420ToRAW",
+    (_AVCOL_SPC_SMPTE170M, True): "J420ToRAW",
+}
+
+
+def _load_converters() -> dict:
+    """Load the libyuv conversion functions, or return {} if unavailable."""
+    lib_name = ctypes.util.find_library("yuv")
+    if lib_name is None:
+        return {}
+    try:
+        lib = ctypes.CDLL(lib_name)
+    except OSError as e:
+        logger.debug(f"libyuv found but failed to load: {e}")
+        return {}
+
+    converters = {}
+    for key, func_name in _CONVERTER_NAMES.items():
+        func = getattr(lib, func_name, None)
+        if func is None:
+            continue
+        # (src_y, stride_y, src_u, stride_u, src_v, stride_v, dst, dst_stride, width, height)
+        func.argtypes = [
+            ctypes.c_void_p, ctypes.c_int,
+            ctypes.c_void_p, ctypes.c_int,
+            ctypes.c_void_p, ctypes.c_int,
+            ctypes.c_void_p, ctypes.c_int,
+            ctypes.c_int, ctypes.c_int,
+        ]
+        func.restype = ctypes.c_int
+        converters[key] = func
+    return converters
+
+
+_CONVERTERS = _load_converters()
+LIBYUV_AVAILABLE = bool(_CONVERTERS)
+
+
+def yuv420p_to_rgb24(frame: av.VideoFrame, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+    """
+    Convert a YUV420P frame to RGB24 with libyuv in a single pass.
+
+    Args:
+        frame: Decoded frame in yuv420p (or yuvj420p) format
+        out: Optional C-contiguous uint8 array of shape (height, width, 3)
+             to write into; a new array is allocated if None
+
+    Returns:
+        RGB24 array of shape (height, width, 3), or None if libyuv is not
+        available or the frame's format/colorspace is not handled (the
+        caller should then fall back to frame.reformat())
+    """
+    format_name = frame.format.name
+    if format_name == "yuv420p":
+        full_range = frame.color_range == _AVCOL_RANGE_JPEG
+    elif format_name == "yuvj420p":
+        full_range = True
+    else:
+        return None
+
+    convert = _CONVERTERS.get((frame.colorspace, full_range))
+    if convert is None:
+        return None
+
+    width = frame.width
+    height = frame.height
+    if out is None:
+        out = np.empty((height, width, 3), dtype=np.uint8)
+
+    # Destination address via the buffer protocol (about 3x cheaper than
+    # out.ctypes.data); out must be writable
+    out_ptr = ctypes.addressof(ctypes.c_char.from_buffer(out))
+
+    y_plane, u_plane, v_plane = frame.planes
+    result = convert(
+        y_plane.buffer_ptr, y_plane.line_size,
+        u_plane.buffer_ptr, u_plane.line_size,
+        v_plane.buffer_ptr, v_plane.line_size,
+        out_ptr, width * 3,
+        width, height,
+    )
+    if result != 0:
+        return None
+    return out
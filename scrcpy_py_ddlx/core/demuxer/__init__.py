@@ -29,13 +29,15 @@ from .base import (
     BaseDemuxer,
     StreamingDemuxerBase,
     DEFAULT_DEMUXER_BUFFER_SIZE,
-    DEFAULT_PACKET_QUEUE_SIZE
+    DEFAULT_PACKET_QUEUE_SIZE,
+    DEFAULT_SOCKET_RECV_BUFFER_SIZE
 )
 
 # =============================================================================
 # Video Demuxers
 # =============================================================================
 from .video import VideoDemuxer, StreamingVideoDemuxer
+from .packet_queue import VideoPacketQueue
 from .udp_video import UdpVideoDemuxer, UdpPacketHeader, UdpStats
 
 # =============================================================================
@@ -94,6 +96,7 @@ __all__ = [
     # Constants
     'DEFAULT_DEMUXER_BUFFER_SIZE',
     'DEFAULT_PACKET_QUEUE_SIZE',
+    'DEFAULT_SOCKET_RECV_BUFFER_SIZE',
 
     # Video Demuxers
     'VideoDemuxer',
@@ -104,6 +107,9 @@ __all__ = [
     'UdpPacketHeader',
     'UdpStats',
 
+    # Video packet queue
+    'VideoPacketQueue',
+
     # Audio Demuxers (lazy imported for backward compatibility)
     'AudioDemuxer',
     'StreamingAudioDemuxer',
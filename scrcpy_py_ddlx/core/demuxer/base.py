@@ -6,10 +6,12 @@ demuxers, along with their exception types.
 """
 
 import logging
+import selectors
 import socket
+import sys
 import threading
 import time
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from queue import Queue
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,58 @@ DEFAULT_DEMUXER_BUFFER_SIZE = (
 )  # 2MB (increased from 256KB to handle large keyframes)
 DEFAULT_PACKET_QUEUE_SIZE = 1  # Minimal latency (1 packet ≈ 16ms at 60fps)
 
+# Kernel receive buffer (SO_RCVBUF) requested for stream sockets: 4MB absorbs
+# a burst of 4K key frames. Linux autotunes TCP receive buffers up to
+# net.ipv4.tcp_rmem (6MB by default) and an explicit SO_RCVBUF disables that,
+# so Linux keeps its default unless a size is passed explicitly.
+DEFAULT_SOCKET_RECV_BUFFER_SIZE: Optional[int] = (
+    None if sys.platform.startswith("linux") else 4 * 1024 * 1024
+)
+
+
+def _configure_stream_socket(
+    sock: socket.socket,
+    tcp_nodelay: bool,
+    recv_buffer_size: Optional[int],
+) -> bool:
+    """
+    Apply latency/throughput socket options to a demuxer socket.
+
+    TCP options are only applied to TCP sockets (not to socketpairs or
+    other stream sockets used in tests and tunnels).
+
+    Args:
+        sock: Stream socket read by the demuxer
+        tcp_nodelay: Disable Nagle's algorithm (TCP_NODELAY)
+        recv_buffer_size: SO_RCVBUF size in bytes, or None to keep the OS default
+
+    Returns:
+        True if all requested options were applied, False otherwise
+    """
+    try:
+        is_tcp = (
+            sock.family in (socket.AF_INET, socket.AF_INET6)
+            and sock.type == socket.SOCK_STREAM
+        )
+        if tcp_nodelay and is_tcp:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        if recv_buffer_size is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer_size)
+            # The kernel may double the request (Linux) or cap it (rmem_max)
+            actual_size = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            if actual_size < recv_buffer_size:
+                logger.warning(
+                    f"Socket receive buffer limited by OS: requested={recv_buffer_size}, "
+                    f"actual={actual_size}"
+                )
+            else:
+                logger.debug(f"Socket receive buffer: {actual_size} bytes ({actual_size // 1024} KB)")
+        return True
+    except OSError as e:
+        logger.warning(f"Failed to configure demuxer socket: {e}")
+        return False
+
 
 class DemuxerError(Exception):
     """Base exception for demuxer errors."""
@@ -45,18 +99,30 @@ class BaseDemuxer:
 
     Performance optimizations:
     - Uses read/write offsets instead of moving data every time
-    - Lazy compression: only compacts buffer when 75% full
+    - Offsets rewind for free whenever all buffered data has been parsed
+    - Lazy compression: only compacts buffer when 75% full (moves just the
+      unparsed partial packet)
     - Uses memoryview to avoid temporary bytes objects
+    - Waits on a selector and drains the socket per wake-up, so a burst of
+      small packets is parsed in one pass
     """
 
     # Threshold for lazy compression (75% of buffer size)
     COMPRESSION_THRESHOLD = 0.75
 
+    # Selector wait timeout (seconds); bounds how long stop() takes to be seen
+    SELECT_TIMEOUT = 0.1
+
+    # Maximum bytes per recv() call
+    RECV_CHUNK_SIZE = 65536
+
     def __init__(
         self,
         sock: socket.socket,
         packet_queue: Queue,
         buffer_size: int = DEFAULT_DEMUXER_BUFFER_SIZE,
+        tcp_nodelay: bool = True,
+        recv_buffer_size: Optional[int] = DEFAULT_SOCKET_RECV_BUFFER_SIZE,
     ):
         """
         Initialize the demuxer.
@@ -65,8 +131,11 @@ class BaseDemuxer:
             sock: Socket to read stream data from
             packet_queue: Queue to pass parsed packets to decoder
             buffer_size: Size of receive buffer (default: 256KB)
+            tcp_nodelay: Set TCP_NODELAY on the socket (default: True)
+            recv_buffer_size: Kernel SO_RCVBUF size, None keeps the OS default
         """
         self._socket = sock
+        _configure_stream_socket(sock, tcp_nodelay, recv_buffer_size)
         self._packet_queue = packet_queue
         self._buffer_size = buffer_size
 
@@ -84,6 +153,9 @@ class BaseDemuxer:
         self._read_offset = 0  # Offset of data to be parsed
         self._write_offset = 0  # Offset of next write position
 
+        # Scratch buffer for discarding data while paused
+        self._drain_buffer = bytearray(self.RECV_CHUNK_SIZE)
+
         # Statistics
         self._bytes_received = 0
         self._packets_parsed = 0
@@ -168,57 +240,54 @@ class BaseDemuxer:
         Main demuxer loop (runs in dedicated thread).
 
         This loop:
-        1. Receives data from socket
-        2. Parses packet headers and payloads
-        3. Places complete packets in output queue
+        1. Waits until the socket is readable (selectors: epoll/kqueue/select)
+        2. Drains everything the kernel has buffered (non-blocking recv)
+        3. Parses packet headers and payloads
+        4. Places complete packets in output queue
 
         Performance optimizations:
         - Uses read/write offsets instead of moving data
+        - Rewinds offsets without copying once everything is parsed
         - Lazy compression: only compacts when buffer is 75% full
         - Uses memoryview to avoid temporary bytes objects
+        - Receives straight into the buffer (recv_into, no bytes per recv)
+        - One parse pass per wake-up instead of one per recv
         """
         buffer = bytearray(self._buffer_size)
+        buffer_view = memoryview(buffer)
         self._read_offset = 0
         self._write_offset = 0
 
+        selector = selectors.DefaultSelector()
+        try:
+            self._socket.setblocking(False)
+            selector.register(self._socket, selectors.EVENT_READ)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to register socket with selector: {e}")
+            selector.close()
+            return
+
         try:
             while not self._stopped.is_set():
+                try:
+                    if not selector.select(timeout=self.SELECT_TIMEOUT):
+                        continue
+                except (OSError, ValueError):
+                    # Socket closed by stop()
+                    break
+
                 # When paused: drain socket to prevent TCP buffer buildup
-                # Read into buffer but don't parse (keep buffer flowing)
+                # but don't parse (keep buffer flowing)
                 if self._paused:
-                    try:
-                        # Keep reading but reset buffer to avoid parsing
-                        chunk = self._socket.recv(65536)
-                        if chunk:
-                            self._bytes_dropped += len(chunk)
-                            self._bytes_received += len(chunk)
-                    except socket.timeout:
-                        continue
-                    except OSError:
+                    if not self._drain_socket():
                         break
                     # Reset offsets to avoid parsing old data on resume
                     self._read_offset = 0
                     self._write_offset = 0
                     continue
 
-                # Calculate available space in buffer
-                available_space = self._buffer_size - self._write_offset
-
-                # Receive data from socket
-                try:
-                    chunk = self._socket.recv(min(available_space, 65536))
-                    if not chunk:
-                        # Connection closed
-                        break
-                    buffer[self._write_offset:self._write_offset + len(chunk)] = chunk
-                    self._write_offset += len(chunk)
-                    self._bytes_received += len(chunk)
-                except socket.timeout:
-                    continue
-                except OSError:
-                    if not self._stopped.is_set():
-                        logger.warning("Socket error in demuxer loop")
-                    break
+                # Receive everything currently available
+                connected = self._recv_available(buffer_view)
 
                 # Calculate remaining data size
                 remaining_size = self._write_offset - self._read_offset
@@ -227,13 +296,14 @@ class BaseDemuxer:
                     # Buffer is empty, reset offsets
                     self._read_offset = 0
                     self._write_offset = 0
+                    if not connected:
+                        break
                     continue
 
                 # Parse packets using memoryview for performance
-                view = memoryview(buffer)
                 while remaining_size > 0:
                     consumed = self._parse_buffer_with_offset(
-                        view[self._read_offset:self._write_offset],
+                        buffer_view[self._read_offset:self._write_offset],
                         remaining_size
                     )
                     if consumed == 0:
@@ -242,6 +312,15 @@ class BaseDemuxer:
                     self._read_offset += consumed
                     remaining_size -= consumed
 
+                if not connected:
+                    break
+
+                if remaining_size == 0:
+                    # Everything parsed: wrap to the start, nothing to move
+                    self._read_offset = 0
+                    self._write_offset = 0
+                    continue
+
                 # Check if buffer is getting full - trigger lazy compression
                 available_space = self._buffer_size - self._write_offset
                 if available_space < self._buffer_size * (1 - self.COMPRESSION_THRESHOLD):
@@ -250,18 +329,75 @@ class BaseDemuxer:
         except Exception as e:
             logger.error(f"Demuxer loop error: {e}", exc_info=True)
         finally:
+            selector.close()
             logger.debug(f"{self._get_thread_name()} loop ended")
 
+    def _recv_available(self, buffer_view: memoryview) -> bool:
+        """
+        Read all data the socket has buffered into the buffer (non-blocking).
+
+        Stops when the socket would block or the buffer is full.
+
+        Args:
+            buffer_view: Memoryview of the demuxer buffer; data is received
+                         in place at self._write_offset
+
+        Returns:
+            False if the connection was closed or failed, True otherwise
+        """
+        while True:
+            available_space = self._buffer_size - self._write_offset
+            if available_space == 0:
+                return True
+            write_offset = self._write_offset
+            try:
+                received = self._socket.recv_into(
+                    buffer_view[write_offset:write_offset + min(available_space, self.RECV_CHUNK_SIZE)]
+                )
+            except BlockingIOError:
+                return True
+            except OSError:
+                if not self._stopped.is_set():
+                    logger.warning("Socket error in demuxer loop")
+                return False
+            if received == 0:
+                # Connection closed
+                return False
+            self._write_offset = write_offset + received
+            self._bytes_received += received
+
+    def _drain_socket(self) -> bool:
+        """
+        Read and discard all data the socket has buffered (non-blocking).
+
+        Returns:
+            False if the connection was closed or failed, True otherwise
+        """
+        drain_buffer = self._drain_buffer
+        while True:
+            try:
+                received = self._socket.recv_into(drain_buffer)
+            except BlockingIOError:
+                return True
+            except OSError:
+                return False
+            if received == 0:
+                return False
+            self._bytes_dropped += received
+            self._bytes_received += received
+
     def _compact_buffer(self, buffer: bytearray) -> None:
         """
         Compact buffer by moving remaining data to the beginning.
 
         This is called when buffer is 75% full to avoid running out of space.
+        Only the unparsed tail (an incomplete packet) is moved.
         """
         remaining_size = self._write_offset - self._read_offset
         if remaining_size > 0:
             # Move remaining data to beginning of buffer
             buffer[:remaining_size] = buffer[self._read_offset:self._write_offset]
+            self._compression_count += 1
         self._read_offset = 0
         self._write_offset = remaining_size
 
@@ -338,6 +474,7 @@ class StreamingDemuxerBase:
     - No fixed buffer allocation
     - Header-first reading strategy
     - Exact payload reading with _recv_exact()
+    - Read-ahead batching: one recv() serves several small headers/payloads
     - Thread-safe operation
     - Graceful partial read handling
 
@@ -353,11 +490,19 @@ class StreamingDemuxerBase:
     # Optimal chunk size for _recv_exact (balances syscall overhead vs memory)
     RECV_CHUNK_SIZE = 65536  # 64KB
 
+    # Largest fixed-size header read through _recv_header()
+    MAX_HEADER_SIZE = 16
+
+    # Read-ahead buffer size; reads at least this large bypass it
+    READ_AHEAD_SIZE = 65536  # 64KB
+
     def __init__(
         self,
         sock: socket.socket,
         packet_queue: Queue,
         stats_callback: Optional[Callable] = None,
+        tcp_nodelay: bool = True,
+        recv_buffer_size: Optional[int] = DEFAULT_SOCKET_RECV_BUFFER_SIZE,
     ):
         """
         Initialize the streaming demuxer.
@@ -366,13 +511,17 @@ class StreamingDemuxerBase:
             sock: Connected socket to read from
             packet_queue: Queue for parsed packets
             stats_callback: Optional callback for statistics updates
+            tcp_nodelay: Set TCP_NODELAY on the socket (default: True)
+            recv_buffer_size: Kernel SO_RCVBUF size, None keeps the OS default
         """
         self._socket = sock
+        _configure_stream_socket(sock, tcp_nodelay, recv_buffer_size)
         self._socket.settimeout(self.RECV_TIMEOUT)
         self._packet_queue = packet_queue
 
-        # Additional packet sinks (for recording)
-        self._packet_sinks: List[Queue] = []
+        # Additional packet sinks (for recording). Copy-on-write tuple: the
+        # demuxer thread reads it without locking, writers replace it under the lock
+        self._packet_sinks: Tuple[Queue, ...] = ()
         self._sinks_lock = threading.Lock()
 
         # Threading
@@ -385,6 +534,16 @@ class StreamingDemuxerBase:
         self._pause_event = threading.Event()
         self._pause_event.set()  # Start unpaused
 
+        # Reused buffer for fixed-size packet headers (see _recv_header)
+        self._header_buffer = bytearray(self.MAX_HEADER_SIZE)
+        self._header_view = memoryview(self._header_buffer)
+
+        # Read-ahead buffer: bytes [start, end) were received but not consumed
+        self._read_ahead_buffer = bytearray(self.READ_AHEAD_SIZE)
+        self._read_ahead_view = memoryview(self._read_ahead_buffer)
+        self._read_ahead_start = 0
+        self._read_ahead_end = 0
+
         # Statistics
         self._bytes_received = 0
         self._packets_parsed = 0
@@ -393,9 +552,9 @@ class StreamingDemuxerBase:
         self._bytes_dropped = 0  # Bytes dropped while paused
         self._stats_callback = stats_callback
 
-        # Activity tracking (for screen-off detection)
+        # Activity tracking (for screen-off detection); a single attribute
+        # store/load is atomic, so it is not guarded by a lock
         self._last_packet_time: Optional[float] = None
-        self._activity_lock = threading.Lock()
 
     def start(self) -> None:
         """Start the demuxer thread."""
@@ -475,7 +634,7 @@ class StreamingDemuxerBase:
         """
         with self._sinks_lock:
             if queue not in self._packet_sinks:
-                self._packet_sinks.append(queue)
+                self._packet_sinks = self._packet_sinks + (queue,)
                 logger.info(f"{self.__class__.__name__}: added packet sink ({len(self._packet_sinks)} total)")
 
     def remove_packet_sink(self, queue: Queue) -> None:
@@ -487,7 +646,7 @@ class StreamingDemuxerBase:
         """
         with self._sinks_lock:
             if queue in self._packet_sinks:
-                self._packet_sinks.remove(queue)
+                self._packet_sinks = tuple(q for q in self._packet_sinks if q is not queue)
                 logger.info(f"{self.__class__.__name__}: removed packet sink ({len(self._packet_sinks)} remaining)")
 
     def _dispatch_to_sinks(self, packet) -> None:
@@ -497,10 +656,7 @@ class StreamingDemuxerBase:
         Args:
             packet: Packet to dispatch
         """
-        with self._sinks_lock:
-            sinks = list(self._packet_sinks)
-
-        for sink_queue in sinks:
+        for sink_queue in self._packet_sinks:
             try:
                 sink_queue.put_nowait(packet)
             except queue.Full:
@@ -545,11 +701,11 @@ class StreamingDemuxerBase:
                         self._packets_parsed += 1
 
                         # Update last packet time (for screen-off detection)
-                        with self._activity_lock:
-                            self._last_packet_time = time.time()
+                        self._last_packet_time = time.time()
 
                         # Dispatch to recording sinks (non-blocking)
-                        self._dispatch_to_sinks(packet)
+                        if self._packet_sinks:
+                            self._dispatch_to_sinks(packet)
 
                         # Optional: report statistics
                         if self._stats_callback:
@@ -577,39 +733,105 @@ class StreamingDemuxerBase:
         finally:
             logger.info(f"{self._get_thread_name()} loop ended")
 
-    def _recv_exact(self, size: int) -> bytes:
+    def _recv_exact(self, size: int) -> bytearray:
         """
         Receive exactly the specified number of bytes from socket.
 
         This is the CORE method that replaces buffer-based reading.
         It loops until all bytes are received or connection closes.
+        The bytes are received straight into one buffer of the final size
+        (recv_into), which is returned as-is: no per-chunk allocations and no
+        final copy. av.Packet() wraps the buffer without copying it either.
+        Each payload gets a new buffer: it is shared by the decoder, recording
+        sinks and config caches, so the demuxer never reuses it.
 
         Args:
             size: Exact number of bytes to read
 
         Returns:
-            bytes: Exactly 'size' bytes
+            bytearray: Exactly 'size' bytes, owned by the caller
 
         Raises:
             IncompleteReadError: If connection closes before reading all bytes
         """
-        buffer = bytearray()
-        remaining = size
+        buffer = bytearray(size)
+        self._recv_exact_into(memoryview(buffer))
+        return buffer
+
+    def _recv_header(self, size: int) -> memoryview:
+        """
+        Receive a fixed-size header into the reused header buffer.
+
+        Headers are parsed immediately (struct.unpack), so they do not need
+        a buffer of their own.
+
+        Args:
+            size: Header size in bytes (at most MAX_HEADER_SIZE)
+
+        Returns:
+            memoryview of 'size' bytes, valid until the next _recv_header() call
+
+        Raises:
+            IncompleteReadError: If connection closes before reading all bytes
+        """
+        view = self._header_view[:size]
+        self._recv_exact_into(view)
+        return view
+
+    def _recv_exact_into(self, view: memoryview) -> None:
+        """
+        Fill view completely from the socket with recv_into().
+
+        Small reads go through the read-ahead buffer: a single recv_into()
+        takes whatever the kernel has queued (up to READ_AHEAD_SIZE), so a
+        burst of small packets (e.g. OPUS frames) costs one syscall instead
+        of two per packet. Reads of READ_AHEAD_SIZE or more are received
+        straight into view.
+
+        Args:
+            view: Writable memoryview to fill
+
+        Raises:
+            IncompleteReadError: If connection closes before view is filled
+        """
+        size = len(view)
+        received = 0
+
+        # Serve what is already buffered
+        start = self._read_ahead_start
+        buffered = self._read_ahead_end - start
+        if buffered:
+            n = min(buffered, size)
+            view[:n] = self._read_ahead_view[start:start + n]
+            self._read_ahead_start = start + n
+            received = n
+
+        while received < size:
+            remaining = size - received
+            if remaining < self.READ_AHEAD_SIZE:
+                # Read-ahead buffer is empty here: refill it in one call
+                n = self._socket.recv_into(self._read_ahead_view)
+                if n == 0:
+                    # Connection closed
+                    raise IncompleteReadError(size, received)
+                self._bytes_received += n
+                used = min(n, remaining)
+                view[received:received + used] = self._read_ahead_view[:used]
+                self._read_ahead_start = used
+                self._read_ahead_end = n
+                received += used
+                continue
 
-        while remaining > 0:
             # Read in reasonable chunks
             chunk_size = min(remaining, self.RECV_CHUNK_SIZE)
-            chunk = self._socket.recv(chunk_size)
+            n = self._socket.recv_into(view[received:received + chunk_size])
 
-            if len(chunk) == 0:
+            if n == 0:
                 # Connection closed
-                raise IncompleteReadError(size, len(buffer))
-
-            buffer.extend(chunk)
-            remaining -= len(chunk)
-            self._bytes_received += len(chunk)
+                raise IncompleteReadError(size, received)
 
-        return bytes(buffer)
+            received += n
+            self._bytes_received += n
 
     def _recv_packet(self):
         """
@@ -644,8 +866,7 @@ class StreamingDemuxerBase:
             Unix timestamp of last packet, or None if no packets received yet.
             Used for screen-off detection.
         """
-        with self._activity_lock:
-            return self._last_packet_time
+        return self._last_packet_time
 
     def get_idle_seconds(self) -> float:
         """
@@ -654,7 +875,7 @@ class StreamingDemuxerBase:
         Returns:
             Seconds since last packet, or float('inf') if no packets received.
         """
-        with self._activity_lock:
-            if self._last_packet_time is None:
-                return float('inf')
-            return time.time() - self._last_packet_time
+        last_packet_time = self._last_packet_time
+        if last_packet_time is None:
+            return float('inf')
+        return time.time() - last_packet_time
@@ -3,13 +3,21 @@ Factory functions for creating demuxer instances.
 
 This module provides convenience functions for creating demuxers
 with appropriate packet queues.
+
+The packet queues are queue.Queue objects rather than an SPSC ring: the
+demuxer is not the only producer (VideoDecoder.stop() posts a None sentinel
+from the caller's thread), and both sides need blocking waits with timeouts,
+which a GIL-bound ring would still implement with a lock and condition.
+Video queues are VideoPacketQueues, which drop whole GOP tails under the
+queue lock when the decoder falls behind.
 """
 
 import socket
 from queue import Queue
 from typing import Callable, Optional, TYPE_CHECKING
 
-from .base import DEFAULT_PACKET_QUEUE_SIZE
+from .base import DEFAULT_PACKET_QUEUE_SIZE, DEFAULT_SOCKET_RECV_BUFFER_SIZE
+from .packet_queue import VideoPacketQueue
 from .video import VideoDemuxer, StreamingVideoDemuxer
 
 # Use TYPE_CHECKING for type hints to avoid circular import
@@ -25,7 +33,7 @@ def create_video_demuxer(
     sock: socket.socket,
     codec_id: int,
     packet_queue_size: int = DEFAULT_PACKET_QUEUE_SIZE
-) -> tuple[VideoDemuxer, Queue]:
+) -> tuple[VideoDemuxer, VideoPacketQueue]:
     """
     Convenience function to create a video demuxer with packet queue.
 
@@ -35,9 +43,9 @@ def create_video_demuxer(
         packet_queue_size: Size of packet queue
 
     Returns:
-        Tuple of (VideoDemuxer, Queue)
+        Tuple of (VideoDemuxer, VideoPacketQueue)
     """
-    packet_queue = Queue(maxsize=packet_queue_size)
+    packet_queue = VideoPacketQueue(maxsize=packet_queue_size)
     demuxer = VideoDemuxer(sock, packet_queue, codec_id)
     return demuxer, packet_queue
 
@@ -73,8 +81,10 @@ def create_audio_demuxer(
 def create_streaming_video_demuxer(
     sock: socket.socket,
     codec_id: int,
-    packet_queue_size: int = DEFAULT_PACKET_QUEUE_SIZE
-) -> tuple[StreamingVideoDemuxer, Queue]:
+    packet_queue_size: int = DEFAULT_PACKET_QUEUE_SIZE,
+    tcp_nodelay: bool = True,
+    recv_buffer_size: Optional[int] = DEFAULT_SOCKET_RECV_BUFFER_SIZE
+) -> tuple[StreamingVideoDemuxer, VideoPacketQueue]:
     """
     Create a streaming video demuxer with packet queue.
 
@@ -82,12 +92,18 @@ def create_streaming_video_demuxer(
         sock: Video socket
         codec_id: Video codec ID
         packet_queue_size: Size of packet queue (default: 1 for minimal latency)
+        tcp_nodelay: Set TCP_NODELAY on the socket (default: True)
+        recv_buffer_size: Kernel SO_RCVBUF size, None keeps the OS default
 
     Returns:
-        Tuple of (StreamingVideoDemuxer, Queue)
+        Tuple of (StreamingVideoDemuxer, VideoPacketQueue)
     """
-    packet_queue = Queue(maxsize=packet_queue_size)
-    demuxer = StreamingVideoDemuxer(sock, packet_queue, codec_id)
+    packet_queue = VideoPacketQueue(maxsize=packet_queue_size)
+    demuxer = StreamingVideoDemuxer(
+        sock, packet_queue, codec_id,
+        tcp_nodelay=tcp_nodelay,
+        recv_buffer_size=recv_buffer_size
+    )
     return demuxer, packet_queue
 
 
@@ -95,7 +111,9 @@ def create_streaming_audio_demuxer(
     sock: socket.socket,
     audio_codec: int = 1,  # OPUS
     packet_queue_size: int = DEFAULT_PACKET_QUEUE_SIZE,
-    stats_callback: Optional[Callable] = None
+    stats_callback: Optional[Callable] = None,
+    tcp_nodelay: bool = True,
+    recv_buffer_size: Optional[int] = DEFAULT_SOCKET_RECV_BUFFER_SIZE
 ):
     """
     Create a streaming audio demuxer with packet queue.
@@ -105,6 +123,8 @@ def create_streaming_audio_demuxer(
         audio_codec: Audio codec type
         packet_queue_size: Size of packet queue
         stats_callback: Optional statistics callback
+        tcp_nodelay: Set TCP_NODELAY on the socket (default: True)
+        recv_buffer_size: Kernel SO_RCVBUF size, None keeps the OS default
 
     Returns:
         Tuple of (StreamingAudioDemuxer, Queue)
@@ -115,7 +135,9 @@ def create_streaming_audio_demuxer(
     packet_queue = Queue(maxsize=packet_queue_size)
     demuxer = StreamingAudioDemuxer(
         sock, packet_queue, audio_codec,
-        stats_callback=stats_callback
+        stats_callback=stats_callback,
+        tcp_nodelay=tcp_nodelay,
+        recv_buffer_size=recv_buffer_size
     )
     return demuxer, packet_queue
 
@@ -153,6 +175,9 @@ def create_video_demuxer_for_mode(
             - pli_threshold: Consecutive drops before PLI (default: 10)
             - pli_cooldown: Seconds between PLI requests (default: 1.0)
             - stats_callback: Statistics callback
+          and for ADB/TCP modes:
+            - tcp_nodelay: Set TCP_NODELAY (default: True)
+            - recv_buffer_size: Kernel SO_RCVBUF size (default: platform dependent)
 
     Returns:
         Tuple of (demuxer, packet_queue)
@@ -169,7 +194,7 @@ def create_video_demuxer_for_mode(
             pli_threshold=10
         )
     """
-    packet_queue = Queue(maxsize=packet_queue_size)
+    packet_queue = VideoPacketQueue(maxsize=packet_queue_size)
 
     if mode == 'udp':
         # UDP mode: use specialized UdpVideoDemuxer
@@ -188,7 +213,11 @@ def create_video_demuxer_for_mode(
         )
     else:
         # ADB and TCP modes: use streaming demuxer
-        demuxer = StreamingVideoDemuxer(sock, packet_queue, codec_id)
+        demuxer = StreamingVideoDemuxer(
+            sock, packet_queue, codec_id,
+            tcp_nodelay=kwargs.get('tcp_nodelay', True),
+            recv_buffer_size=kwargs.get('recv_buffer_size', DEFAULT_SOCKET_RECV_BUFFER_SIZE)
+        )
 
     return demuxer, packet_queue
 
@@ -208,7 +237,9 @@ def create_audio_demuxer_for_mode(
         sock: Socket (TCP or UDP)
         audio_codec: Audio codec ID (default: OPUS)
         packet_queue_size: Size of packet queue
-        **kwargs: Additional arguments (for future UDP audio support)
+        **kwargs: Additional arguments:
+            - fec_decoder, stats_callback (UDP mode)
+            - tcp_nodelay, recv_buffer_size (ADB/TCP modes)
 
     Returns:
         Tuple of (demuxer, packet_queue)
@@ -232,7 +263,9 @@ def create_audio_demuxer_for_mode(
 
         demuxer = StreamingAudioDemuxer(
             sock, packet_queue, audio_codec,
-            stats_callback=kwargs.get('stats_callback')
+            stats_callback=kwargs.get('stats_callback'),
+            tcp_nodelay=kwargs.get('tcp_nodelay', True),
+            recv_buffer_size=kwargs.get('recv_buffer_size', DEFAULT_SOCKET_RECV_BUFFER_SIZE)
         )
 
     return demuxer, packet_queue
@@ -0,0 +1,205 @@
+"""
+Video packet queue with GOP-aware backpressure.
+
+The demuxer thread put()s parsed VideoPackets and the decoder thread get()s
+them. When the decoder falls behind, dropping an arbitrary packet would leave
+every later packet of its GOP referencing a frame the decoder never saw, so
+the queue decides what to drop itself, under its own mutex.
+"""
+
+import logging
+import time
+from queue import Queue
+from typing import Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two log lines summarizing dropped packets
+DROP_LOG_INTERVAL: float = 1.0
+
+
+class VideoPacketQueue(Queue):
+    """
+    Bounded VideoPacket queue that drops whole GOP tails instead of single packets.
+
+    put() waits for room like Queue.put(). If the queue is still full when the
+    wait ends (or block=False), it makes room instead of raising Full:
+    - an incoming key frame supersedes every queued media packet
+    - otherwise the oldest queued non-key packet is dropped together with the
+      queued packets that reference it (up to the next key frame)
+    - if no key frame follows, the reference chain stays broken: media packets
+      are discarded until the next key frame, and on_key_frame_needed is
+      called once so the server can be asked for one (PLI)
+
+    Config packets are never dropped and are queued even when the queue is
+    full, so it may briefly hold more than maxsize packets. An incoming key
+    frame is always queued, and so is the None stop sentinel (which discards
+    whatever is still queued).
+
+    The drop decision and the re-queue run under the Queue mutex, so they are
+    atomic with respect to get() and to VideoDecoder.stop()'s sentinel put().
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1,
+        on_key_frame_needed: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize the packet queue.
+
+        Args:
+            maxsize: Number of packets held before backpressure applies
+            on_key_frame_needed: Called with a reason string (outside the queue
+                lock) when a drop broke the reference chain
+        """
+        super().__init__(maxsize)
+        self.on_key_frame_needed = on_key_frame_needed
+        self._awaiting_key_frame = False
+        self._dropped_count = 0  # Packets dropped since the last log line
+        self._drop_log_time = 0.0
+
+    def put(self, item, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Put a packet (or the None stop sentinel), dropping stale packets if full.
+
+        Args:
+            item: VideoPacket to queue, or None to stop the consumer
+            block: Wait for room before dropping anything
+            timeout: Maximum wait in seconds (None waits until there is room)
+        """
+        reason = None
+        with self.not_full:
+            if item is not None and self._awaiting_key_frame:
+                header = item.header
+                if header.is_key_frame and not header.is_config:
+                    self._awaiting_key_frame = False
+                elif not header.is_config:
+                    # References a dropped frame: undecodable until the next key frame
+                    self._count_drops(1)
+                    return
+
+            if block and self.maxsize > 0:
+                if timeout is None:
+                    while self._qsize() >= self.maxsize:
+                        self.not_full.wait()
+                elif timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                else:
+                    endtime = time.monotonic() + timeout
+                    while self._qsize() >= self.maxsize:
+                        remaining = endtime - time.monotonic()
+                        if remaining <= 0.0:
+                            break
+                        self.not_full.wait(remaining)
+
+            reason = self._admit(item)
+
+        if reason is not None:
+            callback = self.on_key_frame_needed
+            if callback is not None:
+                try:
+                    callback(reason)
+                except Exception as e:
+                    logger.warning(f"Key frame request failed: {e}")
+
+    def _admit(self, item) -> Optional[str]:
+        """
+        Queue item, making room first if the queue is full. Caller holds the mutex.
+
+        Returns:
+            Reason string if a key frame must be requested, None otherwise
+        """
+        queue = self.queue
+        if self.maxsize <= 0 or len(queue) < self.maxsize:
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+            return None
+
+        queued = list(queue)
+        before = len(queued)
+        admitted = True
+        chain_broken = False
+
+        if item is None:
+            # Stopping: nothing queued will be decoded anyway
+            queued = []
+        elif item.header.is_config:
+            # Config packets are tiny and rare: queue them without dropping anything
+            pass
+        elif item.header.is_key_frame:
+            # Nothing queued before a key frame is needed to decode it
+            queued = [p for p in queued if p is None or p.header.is_config]
+        else:
+            first_media = next(
+                (i for i, p in enumerate(queued) if p is not None
+                 and not (p.header.is_config or p.header.is_key_frame)),
+                None
+            )
+            if first_media is not None:
+                queued, chain_broken = self._drop_gop_tail(queued, first_media)
+            if chain_broken or len(queued) >= self.maxsize:
+                # The incoming packet references the dropped frame as well, or
+                # only config/key frames are queued and it has to give way
+                admitted = False
+                chain_broken = True
+
+        if admitted:
+            queued.append(item)
+        dropped = before + 1 - len(queued)
+
+        queue.clear()
+        queue.extend(queued)
+        self.unfinished_tasks += len(queued) - before
+        if not self.unfinished_tasks:
+            self.all_tasks_done.notify_all()
+        if queued:
+            self.not_empty.notify()
+
+        if dropped:
+            self._count_drops(dropped)
+        if chain_broken and not self._awaiting_key_frame:
+            self._awaiting_key_frame = True
+            return f"{dropped} packets dropped on a full queue"
+        return None
+
+    @staticmethod
+    def _drop_gop_tail(queued: list, index: int) -> Tuple[list, bool]:
+        """
+        Drop queued[index] and the queued media packets that reference it.
+
+        Every non-key media packet after index depends on the dropped one
+        until the next key frame. Config packets and the stop sentinel are kept.
+
+        Args:
+            queued: Queued packets in FIFO order
+            index: Index of the non-key packet to drop
+
+        Returns:
+            Tuple of (remaining packets, True if no key frame follows so the
+            reference chain stays broken)
+        """
+        kept = queued[:index]
+        resumed = False
+        for p in queued[index + 1:]:
+            if p is None or p.header.is_config:
+                kept.append(p)
+            elif p.header.is_key_frame:
+                resumed = True
+                kept.append(p)
+            elif resumed:
+                kept.append(p)
+        return kept, not resumed
+
+    def _count_drops(self, dropped: int) -> None:
+        """Accumulate dropped packets and log them once per DROP_LOG_INTERVAL."""
+        self._dropped_count += dropped
+        now = time.monotonic()
+        if now - self._drop_log_time >= DROP_LOG_INTERVAL:
+            logger.warning(
+                f"[SMART_DROP] Decoder behind: dropped {self._dropped_count} video packets"
+                + (" (waiting for key frame)" if self._awaiting_key_frame else "")
+            )
+            self._dropped_count = 0
+            self._drop_log_time = now
@@ -1423,21 +1423,8 @@ class UdpVideoDemuxer:
     def _queue_packet(self, packet: VideoPacket) -> None:
         """Put packet in queue for decoder."""
         try:
-            # PRIORITY: Config packets should never be dropped
-            # If queue is full and this is a config packet, clear old packets first
-            if packet.header.is_config:
-                qsize = self._packet_queue.qsize()
-                if qsize >= self._packet_queue.maxsize - 1:
-                    # Queue nearly full, clear old packets to make room for config
-                    logger.warning(f"[CONFIG-PRIORITY] Queue full ({qsize}), clearing for config packet")
-                    cleared = 0
-                    while not self._packet_queue.empty() and cleared < qsize:
-                        try:
-                            self._packet_queue.get_nowait()
-                            cleared += 1
-                        except:
-                            break
-                    logger.info(f"[CONFIG-PRIORITY] Cleared {cleared} packets for config")
+            # Config packets are never dropped: the VideoPacketQueue queues them
+            # even when full, and drops stale media on GOP boundaries
 
             # DEBUG: Check PTS order (only for non-config packets)
             if not packet.header.is_config:
@@ -10,9 +10,9 @@ import socket
 from typing import Optional
 from queue import Queue
 
-from .base import BaseDemuxer, DEFAULT_DEMUXER_BUFFER_SIZE
-from ..protocol import CodecId
-from ..stream import StreamParser, VideoPacket, PacketHeader
+from .base import BaseDemuxer, DEFAULT_DEMUXER_BUFFER_SIZE, DEFAULT_SOCKET_RECV_BUFFER_SIZE
+from ..protocol import CodecId, PACKET_HEADER_SIZE
+from ..stream import StreamParser, VideoPacket, PacketHeader, PACKET_HEADER_STRUCT
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +39,9 @@ class VideoDemuxer(BaseDemuxer):
         sock: socket.socket,
         packet_queue: Queue,
         codec_id: int,
-        buffer_size: int = DEFAULT_DEMUXER_BUFFER_SIZE
+        buffer_size: int = DEFAULT_DEMUXER_BUFFER_SIZE,
+        tcp_nodelay: bool = True,
+        recv_buffer_size: Optional[int] = DEFAULT_SOCKET_RECV_BUFFER_SIZE
     ):
         """
         Initialize the video demuxer.
@@ -49,8 +51,10 @@ class VideoDemuxer(BaseDemuxer):
             packet_queue: Queue for parsed video packets
             codec_id: Video codec ID (H264, H265, or AV1)
             buffer_size: Receive buffer size (default: 256KB)
+            tcp_nodelay: Set TCP_NODELAY on the socket (default: True)
+            recv_buffer_size: Kernel SO_RCVBUF size, None keeps the OS default
         """
-        super().__init__(sock, packet_queue, buffer_size)
+        super().__init__(sock, packet_queue, buffer_size, tcp_nodelay, recv_buffer_size)
         self._codec_id = codec_id
         self._parser = StreamParser()
 
@@ -95,7 +99,9 @@ class VideoDemuxer(BaseDemuxer):
         """
         Parse video packets from buffer using memoryview (optimized).
 
-        This avoids creating a temporary bytes object, reducing memory allocations.
+        The header is decoded in place (struct.unpack_from on the view), so
+        incomplete packets cost no copy and a complete packet copies only its
+        own bytes, not everything buffered behind it.
 
         Args:
             view: Memoryview of data buffer
@@ -105,16 +111,20 @@ class VideoDemuxer(BaseDemuxer):
             Number of bytes consumed (0 if packet incomplete)
         """
         try:
-            # Convert memoryview to bytes only for the parser
-            # This is still more efficient than slicing a bytearray
-            packet, remaining = self._parser.parse_packet(
-                bytes(view[:size]), self._codec_id
-            )
-
-            if packet is None:
+            if size < PACKET_HEADER_SIZE:
+                # Incomplete header
+                return 0
+            payload_size = PACKET_HEADER_STRUCT.unpack_from(view)[1]
+            packet_size = PACKET_HEADER_SIZE + payload_size
+            if size < packet_size:
                 # Incomplete packet
                 return 0
 
+            # Copy just this packet for the parser
+            packet, _ = self._parser.parse_packet(
+                bytes(view[:packet_size]), self._codec_id
+            )
+
             # CRITICAL: Log config packets and key frames for diagnosis
             # Config packets indicate codec parameter changes (SPS/PPS for H.264)
             # Key frames indicate refresh points (could help diagnose video issues)
@@ -138,7 +148,7 @@ class VideoDemuxer(BaseDemuxer):
                 logger.warning("Video packet queue timeout, skipping packet")
 
             # Return number of bytes consumed
-            return size - len(remaining)
+            return packet_size
 
         except Exception as e:
             self._parse_errors += 1
@@ -181,7 +191,9 @@ class StreamingVideoDemuxer(StreamingDemuxerBase):
         sock: socket.socket,
         packet_queue: Queue,
         codec_id: int,
-        stats_callback: Optional[Callable] = None
+        stats_callback: Optional[Callable] = None,
+        tcp_nodelay: bool = True,
+        recv_buffer_size: Optional[int] = DEFAULT_SOCKET_RECV_BUFFER_SIZE
     ):
         """
         Initialize video demuxer.
@@ -191,8 +203,10 @@ class StreamingVideoDemuxer(StreamingDemuxerBase):
             packet_queue: Queue for VideoPacket objects
             codec_id: Video codec ID (H264/H265/AV1)
             stats_callback: Optional statistics callback
+            tcp_nodelay: Set TCP_NODELAY on the socket (default: True)
+            recv_buffer_size: Kernel SO_RCVBUF size, None keeps the OS default
         """
-        super().__init__(sock, packet_queue, stats_callback)
+        super().__init__(sock, packet_queue, stats_callback, tcp_nodelay, recv_buffer_size)
         self._codec_id = codec_id
         self._config_data: Optional[bytes] = None  # Buffer for config merging
         self._screenshot_queue: Optional[Queue] = None  # Queue for screenshot requests
@@ -239,14 +253,14 @@ class StreamingVideoDemuxer(StreamingDemuxerBase):
         """
         try:
             # Step 1: Read exactly 12 bytes for header
-            header_data = self._recv_exact(self.VIDEO_HEADER_SIZE)
+            header_data = self._recv_header(self.VIDEO_HEADER_SIZE)
 
             # Debug: Log raw header bytes for diagnosis
             if self._packets_parsed < 5:
                 logger.debug(f"Raw header bytes: {header_data.hex()}")
 
             # Step 2: Parse header
-            pts_flags, payload_size = struct.unpack('>QI', header_data)
+            pts_flags, payload_size = PACKET_HEADER_STRUCT.unpack(header_data)
             is_config = bool(pts_flags & (1 << 63))
             is_key_frame = bool(pts_flags & (1 << 62))
             pts = pts_flags & 0x3FFFFFFFFFFFFFFF
@@ -75,8 +75,12 @@ class HeartbeatManager:
         self._timeout = timeout
 
         # State
+        # _last_pong_time is reported to callers (epoch seconds); the timeout
+        # check uses the monotonic clock so NTP steps cannot trigger or mask it
         self._last_pong_time = time.time()
+        self._last_pong_monotonic = time.monotonic()
         self._running = False
+        self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
 
@@ -95,7 +99,9 @@ class HeartbeatManager:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._last_pong_time = time.time()
+        self._last_pong_monotonic = time.monotonic()
         self._thread = threading.Thread(
             target=self._heartbeat_loop,
             name="Heartbeat",
@@ -111,6 +117,7 @@ class HeartbeatManager:
 
         logger.info("Stopping heartbeat thread...")
         self._running = False
+        self._stop_event.set()
 
         if self._thread is not None:
             self._thread.join(timeout=2.0)
@@ -130,6 +137,7 @@ class HeartbeatManager:
         """
         with self._lock:
             self._last_pong_time = time.time()
+            self._last_pong_monotonic = time.monotonic()
             self._pongs_received += 1
 
         logger.debug(f"PONG received: timestamp={timestamp}")
@@ -151,7 +159,7 @@ class HeartbeatManager:
 
             # Check timeout
             with self._lock:
-                time_since_pong = time.time() - self._last_pong_time
+                time_since_pong = time.monotonic() - self._last_pong_monotonic
 
             if time_since_pong > self._timeout:
                 logger.warning(
@@ -164,11 +172,9 @@ class HeartbeatManager:
                     logger.error(f"Timeout callback error: {e}")
                 break
 
-            # Sleep until next PING
-            # Use small sleep intervals to allow quick stop()
-            sleep_end = time.time() + self._ping_interval
-            while self._running and time.time() < sleep_end:
-                time.sleep(0.1)  # 100ms check interval
+            # Sleep until next PING; stop() wakes the wait immediately
+            if self._stop_event.wait(self._ping_interval):
+                break
 
         logger.debug("Heartbeat loop ended")
 
@@ -863,24 +863,24 @@ def create_opengl_video_widget_class():
                         # Record consume time for end-to-end latency tracking
                         consume_time = time.time()
 
-                        # DelayBuffer returns FrameWithMetadata, extract frame
-                        new_frame = result.frame if hasattr(result, 'frame') else result
+                        # DelayBuffer.consume() always returns a FrameWithMetadata
+                        new_frame = result.frame
 
                         # Calculate and log end-to-end latency
                         e2e_client_ms = 0.0
                         e2e_device_ms = 0.0
 
                         # Client-side E2E: UDP recv → consume
-                        if hasattr(result, 'udp_recv_time') and result.udp_recv_time > 0:
+                        if result.udp_recv_time > 0:
                             e2e_client_ms = (consume_time - result.udp_recv_time) * 1000
 
                         # Full E2E: Device send → consume (requires clock sync)
-                        if hasattr(result, 'send_time_ns') and result.send_time_ns > 0:
+                        if result.send_time_ns > 0:
                             # Convert consume_time to nanoseconds and calculate latency
                             consume_time_ns = consume_time * 1e9
                             e2e_device_ms = (consume_time_ns - result.send_time_ns) / 1e6
 
-                        packet_id = getattr(result, 'packet_id', -1)
+                        packet_id = result.packet_id
 
                         # Log every frame for first 10, then every 60 frames
                         if frame_num <= 10 or frame_num % 60 == 0:
@@ -410,7 +410,7 @@ def create_opengl_video_renderer_class():
                         result = self._delay_buffer.consume()
                         if result is not None:
                             self._frame_consume_count = getattr(self, '_frame_consume_count', 0) + 1
-                            new_frame = result.frame if hasattr(result, 'frame') else result
+                            new_frame = result.frame  # Always a FrameWithMetadata
 
                     # Process the frame if we got one (COMMON CODE FOR BOTH SHM AND DelayBuffer)
                     if new_frame is not None:
@@ -11,6 +11,8 @@ import time
 import numpy as np
 from typing import Optional, Tuple, Dict, Any
 
+from scrcpy_py_ddlx.core.decoder.delay_buffer import FrameWithMetadata
+
 logger = logging.getLogger(__name__)
 
 
@@ -127,7 +129,10 @@ class DelayBufferAdapter:
     """
     Adapter that mimics DelayBuffer interface but reads from SHM.
 
-    This allows using SHM with existing code that expects DelayBuffer.
+    This allows using SHM with existing code that expects DelayBuffer:
+    consume() and get_nowait() return a FrameWithMetadata (or None), like
+    DelayBuffer. SHM carries no packet ID or device send time, so those
+    fields keep their defaults.
     """
 
     def __init__(self, shm_source: SHMFrameSource):
@@ -139,19 +144,23 @@ class DelayBufferAdapter:
         """
         self._source = shm_source
         self._consumed = False
+        self._last_result: Optional[FrameWithMetadata] = None
 
-    def consume(self):
+    def consume(self) -> Optional[FrameWithMetadata]:
         """Consume frame (mimics DelayBuffer.consume())."""
         result = self._source.consume()
         if result:
             self._consumed = True
-            # Return in format expected by renderer
             frame_data, metadata = result
-            # Wrap in a simple object with frame attribute
-            class FrameWrapper:
-                def __init__(self, frame):
-                    self.frame = frame
-            return FrameWrapper(frame_data)
+            self._last_result = FrameWithMetadata(
+                frame=frame_data,
+                pts=metadata['pts'],
+                capture_time=metadata['capture_time'],
+                udp_recv_time=metadata['udp_recv_time'],
+                width=frame_data['width'],
+                height=frame_data['height'],
+            )
+            return self._last_result
         return None
 
     def has_new_frame(self) -> bool:
@@ -162,9 +171,9 @@ class DelayBufferAdapter:
         """No-op (decoder process handles pushing)."""
         pass
 
-    def get_nowait(self):
-        """Get current frame."""
-        return self._source._last_frame
+    def get_nowait(self) -> Optional[FrameWithMetadata]:
+        """Get the last consumed frame (mimics DelayBuffer.get_nowait())."""
+        return self._last_result
 
 
 def create_shm_video_source(shm_info: Dict[str, Any]) -> SHMFrameSource:
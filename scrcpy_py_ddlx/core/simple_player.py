@@ -91,7 +91,9 @@ class SimpleVideoPlayer:
             for frame in self._codec.decode(av_packet):
                 # Convert YUV420P to RGB (simple, no special handling)
                 frame_rgb = frame.reformat(format='rgb24')
-                rgb_array = frame_rgb.to_ndarray().copy()
+                # to_ndarray() is already a view that owns frame_rgb; copy only
+                # when swscale padded the rows
+                rgb_array = np.ascontiguousarray(frame_rgb.to_ndarray())
 
                 # Store in buffer (overwrites previous)
                 with self._frame_lock:
@@ -25,6 +25,10 @@ from .protocol import (
     CodecId,
 )
 
+# Packet header: pts_flags (8 bytes) + payload size (4 bytes), big-endian.
+# Shared with the demuxers so the format is compiled once.
+PACKET_HEADER_STRUCT = struct.Struct('>QI')
+
 
 @dataclass
 class PacketHeader:
@@ -226,7 +230,7 @@ class StreamParser:
             )
 
         # Unpack: 8 bytes pts_flags + 4 bytes size
-        pts_flags, size = struct.unpack('>QI', data[:PACKET_HEADER_SIZE])
+        pts_flags, size = PACKET_HEADER_STRUCT.unpack_from(data)
 
         has_config = is_config_packet(pts_flags)
         has_key_frame = is_key_frame(pts_flags)
@@ -311,6 +315,10 @@ class DataBuffer:
 
     This helper class manages a growing buffer of bytes, useful for
     handling TCP streams where data may arrive in chunks.
+
+    Consumed bytes are skipped with a read offset; the buffer is only
+    compacted once the offset passes half of it, so consume() does not
+    memmove the remaining data on every call.
     """
 
     def __init__(self, initial_data: bytes = b'') -> None:
@@ -321,6 +329,7 @@ class DataBuffer:
             initial_data: Optional initial data to store
         """
         self._buffer = bytearray(initial_data)
+        self._read_pos = 0
 
     def feed(self, data: bytes) -> None:
         """
@@ -344,13 +353,23 @@ class DataBuffer:
         Raises:
             ValueError: If buffer doesn't contain enough bytes
         """
-        if len(self._buffer) < size:
+        if len(self) < size:
             raise ValueError(
-                f"Cannot consume {size} bytes from buffer of size {len(self._buffer)}"
+                f"Cannot consume {size} bytes from buffer of size {len(self)}"
             )
 
-        result = bytes(self._buffer[:size])
-        del self._buffer[:size]
+        start = self._read_pos
+        with memoryview(self._buffer) as view:
+            result = bytes(view[start:start + size])
+        self._read_pos = start + size
+
+        # Compact lazily (amortized O(1) per consumed byte)
+        if self._read_pos == len(self._buffer):
+            self._buffer.clear()
+            self._read_pos = 0
+        elif self._read_pos > len(self._buffer) // 2:
+            del self._buffer[:self._read_pos]
+            self._read_pos = 0
         return result
 
     def peek(self, size: int) -> bytes:
@@ -366,25 +385,28 @@ class DataBuffer:
         Raises:
             ValueError: If buffer doesn't contain enough bytes
         """
-        if len(self._buffer) < size:
+        if len(self) < size:
             raise ValueError(
-                f"Cannot peek {size} bytes from buffer of size {len(self._buffer)}"
+                f"Cannot peek {size} bytes from buffer of size {len(self)}"
             )
 
-        return bytes(self._buffer[:size])
+        start = self._read_pos
+        with memoryview(self._buffer) as view:
+            return bytes(view[start:start + size])
 
     @property
     def size(self) -> int:
         """Return the current size of the buffer."""
-        return len(self._buffer)
+        return len(self._buffer) - self._read_pos
 
     def __len__(self) -> int:
         """Return the current size of the buffer."""
-        return len(self._buffer)
+        return len(self._buffer) - self._read_pos
 
     def clear(self) -> None:
         """Clear all data from the buffer."""
         self._buffer.clear()
+        self._read_pos = 0
 
 
 def parse_h264_nalu_type(data: bytes) -> int:
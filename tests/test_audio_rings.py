@@ -0,0 +1,223 @@
+"""
+SPSC sample rings of SoundDevicePlayer (int16 frames) and AudioPlayer (bytes),
+with stubbed sounddevice / PyAudio modules.
+"""
+
+import sys
+import threading
+import types
+
+import numpy as np
+import pytest
+
+from scrcpy_py_ddlx.core import av_player
+from scrcpy_py_ddlx.core.audio import sounddevice_player
+from scrcpy_py_ddlx.core.audio.sounddevice_player import SoundDevicePlayer
+
+
+class FakeOutputStream:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.active = False
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.active = False
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def sd_player(request, monkeypatch):
+    monkeypatch.setattr(sounddevice_player, "SOUNDDEVICE_AVAILABLE", True)
+    monkeypatch.setattr(sounddevice_player, "sd", types.SimpleNamespace(OutputStream=FakeOutputStream))
+    if request.param == "numpy":
+        monkeypatch.setattr(sounddevice_player, "_ring_push", sounddevice_player._ring_push_numpy)
+        monkeypatch.setattr(sounddevice_player, "_ring_drain", sounddevice_player._ring_drain_numpy)
+    # 1 kHz keeps the ring small: 200 frames latency cap, 512 frames capacity
+    player = SoundDevicePlayer(max_buffer_ms=200, prebuffer_ms=0)
+    assert player.open({"sample_rate": 1000, "channels": 2})
+    assert player._ring.shape == (512, 2)
+    player.start()
+    yield player
+    player.close()
+
+
+@pytest.fixture
+def fast_switching():
+    """Switch threads often so producer and consumer interleave on one core."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def frames(start, count):
+    """(count, 2) int16 frames whose samples are their frame number."""
+    values = np.arange(start, start + count, dtype=np.int16)
+    return np.repeat(values[:, None], 2, axis=1)
+
+
+def test_sd_ring_wraps_around(sd_player):
+    callback = sd_player._stream.kwargs["callback"]
+    out = np.empty((37, 2), dtype=np.int16)
+    for i in range(100):  # 3700 frames, about 7 times around the ring
+        assert sd_player.push(frames(1 + i * 37, 37))
+        callback(out, 37, None, None)
+        np.testing.assert_array_equal(out, frames(1 + i * 37, 37))
+    assert sd_player._underruns == 0
+    assert sd_player._buffered_frames() == 0
+
+
+def test_sd_ring_full_drops_newest_then_callback_caps_latency(sd_player):
+    callback = sd_player._stream.kwargs["callback"]
+    sd_player.push(frames(1, 600))
+    # Producer never moves the read index: the 88 frames past capacity are dropped
+    assert sd_player._buffered_frames() == 512
+
+    out = np.empty((16, 2), dtype=np.int16)
+    callback(out, 16, None, None)
+    # Consumer skips to the newest max_buffer_frames (200) before copying
+    np.testing.assert_array_equal(out, frames(513 - 200, 16))
+    assert sd_player._buffered_frames() == 200 - 16
+
+
+def test_sd_ring_underrun_outputs_silence(sd_player):
+    callback = sd_player._stream.kwargs["callback"]
+    sd_player.push(frames(1, 10))
+    out = np.ones((16, 2), dtype=np.int16)
+    callback(out, 16, None, None)
+    assert not out.any()
+    assert sd_player._underruns == 1
+    # Queued frames are kept for the next callback
+    assert sd_player._buffered_frames() == 10
+
+
+def test_sd_ring_stress_producer_consumer(sd_player, fast_switching):
+    callback = sd_player._stream.kwargs["callback"]
+    total = 30000  # Frame numbers stay below the int16 limit
+    chunk = 20
+    blocks = []
+    done = threading.Event()
+
+    def consume():
+        out = np.empty((16, 2), dtype=np.int16)
+        while not done.is_set() or sd_player._buffered_frames() >= 16:
+            callback(out, 16, None, None)
+            blocks.append(out.copy())
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for start in range(1, total + 1, chunk):
+        sd_player.push(frames(start, chunk))
+    done.set()
+    consumer.join()
+
+    last = 0
+    for block in blocks:
+        np.testing.assert_array_equal(block[:, 0], block[:, 1])
+        if not block.any():
+            continue  # Underrun
+        # Drops skip frames but never reorder or repeat them
+        assert block[0, 0] > last
+        assert np.all(np.diff(block[:, 0].astype(np.int64)) > 0)
+        last = block[-1, 0]
+    assert last > 0
+
+
+class FakePyAudio:
+    def open(self, **kwargs):
+        return types.SimpleNamespace(
+            kwargs=kwargs,
+            start_stream=lambda: None,
+            stop_stream=lambda: None,
+            close=lambda: None,
+        )
+
+    def terminate(self):
+        pass
+
+
+@pytest.fixture
+def pa_player(monkeypatch):
+    monkeypatch.setattr(av_player, "PYAUDIO_AVAILABLE", True)
+    monkeypatch.setattr(av_player, "pyaudio", types.SimpleNamespace(
+        PyAudio=FakePyAudio, paFloat32=1, paContinue=0, paComplete=1))
+    player = av_player.AudioPlayer(target_buffering_ms=35, output_buffer_ms=25)
+    # Mono float32 at 1 kHz: 4 bytes per frame, 1024-byte ring, 25-frame callbacks
+    assert player.open({"sample_rate": 1000, "channels": 1})
+    assert len(player._ring) == 1024
+    player.start()
+    yield player
+    player.close()
+
+
+def samples(start, count):
+    return np.arange(start, start + count, dtype=np.float32).tobytes()
+
+
+def test_byte_ring_wraps_around(pa_player):
+    for i in range(100):  # 100 x 23 frames x 4 bytes, about 9 times around
+        assert pa_player.push(samples(1 + i * 23, 23))
+        data, flag = pa_player._audio_callback(None, 23, None, 0)
+        assert flag == 0
+        assert data == samples(1 + i * 23, 23)
+    assert pa_player._frames_dropped == 0
+    assert pa_player._write_pos == pa_player._read_pos == 100 * 23 * 4
+
+
+def test_byte_ring_overflow_keeps_whole_frames(pa_player):
+    pa_player.push(samples(1, 300))
+    # 1024 bytes fit (256 frames); the remaining 44 frames are dropped
+    assert pa_player._write_pos == 1024
+    assert pa_player._bytes_overflowed == 44 * 4
+
+    pa_player._audio_callback(None, 6, None, 0)  # Frees 24 bytes
+    pa_player.push(samples(301, 5))  # 20 bytes fit
+    pa_player.push(samples(306, 5))  # 4 bytes free: 1 frame fits
+    assert pa_player._write_pos - pa_player._read_pos == 1024
+    assert pa_player._bytes_overflowed == 44 * 4 + 16
+
+    data, _ = pa_player._audio_callback(None, 256, None, 0)
+    expected = np.concatenate([np.arange(7, 257), np.arange(301, 307)]).astype(np.float32)
+    assert data == expected.tobytes()
+
+
+def test_byte_ring_underrun_returns_exact_silence(pa_player):
+    for frame_count in (25, 17, 1 << 19):
+        data, flag = pa_player._audio_callback(None, frame_count, None, 0)
+        assert flag == 0
+        assert data == bytes(frame_count * 4)
+    assert pa_player._frames_dropped == 3
+
+
+def test_byte_ring_stress_producer_consumer(pa_player, fast_switching):
+    total = 20000
+    chunk = 10
+    blocks = []
+    done = threading.Event()
+
+    def consume():
+        while not done.is_set() or pa_player._write_pos - pa_player._read_pos >= 100:
+            data, _ = pa_player._audio_callback(None, 25, None, 0)
+            blocks.append(np.frombuffer(data, dtype=np.float32))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for start in range(1, total + 1, chunk):
+        pa_player.push(samples(start, chunk))
+    done.set()
+    consumer.join()
+
+    last = 0.0
+    for block in blocks:
+        if not block.any():
+            continue  # Underrun
+        # Overflow drops the newest samples but never reorders or repeats them
+        assert block[0] > last
+        assert np.all(np.diff(block) > 0)
+        last = block[-1]
+    assert last > 0
@@ -0,0 +1,75 @@
+"""
+ControlMessageQueue.get() waiting behaviour.
+"""
+
+import threading
+import time
+
+from scrcpy_py_ddlx.core.control import ControlMessage, ControlMessageQueue
+from scrcpy_py_ddlx.core.protocol import ControlMessageType
+
+
+def make_msg():
+    return ControlMessage(ControlMessageType.INJECT_KEYCODE)
+
+
+def get_in_thread(queue, timeout):
+    result = {}
+
+    def run():
+        start = time.monotonic()
+        try:
+            result["msg"] = queue.get(timeout=timeout)
+        except Exception as e:  # pragma: no cover - reported by the asserts
+            result["error"] = e
+        result["elapsed"] = time.monotonic() - start
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, result
+
+
+def test_get_returns_queued_message_without_waiting():
+    queue = ControlMessageQueue()
+    msg = make_msg()
+    queue.put(msg)
+    assert queue.get(timeout=0) is msg
+    assert queue.get(timeout=0) is None
+
+
+def test_get_times_out_on_empty_queue():
+    queue = ControlMessageQueue()
+    start = time.monotonic()
+    assert queue.get(timeout=0.05) is None
+    assert time.monotonic() - start >= 0.04
+
+
+def test_get_without_timeout_waits_for_put():
+    # Regression: get(timeout=None) called popleft() on the empty deque
+    queue = ControlMessageQueue()
+    thread, result = get_in_thread(queue, None)
+    time.sleep(0.05)
+    msg = make_msg()
+    queue.put(msg)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert "error" not in result
+    assert result["msg"] is msg
+
+
+def test_get_keeps_waiting_after_wakeup_on_empty_queue():
+    # Regression: a notify that found the queue empty returned None early
+    queue = ControlMessageQueue()
+    thread, result = get_in_thread(queue, 2.0)
+    time.sleep(0.05)
+    with queue._cond:
+        queue._cond.notify_all()
+    time.sleep(0.05)
+    msg = make_msg()
+    queue.put(msg)
+    thread.join(timeout=5)
+
+    assert "error" not in result
+    assert result["msg"] is msg
+    assert result["elapsed"] < 1.0
@@ -0,0 +1,92 @@
+"""
+DelayBuffer: single-slot hand-off between the decoder and the renderer.
+"""
+
+import random
+import threading
+import time
+
+from scrcpy_py_ddlx.core.decoder.delay_buffer import DelayBuffer
+
+
+def test_push_reports_skipped_unconsumed_frame():
+    buf = DelayBuffer()
+    assert buf.push("a") == (True, False)
+    assert buf.push("b") == (True, True)
+
+    result = buf.consume()
+    assert result.frame == "b"
+    assert buf.consume() is None
+    assert buf.push("c") == (True, False)
+
+
+def test_get_nowait_keeps_last_frame_after_consume():
+    buf = DelayBuffer()
+    assert buf.get_nowait() is None
+    buf.push("a", packet_id=7)
+    consumed = buf.consume()
+    assert consumed.packet_id == 7
+    assert buf.get_nowait() is consumed
+    assert not buf.has_new_frame()
+
+
+def test_wait_for_frame_times_out_when_empty():
+    buf = DelayBuffer()
+    start = time.monotonic()
+    assert buf.wait_for_frame(timeout=0.05) is None
+    assert time.monotonic() - start >= 0.04
+    assert buf._waiters == 0
+
+
+def test_wait_for_frame_no_lost_wakeup():
+    # The producer pushes at random points around the consumer registering
+    # as a waiter; a missed notify would show up as a full-timeout wait.
+    buf = DelayBuffer()
+    rng = random.Random(0)
+    for i in range(200):
+        delay = rng.choice((0.0, 0.0, 0.0001, 0.001))
+
+        def produce():
+            if delay:
+                time.sleep(delay)
+            buf.push(i)
+
+        producer = threading.Thread(target=produce)
+        start = time.monotonic()
+        producer.start()
+        result = buf.wait_for_frame(timeout=2.0)
+        elapsed = time.monotonic() - start
+        producer.join()
+
+        assert result is not None and result.frame == i
+        assert elapsed < 1.0, f"wakeup lost on iteration {i}"
+    assert buf._waiters == 0
+
+
+def test_stress_consumer_sees_increasing_frames_and_the_last_one():
+    buf = DelayBuffer()
+    count = 5000
+    seen = []
+
+    def consume():
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            result = buf.wait_for_frame(timeout=0.01)
+            if result is not None:
+                seen.append(result.frame)
+                if result.frame == count - 1:
+                    return
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    skipped = 0
+    for i in range(count):
+        skipped += buf.push(i)[1]
+    consumer.join()
+
+    assert not consumer.is_alive()
+    assert seen[-1] == count - 1
+    assert all(a < b for a, b in zip(seen, seen[1:]))
+    # Every frame is consumed or evicted; previous_skipped may also count a
+    # frame the consumer took between the check and the append
+    assert len(seen) + skipped >= count
@@ -0,0 +1,107 @@
+"""
+RtMixerPlayer stream (re)configuration, with a stubbed rtmixer module.
+"""
+
+import types
+
+import numpy as np
+import pytest
+
+from scrcpy_py_ddlx.core.audio import rtmixer_player, sounddevice_player
+from scrcpy_py_ddlx.core.audio.rtmixer_player import RtMixerPlayer
+
+
+class FakeRingBuffer:
+    def __init__(self, elementsize, size):
+        self.elementsize = elementsize
+        self.size = size
+        self.read_available = 0
+
+    def write(self, data):
+        n = min(len(data), self.size - self.read_available)
+        self.read_available += n
+        return n
+
+    def flush(self):
+        self.read_available = 0
+
+
+class FakeMixer:
+    instances = []
+
+    def __init__(self, samplerate, channels, dtype, blocksize, latency):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.active = False
+        self.closed = False
+        FakeMixer.instances.append(self)
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.closed = True
+
+    def play_ringbuffer(self, ringbuffer):
+        return types.SimpleNamespace(stats=types.SimpleNamespace(output_underflows=0))
+
+    def cancel(self, action):
+        pass
+
+
+@pytest.fixture
+def player(monkeypatch):
+    FakeMixer.instances = []
+    fake = types.SimpleNamespace(Mixer=FakeMixer, RingBuffer=FakeRingBuffer)
+    monkeypatch.setattr(rtmixer_player, "rtmixer", fake)
+    monkeypatch.setattr(rtmixer_player, "RTMIXER_AVAILABLE", True)
+    monkeypatch.setattr(sounddevice_player, "SOUNDDEVICE_AVAILABLE", True)
+    p = RtMixerPlayer()
+    yield p
+    p.close()
+
+
+def test_open_same_format_keeps_stream(player):
+    assert player.open({"sample_rate": 48000, "channels": 2})
+    assert player.open({"sample_rate": 48000, "channels": 2})
+    assert len(FakeMixer.instances) == 1
+    assert not FakeMixer.instances[0].closed
+
+
+def test_open_channel_change_recreates_stream(player):
+    assert player.open({"sample_rate": 48000, "channels": 2})
+    old_ring = player._ringbuffer
+    assert player.open({"sample_rate": 48000, "channels": 6})
+
+    assert len(FakeMixer.instances) == 2
+    assert FakeMixer.instances[0].closed
+    assert FakeMixer.instances[1].channels == 6
+    assert player._stream is FakeMixer.instances[1]
+    assert player._ringbuffer is not old_ring
+    assert player._ringbuffer.elementsize == 2 * 6
+    assert player._converter.channels == 6
+
+
+def test_open_sample_rate_change_recreates_stream(player):
+    assert player.open({"sample_rate": 48000, "channels": 2})
+    assert player.open(types.SimpleNamespace(sample_rate=44100, channels=2))
+
+    assert len(FakeMixer.instances) == 2
+    assert FakeMixer.instances[1].samplerate == 44100
+    assert player._prebuffer_frames == int(44100 * player._prebuffer_ms / 1000)
+
+
+def test_reconfigure_while_playing_restarts_after_prebuffer(player):
+    assert player.open({"sample_rate": 48000, "channels": 2})
+    player.start()
+    player._ringbuffer.read_available = player._prebuffer_frames
+    assert player.push(np.zeros((16, 2), dtype=np.int16))
+    assert player._stream_started and FakeMixer.instances[0].active
+
+    assert player.open({"sample_rate": 48000, "channels": 1})
+    assert not player._stream_started
+    assert not FakeMixer.instances[0].active
+    assert player._action is None